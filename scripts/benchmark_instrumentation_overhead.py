@@ -0,0 +1,42 @@
+"""A script to measure the overhead of InstrumentedFunction on batch evaluations."""
+
+import timeit
+
+import numpy as np
+
+import fbench
+
+
+def main():
+    number = 20
+    repeat = 10
+    cases = [
+        (fbench.sphere, (100, 2)),
+        (fbench.sphere, (10_000, 10)),
+        (fbench.rastrigin, (10_000, 10)),
+    ]
+
+    print(f"{'function':<12}{'shape':>14}{'raw':>14}{'instrumented':>16}{'ratio':>8}")
+    for func, shape in cases:
+        x = np.ones(shape)
+        func_batch = fbench.get_batch_func(func)
+        instrumented = fbench.InstrumentedFunction(func)
+
+        # interleave the measurements, such that load changes affect both alike
+        timings = [
+            (
+                timeit.timeit(lambda: func_batch(x), number=number) / number,
+                timeit.timeit(lambda: instrumented.batch(x), number=number) / number,
+            )
+            for _ in range(repeat)
+        ]
+        raw_us, instrumented_us = (min(t) * 1e6 for t in zip(*timings))
+        print(
+            f"{func.__name__:<12}{str(shape):>14}"
+            f"{raw_us:>11.1f} us{instrumented_us:>13.1f} us"
+            f"{instrumented_us / raw_us:>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+"""A script to measure the per-call latency of fBench functions on small inputs."""
+
+import timeit
+
+import fbench
+
+
+def main():
+    number = 100_000
+    cases = [
+        (fbench.ackley, [1.0, 2.0]),
+        (fbench.beale, [3.0, 0.5]),
+        (fbench.peaks, [0.5, -1.5]),
+        (fbench.rastrigin, [1.0, 2.0]),
+        (fbench.rosenbrock, [1.0, 2.0]),
+        (fbench.schwefel, [1.0, 2.0]),
+        (fbench.sinc, [1.0]),
+        (fbench.sphere, [1.0, 2.0]),
+    ]
+
+    print(f"{'function':<12}{'validate=True':>16}{'validate=False':>16}")
+    for func, x in cases:
+        latencies = [
+            timeit.timeit(lambda: func(x, validate=validate), number=number)
+            / number
+            * 1e6
+            for validate in (True, False)
+        ]
+        print(f"{func.__name__:<12}" + "".join(f"{t:>13.2f} us" for t in latencies))
+
+
+if __name__ == "__main__":
+    main()
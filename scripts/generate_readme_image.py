@@ -6,11 +6,15 @@ import fbench
 
 
 def main():
-    image_path = pathlib.Path().cwd() / "images" / "readme-ackley.png"
-    plotter = fbench.viz.FunctionPlotter(func=fbench.ackley, bounds=[(-5, 5)] * 2)
-    fig, _, _ = plotter.plot()
-    fig.savefig(image_path)
-    print(f"saved {image_path}")
+    image_dir = pathlib.Path().cwd() / "images"
+    plotters = {
+        "readme-ackley": fbench.viz.FunctionPlotter(
+            func=fbench.ackley, bounds=[(-5, 5)] * 2
+        ),
+    }
+    results = fbench.viz.render_plotters(plotters, image_dir, n_workers=1)
+    for result in results.values():
+        print(f"saved {result.path}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,38 @@
+"""A script to render the plots of all predefined FunctionPlotter instances."""
+
+import argparse
+import pathlib
+import time
+
+import fbench
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("directory", type=pathlib.Path, help="output directory")
+    parser.add_argument("--n-workers", type=int, default=None, help="default: #CPUs")
+    parser.add_argument("--file-format", default="png", help="default: png")
+    args = parser.parse_args()
+
+    plotters = {**fbench.viz.get_1d_plotter(), **fbench.viz.get_2d_plotter()}
+
+    start = time.perf_counter()
+    results = fbench.viz.render_plotters(
+        plotters,
+        args.directory,
+        n_workers=args.n_workers,
+        file_format=args.file_format,
+    )
+    total_time = time.perf_counter() - start
+
+    print(f"{'plot':<22}{'evaluation':>12}{'plotting':>12}  path")
+    for name, result in results.items():
+        print(
+            f"{name:<22}{result.evaluation_time:>10.3f} s"
+            f"{result.plotting_time:>10.3f} s  {result.path}"
+        )
+    print(f"rendered {len(results)} plots in {total_time:.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,32 @@
-from importlib import metadata
-
-__version__ = metadata.version("fbench")
-
-from . import structure, viz
+from . import structure
+from .evaluation import *
 from .function import *
 from .validation import *
 
 del (
-    metadata,
+    evaluation,
     function,
     validation,
 )
+
+# modules with heavy dependencies are imported on first access
+_LAZY_MODULES = ("viz",)
+
+
+def __getattr__(name):
+    if name in _LAZY_MODULES:
+        import importlib
+
+        return importlib.import_module(f".{name}", __name__)
+
+    if name == "__version__":
+        from importlib import metadata
+
+        globals()[name] = metadata.version("fbench")
+        return globals()[name]
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted({*globals(), *_LAZY_MODULES, "__version__"})
@@ -0,0 +1,696 @@
+import bisect
+import collections
+import concurrent.futures
+import functools
+import itertools
+import os
+import pathlib
+import threading
+import time
+
+import numpy as np
+
+import fbench
+
+__all__ = (
+    "BudgetExhaustedError",
+    "CachedFunction",
+    "InstrumentedFunction",
+    "evaluate_batch",
+    "evaluate_chunks",
+    "evaluate_npy",
+)
+
+# number of matrix elements per chunk: 512 KiB of float64 values
+_CHUNK_ELEMENTS = 2**16
+
+# number of matrix elements per chunk read from disk: 32 MiB of float64 values
+_STREAM_CHUNK_ELEMENTS = 2**22
+
+
+class BudgetExhaustedError(RuntimeError):
+    """Raised if an evaluation would exceed the evaluation budget."""
+
+
+class CachedFunction:
+    """Wrap a function to memoize its values in a bounded LRU cache.
+
+    Vectors are looked up by their exact bytes, shape, and dtype, i.e.,
+    ``[1, 2]`` and ``[1.0, 2.0]`` are distinct entries. The wrapper is
+    batch-capable: a batch call looks up each row of the :math:`(m, n)`-matrix
+    and only evaluates the distinct rows that are not cached, using the batch
+    counterpart of the function if available, otherwise one call per row.
+
+    Parameters
+    ----------
+    func : callable
+        The function to cache.
+    maxsize : int, default=1024
+        Specify the maximum number of cached vectors. If the cache is full,
+        the least recently used vector is evicted.
+
+    Raises
+    ------
+    ValueError
+        If ``maxsize`` is not positive.
+
+    Notes
+    -----
+    Batch calls store the values of the batch counterpart, which may differ
+    from the values of single calls in the last digits.
+
+    Examples
+    --------
+    >>> import fbench
+    >>> import numpy as np
+    >>> import toolz
+    >>> func = fbench.CachedFunction(toolz.compose_left(fbench.beale, np.log1p))
+    >>> round(func([0, 0]), 4)
+    2.7215
+    >>> func.batch([[0, 0], [3, 0.5]]).round(4)
+    array([2.7215, 0.    ])
+    >>> func.cache_info()
+    CacheInfo(hits=0, misses=3, maxsize=1024, currsize=3)
+    """
+
+    def __init__(self, func, /, *, maxsize=1024):
+        if maxsize < 1:
+            raise ValueError(f"maxsize={maxsize} must be positive")
+
+        self._func = func
+        self._func_batch = fbench.get_batch_func(func)
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+        self._cache = collections.OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        functools.update_wrapper(self, func, updated=())
+
+    def __repr__(self):
+        return f"{type(self).__name__}(func={self._func!r}, maxsize={self._maxsize})"
+
+    def __call__(self, x, /):
+        x = np.asarray(x)
+        key = (x.dtype.str, x.shape, x.tobytes())
+
+        with self._lock:
+            value = self._cache.get(key, _MISSING)
+            if value is not _MISSING:
+                self._cache.move_to_end(key)
+                self._hits += 1
+                return value
+            self._misses += 1
+
+        value = self._func(x)
+        self._store(key, value)
+        return value
+
+    def __getstate__(self):
+        return dict(func=self._func, maxsize=self._maxsize)
+
+    def __setstate__(self, state):
+        self.__init__(state["func"], maxsize=state["maxsize"])
+
+    @property
+    def func(self):
+        """The wrapped function."""
+        return self._func
+
+    def batch(self, x, /):
+        """Evaluate the function for a batch of vectors using the cache.
+
+        Parameters
+        ----------
+        x : array_like
+            The :math:`(m, n)`-matrix whose rows are :math:`n`-vectors.
+
+        Returns
+        -------
+        np.ndarray
+            The :math:`m`-vector of function values, whose dtype is the dtype of
+            ``x`` if it is a floating-point type and ``float64`` otherwise.
+        """
+        x = fbench.check_matrix(x)
+        dtype, shape = x.dtype.str, x.shape[1:]
+        out = np.empty(len(x), dtype=_get_result_dtype(x.dtype))
+        missing = dict()
+
+        with self._lock:
+            for i, row in enumerate(x):
+                key = (dtype, shape, row.tobytes())
+                value = self._cache.get(key, _MISSING)
+                if value is _MISSING:
+                    missing.setdefault(key, []).append(i)
+                else:
+                    self._cache.move_to_end(key)
+                    out[i] = value
+            self._misses += len(missing)
+            self._hits += len(x) - len(missing)
+
+        if missing:
+            rows = x[[indices[0] for indices in missing.values()]]
+            if self._func_batch is None:
+                values = [self._func(row) for row in rows]
+            else:
+                values = self._func_batch(rows)
+
+            for (key, indices), value in zip(missing.items(), values):
+                out[indices] = value
+                self._store(key, value)
+
+        return out
+
+    def cache_info(self):
+        """Report cache statistics.
+
+        Returns
+        -------
+        CacheInfo
+            The number of hits, misses, the maximum and current cache size.
+        """
+        with self._lock:
+            return fbench.structure.CacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                maxsize=self._maxsize,
+                currsize=len(self._cache),
+            )
+
+    def cache_clear(self):
+        """Clear the cache and its statistics."""
+        with self._lock:
+            self._cache.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def _store(self, key, value):
+        with self._lock:
+            self._cache[key] = value
+            self._cache.move_to_end(key)
+            if len(self._cache) > self._maxsize:
+                self._cache.popitem(last=False)
+
+
+class InstrumentedFunction:
+    """Wrap a function to record evaluation statistics and enforce a budget.
+
+    The wrapper records the number of calls, the number of evaluated points,
+    and a histogram of the wall time per call. Each thread updates its own
+    counters without locking, which are summed when reading :attr:`stats`.
+    If the wrapped function is batch-capable, so is the wrapper and a batch
+    call counts all rows of the :math:`(m, n)`-matrix as evaluated points.
+
+    Parameters
+    ----------
+    func : callable
+        The function to instrument.
+    budget : int, default=None
+        Specify the maximum number of points to evaluate. A call that would
+        exceed the budget raises :class:`BudgetExhaustedError` without
+        evaluating the function. A call that raises an exception does not count
+        towards the budget. If None, the number of points is unlimited.
+    bin_edges : sequence of float, default=None
+        Specify the edges of the wall-time histogram bins in seconds.
+        If None, half-decade bins from :math:`10^{-7}` to :math:`10^{2}` are used.
+
+    Notes
+    -----
+    A pickled wrapper, e.g., sent to a worker process, starts with empty counters
+    and its budget is enforced per process. Return the :attr:`stats` of the
+    worker copies and :meth:`merge` them into the wrapper of the main process.
+
+    Examples
+    --------
+    >>> import fbench
+    >>> func = fbench.InstrumentedFunction(fbench.sphere, budget=10)
+    >>> func([1, 2])
+    5.0
+    >>> func.batch([[1, 2], [3, 4]])
+    array([ 5., 25.])
+    >>> func.stats.n_calls, func.stats.n_points, func.remaining
+    (2, 3, 7)
+    """
+
+    def __init__(self, func, /, *, budget=None, bin_edges=None):
+        if bin_edges is None:
+            bin_edges = np.logspace(-7, 2, 19)
+
+        self._func = func
+        self._func_batch = fbench.get_batch_func(func)
+        self._budget = budget
+        self._bin_edges = tuple(float(edge) for edge in bin_edges)
+        self._n_bins = len(self._bin_edges) - 1
+
+        # inner edges map out-of-range times to the first and last bin
+        self._inner_edges_ns = [edge * 1e9 for edge in self._bin_edges[1:-1]]
+
+        if self._n_bins < 1:
+            raise ValueError("bin_edges must have at least two values")
+
+        functools.update_wrapper(self, func, updated=())
+        self.batch = None if self._func_batch is None else self._call_batch
+        self.reset()
+
+    def __repr__(self):
+        return f"{type(self).__name__}(func={self._func!r}, budget={self._budget})"
+
+    def __call__(self, x, /, **kwargs):
+        return self._evaluate(self._func, x, 1, kwargs)
+
+    def __getstate__(self):
+        return dict(func=self._func, budget=self._budget, bin_edges=self._bin_edges)
+
+    def __setstate__(self, state):
+        self.__init__(
+            state["func"],
+            budget=state["budget"],
+            bin_edges=state["bin_edges"],
+        )
+
+    @property
+    def func(self):
+        """The wrapped function."""
+        return self._func
+
+    @property
+    def budget(self):
+        """The maximum number of points to evaluate."""
+        return self._budget
+
+    @property
+    def remaining(self):
+        """The number of points left in the budget or None if unlimited."""
+        if self._budget is None:
+            return None
+        return self._budget - self._n_points_reserved
+
+    @property
+    def stats(self):
+        """The evaluation statistics of all threads and merged statistics."""
+        n_calls, n_points, time_ns, histogram = self._merged
+        histogram = list(histogram)
+
+        with self._lock:
+            counters = list(self._counters)
+
+        for counter in counters:
+            n_calls += counter.n_calls
+            n_points += counter.n_points
+            time_ns += counter.time_ns
+            histogram = [a + b for a, b in zip(histogram, counter.histogram)]
+
+        return fbench.structure.EvaluationStats(
+            n_calls=n_calls,
+            n_points=n_points,
+            total_time=time_ns / 1e9,
+            bin_edges=self._bin_edges,
+            histogram=tuple(histogram),
+        )
+
+    def merge(self, stats, /):
+        """Add evaluation statistics, e.g., from copies in worker processes.
+
+        Parameters
+        ----------
+        stats : EvaluationStats
+            The statistics to add. The merged points count towards the budget.
+
+        Raises
+        ------
+        ValueError
+            If the bin edges of ``stats`` differ from the bin edges of the wrapper.
+        """
+        if tuple(stats.bin_edges) != self._bin_edges:
+            raise ValueError("cannot merge statistics with different bin edges")
+
+        with self._lock:
+            n_calls, n_points, time_ns, histogram = self._merged
+            self._merged = (
+                n_calls + stats.n_calls,
+                n_points + stats.n_points,
+                time_ns + round(stats.total_time * 1e9),
+                [a + b for a, b in zip(histogram, stats.histogram)],
+            )
+            self._n_points_reserved += stats.n_points
+
+    def reset(self):
+        """Reset all counters and the used budget."""
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._counters = []
+        self._merged = (0, 0, 0, [0] * self._n_bins)
+        self._n_points_reserved = 0
+
+    def _call_batch(self, x, /, **kwargs):
+        return self._evaluate(self._func_batch, x, len(x), kwargs)
+
+    def _evaluate(self, func, x, n_points, kwargs):
+        if self._budget is not None:
+            self._reserve(n_points)
+
+        try:
+            counter = self._local.counter
+        except AttributeError:
+            counter = self._local.counter = _Counter(self._n_bins)
+            with self._lock:
+                self._counters.append(counter)
+
+        start = time.perf_counter_ns()
+        try:
+            output = func(x, **kwargs)
+        except BaseException:
+            if self._budget is not None:
+                # refund the budget of the failed call
+                with self._lock:
+                    self._n_points_reserved -= n_points
+            raise
+        elapsed = time.perf_counter_ns() - start
+
+        counter.histogram[bisect.bisect_right(self._inner_edges_ns, elapsed)] += 1
+        counter.n_calls += 1
+        counter.n_points += n_points
+        counter.time_ns += elapsed
+        return output
+
+    def _reserve(self, n_points):
+        with self._lock:
+            if self._n_points_reserved + n_points > self._budget:
+                raise BudgetExhaustedError(
+                    f"evaluation of {n_points} points exceeds budget={self._budget}"
+                    f" - {self._budget - self._n_points_reserved} points remaining"
+                )
+            self._n_points_reserved += n_points
+
+
+_MISSING = object()
+
+
+class _Counter:
+    """Evaluation counters of a single thread."""
+
+    __slots__ = ("n_calls", "n_points", "time_ns", "histogram")
+
+    def __init__(self, n_bins):
+        self.n_calls = 0
+        self.n_points = 0
+        self.time_ns = 0
+        self.histogram = [0] * n_bins
+
+
+def evaluate_batch(func, x, /, *, n_threads=None, chunk_size=None, out=None):
+    """Evaluate a batch-capable function in chunks on multiple threads.
+
+    The rows of the :math:`(m, n)`-matrix are split into contiguous blocks, one
+    per thread. Each thread evaluates its block chunk by chunk and writes the
+    function values into a shared output vector. As NumPy releases the GIL in
+    its array operations, the threads run in parallel, and the temporary
+    arrays are bounded by the chunk size instead of the batch size.
+
+    Parameters
+    ----------
+    func : callable
+        A batch-capable function, see :func:`fbench.get_batch_func`.
+    x : array_like
+        The :math:`(m, n)`-matrix whose rows are :math:`n`-vectors.
+    n_threads : int, default=None
+        Specify the number of threads. If None, the number of CPUs is used.
+    chunk_size : int, default=None
+        Specify the number of rows per chunk.
+        If None, a chunk holds about :math:`2^{16}` matrix elements.
+    out : np.ndarray, default=None
+        Optionally supply an :math:`m`-vector to store the function values.
+
+    Returns
+    -------
+    np.ndarray
+        The :math:`m`-vector of function values, which is ``out`` if supplied.
+
+    Raises
+    ------
+    TypeError
+        - If ``func`` is not batch-capable.
+        - If ``out`` does not have shape ``(m,)``.
+        - If the function values cannot be cast to the dtype of ``out``.
+
+    Examples
+    --------
+    >>> import fbench
+    >>> import numpy as np
+    >>> x = np.ones((1_000, 2))
+    >>> fbench.evaluate_batch(fbench.sphere, x, n_threads=2, chunk_size=100)[:3]
+    array([2., 2., 2.])
+    """
+    func_batch = fbench.get_batch_func(func)
+    if func_batch is None:
+        raise TypeError(f"{func!r} is not batch-capable")
+
+    x = fbench.check_matrix(x)
+    m, n = x.shape
+    dtype = _get_result_dtype(x.dtype)
+
+    if out is None:
+        out = np.empty(m, dtype=dtype)
+
+    if out.shape != (m,):
+        raise TypeError(f"out must have shape=({m},) - it has shape={out.shape}")
+
+    if not np.can_cast(dtype, out.dtype, "same_kind"):
+        raise TypeError(f"cannot store {dtype} values in out with dtype={out.dtype}")
+
+    n_threads = n_threads or os.cpu_count()
+    chunk_size = chunk_size or max(1, _CHUNK_ELEMENTS // n)
+    with_workspace = fbench.get_benchmark(func) is not None
+
+    def evaluate_block(start, stop):
+        workspace = fbench.structure.Workspace() if with_workspace else None
+        for i in range(start, stop, chunk_size):
+            j = min(i + chunk_size, stop)
+            if with_workspace:
+                func_batch(x[i:j], out=out[i:j], workspace=workspace)
+            else:
+                out[i:j] = func_batch(x[i:j])
+
+    n_blocks = max(1, min(n_threads, -(-m // chunk_size)))
+    bounds = np.linspace(0, m, n_blocks + 1).astype(int)
+    if n_blocks == 1:
+        evaluate_block(0, m)
+    else:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=n_blocks) as executor:
+            futures = [
+                executor.submit(evaluate_block, start, stop)
+                for start, stop in zip(bounds[:-1], bounds[1:])
+            ]
+            for future in futures:
+                future.result()
+
+    return out
+
+
+def evaluate_chunks(func, chunks, /, *, out=None, n_rows=None, n_threads=None):
+    """Evaluate a batch-capable function over a stream of matrix chunks.
+
+    Without ``out``, the function values of each chunk are yielded as they are
+    evaluated. With ``out``, the values of consecutive chunks are written to
+    consecutive rows of ``out``. If ``out`` is file-backed, the number of completed
+    rows is recorded in the file ``<out>.progress`` after each chunk as for
+    :func:`evaluate_npy`, and a restarted evaluation skips the completed rows.
+
+    Parameters
+    ----------
+    func : callable
+        A batch-capable function, see :func:`fbench.get_batch_func`.
+    chunks : iterable of array_like
+        The :math:`(m_i, n)`-matrices whose rows are :math:`n`-vectors.
+    out : str, os.PathLike, or np.ndarray, default=None
+        Optionally supply the path of a ``.npy`` file or an :math:`m`-vector,
+        e.g., a ``np.memmap``, to write the function values of all :math:`m`
+        rows of the chunks to.
+    n_rows : int, default=None
+        Specify the total number of rows :math:`m` of the chunks, which is
+        required to create a new ``.npy`` file for ``out``.
+    n_threads : int, default=None
+        Specify the number of threads per chunk, see :func:`evaluate_batch`.
+
+    Yields
+    ------
+    np.ndarray
+        The :math:`m_i`-vector of function values for each chunk,
+        which is a view of ``out`` if supplied.
+
+    Raises
+    ------
+    ValueError
+        - If ``out`` is the path of a new file and ``n_rows`` is None.
+        - If a resumed output file does not have shape ``(n_rows,)``.
+        - If the chunks have more rows than ``out``.
+
+    Notes
+    -----
+    The chunks are evaluated while the generator is consumed. The chunks of
+    completed rows are not evaluated again, but must still be supplied.
+
+    Examples
+    --------
+    >>> import fbench
+    >>> import numpy as np
+    >>> chunks = (np.full((2, 3), i) for i in range(3))
+    >>> for values in fbench.evaluate_chunks(fbench.sphere, chunks):
+    ...     print(values)
+    [0. 0.]
+    [3. 3.]
+    [12. 12.]
+    """
+    if out is None:
+        for chunk in chunks:
+            yield evaluate_batch(func, chunk, n_threads=n_threads)
+        return
+
+    chunks = iter(chunks)
+    first = next(chunks, None)
+    if first is None:
+        return
+
+    if isinstance(out, (str, os.PathLike)):
+        dtype = _get_result_dtype(np.asarray(first).dtype)
+        out, progress_path = _open_output(out, n_rows, dtype)
+    elif isinstance(out, np.memmap):
+        progress_path = _get_progress_path(out.filename)
+    else:
+        progress_path = None
+
+    yield from _evaluate_into(
+        func, itertools.chain([first], chunks), out, progress_path, n_threads
+    )
+
+
+def evaluate_npy(func, x, out_path, /, *, chunk_size=None, n_threads=None):
+    """Evaluate a batch-capable function over a ``.npy`` file of vectors.
+
+    The input matrix is memory-mapped and evaluated chunk by chunk. The values
+    are written to a memory-mapped ``.npy`` file, such that the peak memory
+    only depends on the chunk size and not on the number of vectors.
+    The number of completed rows is recorded in the file ``<out_path>.progress``
+    after each chunk, which is removed once all rows are evaluated.
+    If the progress file exists, the evaluation resumes after the completed rows.
+
+    Parameters
+    ----------
+    func : callable
+        A batch-capable function, see :func:`fbench.get_batch_func`.
+    x : str, os.PathLike, or array_like
+        The path of a ``.npy`` file or an array, e.g., a ``np.memmap``,
+        of an :math:`(m, n)`-matrix whose rows are :math:`n`-vectors.
+    out_path : str or os.PathLike
+        The path of the ``.npy`` file to write the :math:`m` function values to.
+    chunk_size : int, default=None
+        Specify the number of rows per chunk.
+        If None, a chunk holds about :math:`2^{22}` matrix elements.
+    n_threads : int, default=None
+        Specify the number of threads per chunk, see :func:`evaluate_batch`.
+
+    Returns
+    -------
+    np.memmap
+        The memory-mapped :math:`m`-vector of function values.
+
+    Raises
+    ------
+    ValueError
+        If a resumed output file does not have shape ``(m,)``.
+
+    See Also
+    --------
+    evaluate_chunks : Evaluate a stream of matrix chunks.
+
+    Examples
+    --------
+    >>> import fbench
+    >>> import numpy as np
+    >>> import tempfile
+    >>> with tempfile.TemporaryDirectory() as tmp_dir:
+    ...     np.save(f"{tmp_dir}/x.npy", np.ones((1_000, 3)))
+    ...     out = fbench.evaluate_npy(fbench.sphere, f"{tmp_dir}/x.npy", f"{tmp_dir}/y.npy")
+    ...     print(out[:3])
+    [3. 3. 3.]
+    """  # noqa: E501
+    if isinstance(x, (str, os.PathLike)):
+        x = np.load(x, mmap_mode="r")
+
+    x = fbench.check_matrix(x)
+    m, n = x.shape
+    chunk_size = chunk_size or max(1, _STREAM_CHUNK_ELEMENTS // n)
+    out, progress_path = _open_output(out_path, m, _get_result_dtype(x.dtype))
+
+    # slicing a memory-mapped input does not read the skipped chunks
+    chunks = (x[slice(i, i + chunk_size)] for i in range(0, m, chunk_size))
+    collections.deque(
+        _evaluate_into(func, chunks, out, progress_path, n_threads), maxlen=0
+    )
+    return out
+
+
+def _get_result_dtype(dtype, /):
+    """Get the dtype of the function values of a matrix with the given dtype."""
+    return dtype if np.issubdtype(dtype, np.floating) else np.dtype(float)
+
+
+def _get_progress_path(path, /):
+    path = pathlib.Path(path)
+    return path.with_name(f"{path.name}.progress")
+
+
+def _open_output(path, n_rows, dtype, /):
+    """Open a ``.npy`` output file to resume, or create it if there is no progress."""
+    path = pathlib.Path(path)
+    progress_path = _get_progress_path(path)
+
+    if progress_path.exists() and path.exists():
+        out = np.lib.format.open_memmap(path, mode="r+")
+        if n_rows is not None and out.shape != (n_rows,):
+            raise ValueError(f"cannot resume {path} with shape={out.shape}")
+        return out, progress_path
+
+    if n_rows is None:
+        raise ValueError(f"n_rows must be specified to create {path}")
+
+    progress_path.unlink(missing_ok=True)
+    out = np.lib.format.open_memmap(path, mode="w+", dtype=dtype, shape=(n_rows,))
+    return out, progress_path
+
+
+def _evaluate_into(func, chunks, out, progress_path, n_threads, /):
+    """Evaluate chunks into consecutive rows of ``out`` and record the progress.
+
+    Rows before the recorded progress are skipped. Yields the values of each chunk.
+    """
+    start = 0
+    if progress_path is not None and progress_path.exists():
+        start = int(progress_path.read_text())
+
+    i = 0
+    for chunk in chunks:
+        j = i + len(chunk)
+        if j > len(out):
+            raise ValueError(f"chunks have more rows than out with shape={out.shape}")
+
+        if j > start:
+            k = max(i, start)
+            evaluate_batch(
+                func, chunk[slice(k - i, None)], n_threads=n_threads, out=out[k:j]
+            )
+            if progress_path is not None:
+                out.flush()
+                _write_progress(progress_path, j)
+
+        yield out[i:j]
+        i = j
+
+    if progress_path is not None and i == len(out):
+        progress_path.unlink(missing_ok=True)
+
+
+def _write_progress(path, n_rows, /):
+    """Atomically record the number of completed rows."""
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    tmp_path.write_text(str(n_rows))
+    os.replace(tmp_path, path)
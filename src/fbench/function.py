@@ -1,22 +1,65 @@
+import functools
+import math
+
 import numpy as np
-import toolz
 
 import fbench
 
 __all__ = (
     "ackley",
+    "ackley_batch",
+    "ackley_grad",
+    "ackley_hess",
+    "ackley_hessp",
+    "ackley_value_and_grad",
+    "batchable",
     "beale",
+    "beale_batch",
+    "beale_grad",
+    "beale_hess",
+    "beale_value_and_grad",
+    "get_batch_func",
+    "get_benchmark",
+    "get_benchmarks",
     "get_optima",
     "peaks",
+    "peaks_batch",
+    "peaks_grad",
+    "peaks_hess",
+    "peaks_value_and_grad",
     "rastrigin",
+    "rastrigin_batch",
+    "rastrigin_grad",
+    "rastrigin_hess",
+    "rastrigin_hessp",
+    "rastrigin_value_and_grad",
     "rosenbrock",
+    "rosenbrock_batch",
+    "rosenbrock_grad",
+    "rosenbrock_hess",
+    "rosenbrock_hessp",
+    "rosenbrock_value_and_grad",
     "schwefel",
+    "schwefel_batch",
+    "schwefel_grad",
+    "schwefel_hess",
+    "schwefel_hessp",
+    "schwefel_value_and_grad",
     "sinc",
+    "sinc_batch",
+    "sinc_grad",
+    "sinc_hess",
+    "sinc_value_and_grad",
     "sphere",
+    "sphere_batch",
+    "sphere_grad",
+    "sphere_hess",
+    "sphere_hessp",
+    "sphere_value_and_grad",
 )
 
 
-def ackley(x, /):
+def ackley(x, /, *, validate=True):
     """Ackley function.
 
     A function :math:`f\\colon \\mathbb{R}^{n} \\rightarrow \\mathbb{R}`
@@ -36,6 +79,9 @@ def ackley(x, /):
     ----------
     x : array_like
         The :math:`n`-vector.
+    validate : bool, default=True
+        Specify if the input should be validated with :func:`check_vector`.
+        Set to False for trusted input to reduce the call overhead.
 
     Returns
     -------
@@ -59,7 +105,14 @@ def ackley(x, /):
     >>> round(fbench.ackley([1, 2, 3]), 4)
     7.0165
     """
-    x = fbench.check_vector(x)
+    x = _as_small_vector(x, validate=validate)
+    if isinstance(x, list):
+        # plain float arithmetic as NumPy has a large overhead for scalars
+        n = len(x)
+        s1 = sum([xi * xi for xi in x])
+        s2 = sum([math.cos(2 * math.pi * xi) for xi in x])
+        return -20 * math.exp(-0.2 * math.sqrt(s1 / n)) - math.exp(s2 / n) + 20 + math.e
+
     return float(
         -20 * np.exp(-0.2 * np.sqrt((x**2).mean()))
         - np.exp((np.cos(2 * np.pi * x)).sum() / len(x))
@@ -68,225 +121,322 @@ def ackley(x, /):
     )
 
 
-def beale(x, /):
-    """Beale function.
-
-    A function :math:`f\\colon \\mathbb{R}^{2} \\rightarrow \\mathbb{R}`
-    that takes a :math:`2`-vector as input and returns a scalar value.
-
-    .. math::
+def ackley_batch(x, /, *, out=None, workspace=None):
+    """Ackley function for a batch of vectors.
 
-       f(\\mathbf{x}) =
-       \\left( 1.5 - x_{1} + x_{1} x_{2} \\right)^{2}
-       + \\left( 2.25 - x_{1} + x_{1} x_{2}^{2} \\right)^{2}
-       + \\left( 2.625 - x_{1} + x_{1} x_{2}^{3}\\right)^{2}
+    Vectorized counterpart of :func:`ackley` that evaluates the function for
+    each row of an :math:`(m, n)`-matrix in a single pass.
 
     Parameters
     ----------
     x : array_like
-        The :math:`2`-vector.
+        The :math:`(m, n)`-matrix whose rows are :math:`n`-vectors.
+    out : np.ndarray, default=None
+        Optionally supply an :math:`m`-vector to store the function values.
+    workspace : Workspace, default=None
+        Optionally supply a workspace to reuse its scratch arrays.
+        If None, scratch arrays are allocated per call.
 
     Returns
     -------
-    float
-        Function value at :math:`\\mathbf{x}`.
+    np.ndarray
+        The :math:`m`-vector of function values, which is ``out`` if supplied.
+        It has the floating-point dtype of ``x`` or float64 for other dtypes.
 
-    References
-    ----------
-    .. [1] "Test functions for optimization", Wikipedia,
-           `<https://en.wikipedia.org/wiki/Test_functions_for_optimization>`_
-    .. [2] "Beale function", Virtual Library of Simulation Experiments:
-           Test Functions and Datasets, `<https://www.sfu.ca/~ssurjano/beale.html>`_
+    See Also
+    --------
+    ackley : Ackley function.
 
     Examples
     --------
     >>> import fbench
-    >>> fbench.beale([3, 0.5])
-    0.0
-
-    >>> round(fbench.beale([0, 0]), 4)
-    14.2031
-
-    >>> round(fbench.beale([1, 1]), 4)
-    14.2031
-
-    >>> round(fbench.beale([2, 2]), 4)
-    356.7031
+    >>> fbench.ackley_batch([[0, 0], [1, 2]]).round(4)
+    array([0.    , 5.4221])
     """
-    x1, x2 = fbench.check_vector(x, n_max=2)
-    f1 = (1.5 - x1 + x1 * x2) ** 2
-    f2 = (2.25 - x1 + x1 * x2**2) ** 2
-    f3 = (2.625 - x1 + x1 * x2**3) ** 2
-    return float(f1 + f2 + f3)
+    x = _as_float(fbench.check_matrix(x))
+    m, n = x.shape
+    out = _check_out(out, m, x.dtype)
+    tmp = _empty(workspace, "tmp", x.shape, x.dtype)
+    row = _empty(workspace, "row", (m,), x.dtype)
+
+    # row = -20 exp(-0.2 sqrt(mean(x^2)))
+    np.square(x, out=tmp)
+    np.mean(tmp, axis=1, out=row)
+    np.sqrt(row, out=row)
+    row *= -0.2
+    np.exp(row, out=row)
+    row *= -20
+
+    # out = row - exp(mean(cos(2 pi x))) + 20 + e
+    np.multiply(x, 2 * np.pi, out=tmp)
+    np.cos(tmp, out=tmp)
+    np.mean(tmp, axis=1, out=out)
+    np.exp(out, out=out)
+    np.subtract(row, out, out=out)
+    out += 20 + np.e
+    return out
+
+
+def ackley_grad(x, /):
+    """Gradient of the Ackley function.
 
+    .. math::
 
-@toolz.curry
-def get_optima(n, /, func):
-    """Retrieve optima for defined functions.
+        \\frac{\\partial f}{\\partial x_i} =
+        \\frac{4 x_i}{n r} \\exp(-0.2 r)
+        + \\frac{2 \\pi}{n} \\sin(2 \\pi x_i)
+          \\exp \\left( \\frac{1}{n} \\sum_{j=1}^{n} \\cos(2 \\pi x_j) \\right),
+        \\quad r = \\sqrt{ \\frac{1}{n} \\sum_{j=1}^{n} x_j^2 }
 
     Parameters
     ----------
-    n : int
-        Specify the number of dimensions :math:`n`.
-    func : callable
-        A fBench function to retrieve its optima.
-        None is returned if no optima is defined.
+    x : array_like
+        The :math:`n`-vector or an :math:`(m, n)`-matrix whose rows are
+        :math:`n`-vectors.
 
     Returns
     -------
-    Optional[list[Optimum]]]
-        Optima with specified dimension for fBench function if defined.
+    np.ndarray
+        Gradient at :math:`\\mathbf{x}` with the same shape as ``x``.
 
     Notes
     -----
-    - Function is curried.
-    - Optima are defined for the following functions:
-        - ackley
-        - beale
-        - peaks
-        - rastrigin
-        - rosenbrock
-        - schwefel
-        - sinc
-        - sphere
+    The function is not differentiable at the origin,
+    where the gradient is set to zero.
+
+    See Also
+    --------
+    ackley : Ackley function.
 
     Examples
     --------
     >>> import fbench
-    >>> optima = fbench.get_optima(5, fbench.sphere)
-    >>> optima
-    [Optimum(x=array([0, 0, 0, 0, 0]), fx=0)]
-    >>> optimum = optima[0]
-    >>> optimum.n
-    5
+    >>> fbench.ackley_grad([0, 0])
+    array([0., 0.])
     """
-    optima = {
-        ackley: [fbench.structure.Optimum(fbench.check_vector([0] * n), 0)],
-        beale: [fbench.structure.Optimum(fbench.check_vector([3, 0.5]), 0)],
-        peaks: [
-            fbench.structure.Optimum(
-                fbench.check_vector([0.228279999979237, -1.625531071954464]),
-                -6.551133332622496,
-            )
-        ],
-        rastrigin: [fbench.structure.Optimum(fbench.check_vector([0] * n), 0)],
-        rosenbrock: [fbench.structure.Optimum(fbench.check_vector([1] * n), 0)],
-        schwefel: [fbench.structure.Optimum(fbench.check_vector([420.9687] * n), 0)],
-        sinc: [
-            fbench.structure.Optimum(
-                fbench.check_vector([-4.493409471849579]),
-                -0.217233628211222,
-            ),
-            fbench.structure.Optimum(
-                fbench.check_vector([4.493409471849579]),
-                -0.217233628211222,
-            ),
-        ],
-        sphere: [fbench.structure.Optimum(fbench.check_vector([0] * n), 0)],
-    }
-    return optima.get(func, None)
+    x = _check_array(x)
+    n = x.shape[-1]
+    r = np.sqrt((x**2).mean(axis=-1, keepdims=True))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        g1 = np.where(r > 0, 4 * np.exp(-0.2 * r) * x / (n * r), 0)
+    mean_cos = np.cos(2 * np.pi * x).mean(axis=-1, keepdims=True)
+    g2 = 2 * np.pi / n * np.exp(mean_cos) * np.sin(2 * np.pi * x)
+    return g1 + g2
 
 
-def peaks(x, /):
-    """Peaks function.
-
-    A function :math:`f\\colon \\mathbb{R}^{2} \\rightarrow \\mathbb{R}`
-    that takes a :math:`2`-vector as input and returns a scalar value.
+def ackley_hess(x, /):
+    """Hessian of the Ackley function.
 
-    .. math::
-
-       f(\\mathbf{x}) =
-       3 (1 - x_{1})^{2}
-         \\exp\\left( - x_{1}^{2} - (x_{2} + 1)^{2} \\right)
-       - 10 \\left( \\frac{x_{1}}{5} - x_{1}^{3} - x_{2}^{5} \\right)
-         \\exp\\left( - x_{1}^{2} - x_{2}^{2} \\right)
-       - \\frac{1}{3} \\exp\\left( - (x_{1} + 1)^{2} - x_{2}^{2} \\right)
+    For large :math:`n`, prefer :func:`ackley_hessp`,
+    which never forms the :math:`n \\times n` matrix.
 
     Parameters
     ----------
     x : array_like
-        The :math:`2`-vector.
+        The :math:`n`-vector.
 
     Returns
     -------
-    float
-        Function value at :math:`\\mathbf{x}`.
+    np.ndarray
+        The :math:`(n, n)` Hessian matrix at :math:`\\mathbf{x}`.
+
+    Notes
+    -----
+    The function is not twice differentiable at the origin,
+    where the Hessian of the first exponential term is set to zero.
+
+    See Also
+    --------
+    ackley : Ackley function.
+    ackley_grad : Gradient of the Ackley function.
 
     Examples
     --------
     >>> import fbench
-    >>> round(fbench.peaks([0, 0]), 4)
-    0.981
+    >>> fbench.ackley_hess([1, 2]).round(4)
+    array([[54.336 , -0.4854],
+           [-0.4854, 53.6079]])
     """
-    x1, x2 = fbench.check_vector(x, n_max=2)
-    f1 = 3 * (1 - x1) ** 2 * np.exp(-(x1**2) - (x2 + 1) ** 2)
-    f2 = 10 * (x1 / 5 - x1**3 - x2**5) * np.exp(-(x1**2) - x2**2)
-    f3 = 1 / 3 * np.exp(-((x1 + 1) ** 2) - x2**2)
-    return float(f1 - f2 - f3)
+    x = _as_float(fbench.check_vector(x))
+    n = len(x)
+    r = np.sqrt((x**2).mean())
+    angle = 2 * np.pi * x
+    sin_angle = np.sin(angle)
+    e2 = np.exp(np.cos(angle).mean())
+    hess = (
+        4
+        * np.pi**2
+        / n
+        * e2
+        * (np.diag(np.cos(angle)) - np.outer(sin_angle, sin_angle) / n)
+    )
+    if r > 0:
+        e1 = np.exp(-0.2 * r)
+        hess += (
+            4 * e1 / (n * r) * (np.eye(n) - (0.2 * r + 1) / (n * r**2) * np.outer(x, x))
+        )
+    return hess
 
 
-def rastrigin(x, /):
-    """Rastrigin function.
+def ackley_hessp(x, p, /):
+    """Hessian-vector product of the Ackley function.
 
-    A function :math:`f\\colon \\mathbb{R}^{n} \\rightarrow \\mathbb{R}`
-    that takes an :math:`n`-vector as input and returns a scalar value.
+    Computes :math:`\\nabla^2 f(\\mathbf{x}) \\, \\mathbf{p}` without forming
+    the Hessian, in :math:`O(n)` time and memory.
 
-    .. math::
+    Parameters
+    ----------
+    x : array_like
+        The :math:`n`-vector or an :math:`(m, n)`-matrix whose rows are
+        :math:`n`-vectors.
+    p : array_like
+        The vector to multiply with the Hessian, with the same shape as ``x``.
 
-        f(\\mathbf{x}) =
-        10n + \\sum_{i=1}^{n} \\left( x_i^2 - 10 \\cos(2 \\pi x_i) \\right)
+    Returns
+    -------
+    np.ndarray
+        Hessian-vector product with the same shape as ``x``.
+
+    Notes
+    -----
+    The function is not twice differentiable at the origin,
+    where the Hessian of the first exponential term is set to zero.
+
+    See Also
+    --------
+    ackley_hess : Hessian of the Ackley function.
+
+    Examples
+    --------
+    >>> import fbench
+    >>> fbench.ackley_hessp([1, 2], [1, 0]).round(4)
+    array([54.336 , -0.4854])
+    """
+    x, p = _check_array_pair(x, p)
+    n = x.shape[-1]
+    r = np.sqrt((x**2).mean(axis=-1, keepdims=True))
+    angle = 2 * np.pi * x
+    sin_angle = np.sin(angle)
+    e1 = np.exp(-0.2 * r)
+    e2 = np.exp(np.cos(angle).mean(axis=-1, keepdims=True))
+    sin_dot_p = (sin_angle * p).sum(axis=-1, keepdims=True)
+    x_dot_p = (x * p).sum(axis=-1, keepdims=True)
+    hp2 = 4 * np.pi**2 / n * e2 * (np.cos(angle) * p - sin_angle * sin_dot_p / n)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        hp1 = np.where(
+            r > 0,
+            4 * e1 / (n * r) * (p - (0.2 * r + 1) / (n * r**2) * x * x_dot_p),
+            0,
+        )
+    return hp1 + hp2
+
+
+def ackley_value_and_grad(x, /):
+    """Value and gradient of the Ackley function.
+
+    Computes :func:`ackley` and :func:`ackley_grad` in a single pass,
+    reusing intermediate terms of the function value for the gradient.
+    The exponential terms and :math:`\\sin(2 \\pi x_i)` are shared.
 
     Parameters
     ----------
     x : array_like
-        The :math:`n`-vector.
+        The :math:`n`-vector or an :math:`(m, n)`-matrix whose rows are
+        :math:`n`-vectors.
 
     Returns
     -------
-    float
-        Function value at :math:`\\mathbf{x}`.
+    value : float or np.ndarray
+        Function value at :math:`\\mathbf{x}` if ``x`` is a vector,
+        otherwise the :math:`m`-vector of function values.
+    grad : np.ndarray
+        Gradient at :math:`\\mathbf{x}` with the same shape as ``x``.
 
-    References
-    ----------
-    .. [1] "Test functions for optimization", Wikipedia,
-           `<https://en.wikipedia.org/wiki/Test_functions_for_optimization>`_
+    See Also
+    --------
+    ackley : Ackley function.
+    ackley_grad : Gradient of the Ackley function.
 
     Examples
     --------
     >>> import fbench
-    >>> round(fbench.rastrigin([0, 0]), 4)
-    0.0
+    >>> fx, grad = fbench.ackley_value_and_grad([1, 2])
+    >>> round(fx, 4), grad.round(4)
+    (5.4221, array([0.922, 1.844]))
+    """
+    x = _check_array(x)
+    n = x.shape[-1]
+    r = np.sqrt((x**2).mean(axis=-1, keepdims=True))
+    angle = 2 * np.pi * x
+    e1 = np.exp(-0.2 * r)
+    e2 = np.exp(np.cos(angle).mean(axis=-1, keepdims=True))
+    value = (-20 * e1 - e2 + 20 + np.e)[..., 0]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        g1 = np.where(r > 0, 4 * e1 * x / (n * r), 0)
+    g2 = 2 * np.pi / n * e2 * np.sin(angle)
+    return _as_value(value), g1 + g2
+
+
+def batchable(func, /, *, batch=None):
+    """Declare a function to be batch-capable.
+
+    Sets the ``batch`` attribute of the function, which is the protocol
+    :func:`get_batch_func` uses to detect batch-capable functions.
+    A batch function maps an :math:`(m, n)`-matrix, whose rows are
+    :math:`n`-vectors, to an :math:`m`-vector of function values.
 
-    >>> round(fbench.rastrigin([1, 2]), 4)
-    5.0
+    Parameters
+    ----------
+    func : callable
+        The function to declare batch-capable.
+    batch : callable, default=None
+        Specify the batch counterpart of ``func``.
+        If None, ``func`` itself must accept an :math:`(m, n)`-matrix.
 
-    >>> round(fbench.rastrigin([4.5, 4.5]), 4)
-    80.5
+    Returns
+    -------
+    callable
+        The function ``func`` with its ``batch`` attribute set.
 
-    >>> round(fbench.rastrigin([1, 2, 3]), 4)
-    14.0
+    Notes
+    -----
+    Functions without a ``batch`` attribute are evaluated once per vector
+    by the coordinate functions in :mod:`fbench.viz`.
+
+    Examples
+    --------
+    >>> import fbench
+    >>> import numpy as np
+    >>> @fbench.batchable
+    ... def func(x):
+    ...     return np.abs(x).sum(axis=1)
+    >>> fbench.viz.create_coordinates2d(func, [-1, 0, 1])
+    CoordinatePairs(x=array([-1,  0,  1]), y=array([1, 0, 1]))
     """
-    x = fbench.check_vector(x)
-    return float(10 * len(x) + (x**2 - 10 * np.cos(2 * np.pi * x)).sum())
+    func.batch = func if batch is None else batch
+    return func
 
 
-def rosenbrock(x, /):
-    """Rosenbrock function.
+def beale(x, /, *, validate=True):
+    """Beale function.
 
-    A function :math:`f\\colon \\mathbb{R}^{n} \\rightarrow \\mathbb{R}`
-    that takes an :math:`n`-vector as input and returns a scalar value.
+    A function :math:`f\\colon \\mathbb{R}^{2} \\rightarrow \\mathbb{R}`
+    that takes a :math:`2`-vector as input and returns a scalar value.
 
     .. math::
 
-        f(\\mathbf{x}) =
-        \\sum_{i=1}^{n-1} \\left(
-            100 (x_{i+1} - x_i^2)^2 + (1 - x_i)^2
-        \\right)
+       f(\\mathbf{x}) =
+       \\left( 1.5 - x_{1} + x_{1} x_{2} \\right)^{2}
+       + \\left( 2.25 - x_{1} + x_{1} x_{2}^{2} \\right)^{2}
+       + \\left( 2.625 - x_{1} + x_{1} x_{2}^{3}\\right)^{2}
 
     Parameters
     ----------
     x : array_like
-        The :math:`n`-vector.
+        The :math:`2`-vector.
+    validate : bool, default=True
+        Specify if the input should be validated with :func:`check_vector`.
+        Set to False for trusted input to reduce the call overhead.
 
     Returns
     -------
@@ -297,141 +447,1646 @@ def rosenbrock(x, /):
     ----------
     .. [1] "Test functions for optimization", Wikipedia,
            `<https://en.wikipedia.org/wiki/Test_functions_for_optimization>`_
+    .. [2] "Beale function", Virtual Library of Simulation Experiments:
+           Test Functions and Datasets, `<https://www.sfu.ca/~ssurjano/beale.html>`_
 
     Examples
     --------
     >>> import fbench
-    >>> round(fbench.rosenbrock([0, 0]), 4)
-    1.0
-
-    >>> round(fbench.rosenbrock([1, 1]), 4)
+    >>> fbench.beale([3, 0.5])
     0.0
 
-    >>> round(fbench.rosenbrock([1, 1, 1]), 4)
-    0.0
+    >>> round(fbench.beale([0, 0]), 4)
+    14.2031
 
-    >>> round(fbench.rosenbrock([1, 2, 3]), 4)
-    201.0
+    >>> round(fbench.beale([1, 1]), 4)
+    14.2031
 
-    >>> round(fbench.rosenbrock([3, 3]), 4)
-    3604.0
+    >>> round(fbench.beale([2, 2]), 4)
+    356.7031
     """
-    x = fbench.check_vector(x, n_min=2)
-    return float((100 * (x[1:] - x[:-1] ** 2) ** 2 + (1 - x[:-1]) ** 2).sum())
+    if validate:
+        x = fbench.check_vector(x, n_max=2).tolist()
 
+    # plain float arithmetic as NumPy has a large overhead for scalars
+    x1, x2 = x
+    r1 = 1.5 - x1 + x1 * x2
+    r2 = 2.25 - x1 + x1 * x2 * x2
+    r3 = 2.625 - x1 + x1 * x2 * x2 * x2
+    return float(r1 * r1 + r2 * r2 + r3 * r3)
 
-def schwefel(x, /):
-    """Schwefel function.
-
-    A function :math:`f\\colon \\mathbb{R}^{n} \\rightarrow \\mathbb{R}`
-    that takes an :math:`n`-vector as input and returns a scalar value.
 
-    .. math::
+def beale_batch(x, /, *, out=None, workspace=None):
+    """Beale function for a batch of vectors.
 
-        f(\\mathbf{x}) =
-        418.9829 n - \\sum_{i=1}^{n} x_{i} \\sin\\left( \\sqrt{|x_{i}|} \\right)
+    Vectorized counterpart of :func:`beale` that evaluates the function for
+    each row of an :math:`(m, 2)`-matrix in a single pass.
 
     Parameters
     ----------
     x : array_like
-        The :math:`n`-vector.
+        The :math:`(m, 2)`-matrix whose rows are :math:`2`-vectors.
+    out : np.ndarray, default=None
+        Optionally supply an :math:`m`-vector to store the function values.
+    workspace : Workspace, default=None
+        Optionally supply a workspace to reuse its scratch arrays.
+        If None, scratch arrays are allocated per call.
 
     Returns
     -------
-    float
-        Function value at :math:`\\mathbf{x}`.
+    np.ndarray
+        The :math:`m`-vector of function values, which is ``out`` if supplied.
+        It has the floating-point dtype of ``x`` or float64 for other dtypes.
 
-    References
-    ----------
-    .. [1] "Schwefel function", Virtual Library of Simulation Experiments:
-           Test Functions and Datasets, `<https://www.sfu.ca/~ssurjano/schwef.html>`_
+    See Also
+    --------
+    beale : Beale function.
 
     Examples
     --------
     >>> import fbench
-    >>> round(fbench.schwefel([420.9687]), 4)
-    0.0
-
-    >>> round(fbench.schwefel([0, 0]), 4)
-    837.9658
-
-    >>> round(fbench.schwefel([1, 2]), 4)
-    835.1488
-
-    >>> round(fbench.schwefel([1, 2, 3]), 4)
-    1251.1706
+    >>> fbench.beale_batch([[3, 0.5], [0, 0]]).round(4)
+    array([ 0.    , 14.2031])
     """
-    x = fbench.check_vector(x)
-    n = len(x)
-    return float(418.9829 * n - sum(x * np.sin(np.sqrt(np.abs(x)))))
-
-
-def sinc(x, /):
-    """Sinc function.
-
-    A function :math:`f\\colon \\mathbb{R}^{1} \\rightarrow \\mathbb{R}`
-    that takes an :math:`1`-vector as input and returns a scalar value.
+    x1, x2 = _as_float(fbench.check_matrix(x, n_min=2, n_max=2)).T
+    out = _check_out(out, len(x1), x1.dtype)
+    power = _empty(workspace, "power", x1.shape, x1.dtype)
+    tmp = _empty(workspace, "tmp", x1.shape, x1.dtype)
+
+    power[...] = x2
+    out.fill(0)
+    for c in (1.5, 2.25, 2.625):
+        # out += (c - x1 + x1 * x2^k)^2
+        np.multiply(x1, power, out=tmp)
+        tmp -= x1
+        tmp += c
+        np.square(tmp, out=tmp)
+        out += tmp
+        power *= x2
+    return out
+
+
+def beale_grad(x, /):
+    """Gradient of the Beale function.
 
     .. math::
 
-        f(\\mathbf{x}) =
-        \\begin{cases}
-            \\frac{\\sin(x)}{x} & \\text{ if } x \\neq 0 \\\\
-            1 & \\text{ if } x = 0
-        \\end{cases}
+        \\frac{\\partial f}{\\partial x_1} =
+        \\sum_{k=1}^{3} 2 r_k \\left( x_2^k - 1 \\right),
+        \\quad
+        \\frac{\\partial f}{\\partial x_2} =
+        \\sum_{k=1}^{3} 2 r_k k x_1 x_2^{k-1},
+        \\quad r_k = c_k - x_1 + x_1 x_2^k
 
     Parameters
     ----------
     x : array_like
-        The :math:`1`-vector.
+        The :math:`2`-vector or an :math:`(m, 2)`-matrix whose rows are
+        :math:`2`-vectors.
 
     Returns
     -------
-    float
-        Function value at :math:`\\mathbf{x}`.
+    np.ndarray
+        Gradient at :math:`\\mathbf{x}` with the same shape as ``x``.
 
-    References
-    ----------
-    .. [1] "Sinc Function", Wolfram MathWorld,
-           `<https://mathworld.wolfram.com/SincFunction.html>`_
+    Notes
+    -----
+    The constants are :math:`c_1 = 1.5`, :math:`c_2 = 2.25`, and :math:`c_3 = 2.625`.
+
+    See Also
+    --------
+    beale : Beale function.
 
     Examples
     --------
     >>> import fbench
-    >>> fbench.sinc([0])
-    1.0
-
-    >>> round(fbench.sinc([1]), 4)
-    0.8415
+    >>> fbench.beale_grad([1, 1])
+    array([ 0.  , 27.75])
     """
-    x = fbench.check_vector(x, n_max=1)[0]
-    return float(1 if x == 0 else np.sin(x) / x)
+    x = _check_array(x, n_min=2, n_max=2)
+    x1, x2 = x[..., 0], x[..., 1]
+    r1 = 1.5 - x1 + x1 * x2
+    r2 = 2.25 - x1 + x1 * x2**2
+    r3 = 2.625 - x1 + x1 * x2**3
+    g1 = 2 * (r1 * (x2 - 1) + r2 * (x2**2 - 1) + r3 * (x2**3 - 1))
+    g2 = 2 * x1 * (r1 + 2 * r2 * x2 + 3 * r3 * x2**2)
+    return np.stack([g1, g2], axis=-1)
 
 
-def sphere(x, /):
-    """Sphere function.
+def beale_hess(x, /):
+    """Hessian of the Beale function.
 
-    A function :math:`f\\colon \\mathbb{R}^{n} \\rightarrow \\mathbb{R}`
-    that takes an :math:`n`-vector as input and returns a scalar value.
+    Parameters
+    ----------
+    x : array_like
+        The :math:`2`-vector.
 
-    .. math::
+    Returns
+    -------
+    np.ndarray
+        The :math:`(2, 2)` Hessian matrix at :math:`\\mathbf{x}`.
 
-       f(\\mathbf{x}) = \\sum_{i=1}^{n} x_i^2
+    See Also
+    --------
+    beale : Beale function.
+    beale_grad : Gradient of the Beale function.
+
+    Examples
+    --------
+    >>> import fbench
+    >>> fbench.beale_hess([3, 0.5]).round(4)
+    array([[  3.1562, -11.4375],
+           [-11.4375,  46.125 ]])
+    """
+    x1, x2 = _as_float(fbench.check_vector(x, n_min=2, n_max=2))
+    hess = np.zeros((2, 2), dtype=np.result_type(x1, float))
+    for k, c in enumerate((1.5, 2.25, 2.625), start=1):
+        r = c - x1 + x1 * x2**k
+        dr = np.array([x2**k - 1, k * x1 * x2 ** (k - 1)])
+        d2r = np.array(
+            [
+                [0, k * x2 ** (k - 1)],
+                [k * x2 ** (k - 1), k * (k - 1) * x1 * x2 ** max(k - 2, 0)],
+            ]
+        )
+        hess += 2 * (np.outer(dr, dr) + r * d2r)
+    return hess
+
+
+def beale_value_and_grad(x, /):
+    """Value and gradient of the Beale function.
+
+    Computes :func:`beale` and :func:`beale_grad` in a single pass,
+    reusing intermediate terms of the function value for the gradient.
+    The residuals of the three squared terms are shared.
 
     Parameters
     ----------
     x : array_like
-        The :math:`n`-vector.
+        The :math:`2`-vector or an :math:`(m, 2)`-matrix whose rows are
+        :math:`2`-vectors.
 
     Returns
     -------
-    float
-        Function value at :math:`\\mathbf{x}`.
+    value : float or np.ndarray
+        Function value at :math:`\\mathbf{x}` if ``x`` is a vector,
+        otherwise the :math:`m`-vector of function values.
+    grad : np.ndarray
+        Gradient at :math:`\\mathbf{x}` with the same shape as ``x``.
 
-    References
-    ----------
-    .. [1] "Test functions for optimization", Wikipedia,
-           `<https://en.wikipedia.org/wiki/Test_functions_for_optimization>`_
+    See Also
+    --------
+    beale : Beale function.
+    beale_grad : Gradient of the Beale function.
+
+    Examples
+    --------
+    >>> import fbench
+    >>> fbench.beale_value_and_grad([1, 1])
+    (14.203125, array([ 0.  , 27.75]))
+    """
+    x = _check_array(x, n_min=2, n_max=2)
+    x1, x2 = x[..., 0], x[..., 1]
+    r1 = 1.5 - x1 + x1 * x2
+    r2 = 2.25 - x1 + x1 * x2**2
+    r3 = 2.625 - x1 + x1 * x2**3
+    value = r1**2 + r2**2 + r3**2
+    g1 = 2 * (r1 * (x2 - 1) + r2 * (x2**2 - 1) + r3 * (x2**3 - 1))
+    g2 = 2 * x1 * (r1 + 2 * r2 * x2 + 3 * r3 * x2**2)
+    return _as_value(value), np.stack([g1, g2], axis=-1)
+
+
+def get_batch_func(func, /):
+    """Retrieve the batch counterpart of a function.
+
+    A function is batch-capable if it is a fBench function or if it has a
+    ``batch`` attribute, see :func:`batchable`. The batch counterpart maps an
+    :math:`(m, n)`-matrix, whose rows are :math:`n`-vectors, to an
+    :math:`m`-vector of function values.
+
+    Parameters
+    ----------
+    func : callable
+        A function to retrieve its batch counterpart.
+
+    Returns
+    -------
+    Optional[callable]
+        The batch counterpart of ``func`` if it is batch-capable, otherwise None.
+
+    Examples
+    --------
+    >>> import fbench
+    >>> fbench.get_batch_func(fbench.sphere).__name__
+    'sphere_batch'
+    >>> fbench.get_batch_func(lambda x: x[0]) is None
+    True
+    """
+    benchmark = get_benchmark(func)
+    if benchmark is not None:
+        return benchmark.batch
+    return getattr(func, "batch", None)
+
+
+def get_benchmark(func, /):
+    """Retrieve a benchmark function and its metadata.
+
+    Parameters
+    ----------
+    func : callable or str
+        A fBench function or its name.
+
+    Returns
+    -------
+    Optional[Benchmark]
+        The benchmark if ``func`` is a fBench function, otherwise None.
+
+    See Also
+    --------
+    get_benchmarks : Retrieve all benchmark functions and their metadata.
+
+    Examples
+    --------
+    >>> import fbench
+    >>> benchmark = fbench.get_benchmark(fbench.rastrigin)
+    >>> benchmark.name, benchmark.bounds, benchmark.separable
+    ('rastrigin', (-5.12, 5.12), True)
+    >>> fbench.get_benchmark("rastrigin") is benchmark
+    True
+    """
+    try:
+        return _BENCHMARKS.get(func)
+    except TypeError:
+        return None
+
+
+def get_benchmarks():
+    """Retrieve all benchmark functions and their metadata.
+
+    Returns
+    -------
+    dict[str, Benchmark]
+        The benchmarks by name.
+
+    Examples
+    --------
+    >>> import fbench
+    >>> benchmarks = fbench.get_benchmarks()
+    >>> benchmarks["sphere"].func is fbench.sphere
+    True
+    """
+    return {benchmark.name: benchmark for benchmark in _BENCHMARKS.values()}
+
+
+def get_optima(n, /, func=None):
+    """Retrieve optima for defined functions.
+
+    Parameters
+    ----------
+    n : int
+        Specify the number of dimensions :math:`n`.
+    func : callable, default=None
+        A fBench function to retrieve its optima.
+        None is returned if no optima is defined.
+        If not specified, a function that takes ``func`` is returned.
+
+    Returns
+    -------
+    Optional[list[Optimum]]]
+        Optima with specified dimension for fBench function if defined.
+
+    Notes
+    -----
+    - Function is curried.
+    - Optima are built on first request and cached per function and :math:`n`.
+      Each call returns copies of the cached optima.
+    - Optima are defined for the following functions:
+        - ackley
+        - beale
+        - peaks
+        - rastrigin
+        - rosenbrock
+        - schwefel
+        - sinc
+        - sphere
+
+    Examples
+    --------
+    >>> import fbench
+    >>> optima = fbench.get_optima(5, fbench.sphere)
+    >>> optima
+    [Optimum(x=array([0, 0, 0, 0, 0]), fx=0)]
+    >>> optimum = optima[0]
+    >>> optimum.n
+    5
+    """
+    if func is None:
+        # curry without toolz, which would slow down importing fbench
+        return functools.partial(get_optima, n)
+
+    benchmark = get_benchmark(func)
+    if benchmark is None:
+        return None
+    return [
+        fbench.structure.Optimum(optimum.x.copy(), optimum.fx)
+        for optimum in benchmark.get_optima(n)
+    ]
+
+
+def peaks(x, /, *, validate=True):
+    """Peaks function.
+
+    A function :math:`f\\colon \\mathbb{R}^{2} \\rightarrow \\mathbb{R}`
+    that takes a :math:`2`-vector as input and returns a scalar value.
+
+    .. math::
+
+       f(\\mathbf{x}) =
+       3 (1 - x_{1})^{2}
+         \\exp\\left( - x_{1}^{2} - (x_{2} + 1)^{2} \\right)
+       - 10 \\left( \\frac{x_{1}}{5} - x_{1}^{3} - x_{2}^{5} \\right)
+         \\exp\\left( - x_{1}^{2} - x_{2}^{2} \\right)
+       - \\frac{1}{3} \\exp\\left( - (x_{1} + 1)^{2} - x_{2}^{2} \\right)
+
+    Parameters
+    ----------
+    x : array_like
+        The :math:`2`-vector.
+    validate : bool, default=True
+        Specify if the input should be validated with :func:`check_vector`.
+        Set to False for trusted input to reduce the call overhead.
+
+    Returns
+    -------
+    float
+        Function value at :math:`\\mathbf{x}`.
+
+    Examples
+    --------
+    >>> import fbench
+    >>> round(fbench.peaks([0, 0]), 4)
+    0.981
+    """
+    if validate:
+        x = fbench.check_vector(x, n_max=2).tolist()
+
+    x1, x2 = x
+    sq1, sq2 = x1 * x1, x2 * x2
+    f1 = 3 * (1 - x1) * (1 - x1) * math.exp(-sq1 - (x2 + 1) * (x2 + 1))
+    f2 = 10 * (x1 / 5 - x1 * sq1 - x2 * sq2 * sq2) * math.exp(-sq1 - sq2)
+    f3 = 1 / 3 * math.exp(-(x1 + 1) * (x1 + 1) - sq2)
+    return float(f1 - f2 - f3)
+
+
+def peaks_batch(x, /, *, out=None, workspace=None):
+    """Peaks function for a batch of vectors.
+
+    Vectorized counterpart of :func:`peaks` that evaluates the function for
+    each row of an :math:`(m, 2)`-matrix in a single pass.
+
+    Parameters
+    ----------
+    x : array_like
+        The :math:`(m, 2)`-matrix whose rows are :math:`2`-vectors.
+    out : np.ndarray, default=None
+        Optionally supply an :math:`m`-vector to store the function values.
+    workspace : Workspace, default=None
+        Optionally supply a workspace to reuse its scratch arrays.
+        If None, scratch arrays are allocated per call.
+
+    Returns
+    -------
+    np.ndarray
+        The :math:`m`-vector of function values, which is ``out`` if supplied.
+        It has the floating-point dtype of ``x`` or float64 for other dtypes.
+
+    See Also
+    --------
+    peaks : Peaks function.
+
+    Examples
+    --------
+    >>> import fbench
+    >>> fbench.peaks_batch([[0, 0], [1, 1]]).round(4)
+    array([0.981 , 2.4338])
+    """
+    x1, x2 = _as_float(fbench.check_matrix(x, n_min=2, n_max=2)).T
+    out = _check_out(out, len(x1), x1.dtype)
+    sq1 = _empty(workspace, "sq1", x1.shape, x1.dtype)
+    sq2 = _empty(workspace, "sq2", x1.shape, x1.dtype)
+    tmp = _empty(workspace, "tmp", x1.shape, x1.dtype)
+    poly = _empty(workspace, "poly", x1.shape, x1.dtype)
+    np.square(x1, out=sq1)
+    np.square(x2, out=sq2)
+
+    # out = -1/3 exp(-(x1 + 1)^2 - x2^2)
+    np.add(x1, 1, out=tmp)
+    np.square(tmp, out=tmp)
+    tmp += sq2
+    np.negative(tmp, out=tmp)
+    np.exp(tmp, out=tmp)
+    np.multiply(tmp, -1 / 3, out=out)
+
+    # out += 3 (1 - x1)^2 exp(-x1^2 - (x2 + 1)^2)
+    np.add(x2, 1, out=tmp)
+    np.square(tmp, out=tmp)
+    tmp += sq1
+    np.negative(tmp, out=tmp)
+    np.exp(tmp, out=tmp)
+    np.subtract(1, x1, out=poly)
+    np.square(poly, out=poly)
+    poly *= 3
+    poly *= tmp
+    out += poly
+
+    # out -= 10 (x1 / 5 - x1^3 - x2^5) exp(-x1^2 - x2^2)
+    np.add(sq1, sq2, out=tmp)
+    np.negative(tmp, out=tmp)
+    np.exp(tmp, out=tmp)
+    np.divide(x1, 5, out=poly)
+    sq1 *= x1
+    poly -= sq1
+    np.square(sq2, out=sq2)
+    sq2 *= x2
+    poly -= sq2
+    poly *= 10
+    poly *= tmp
+    out -= poly
+    return out
+
+
+def peaks_grad(x, /):
+    """Gradient of the Peaks function.
+
+    .. math::
+
+        \\nabla f(\\mathbf{x}) =
+        \\left(
+            \\frac{\\partial f}{\\partial x_1}, \\frac{\\partial f}{\\partial x_2}
+        \\right)
+
+    Parameters
+    ----------
+    x : array_like
+        The :math:`2`-vector or an :math:`(m, 2)`-matrix whose rows are
+        :math:`2`-vectors.
+
+    Returns
+    -------
+    np.ndarray
+        Gradient at :math:`\\mathbf{x}` with the same shape as ``x``.
+
+    See Also
+    --------
+    peaks : Peaks function.
+
+    Examples
+    --------
+    >>> import fbench
+    >>> fbench.peaks_grad([0, 0]).round(4)
+    array([-3.962 , -2.2073])
+    """
+    x = _check_array(x, n_min=2, n_max=2)
+    x1, x2 = x[..., 0], x[..., 1]
+    e1 = np.exp(-(x1**2) - (x2 + 1) ** 2)
+    e2 = np.exp(-(x1**2) - x2**2)
+    e3 = np.exp(-((x1 + 1) ** 2) - x2**2)
+    h = x1 / 5 - x1**3 - x2**5
+    g1 = (
+        -6 * (1 - x1) * (1 + x1 - x1**2) * e1
+        - 10 * (1 / 5 - 3 * x1**2 - 2 * x1 * h) * e2
+        + 2 / 3 * (x1 + 1) * e3
+    )
+    g2 = (
+        -6 * (1 - x1) ** 2 * (x2 + 1) * e1
+        + 10 * (5 * x2**4 + 2 * x2 * h) * e2
+        + 2 / 3 * x2 * e3
+    )
+    return np.stack([g1, g2], axis=-1)
+
+
+def peaks_hess(x, /):
+    """Hessian of the Peaks function.
+
+    Parameters
+    ----------
+    x : array_like
+        The :math:`2`-vector.
+
+    Returns
+    -------
+    np.ndarray
+        The :math:`(2, 2)` Hessian matrix at :math:`\\mathbf{x}`.
+
+    See Also
+    --------
+    peaks : Peaks function.
+    peaks_grad : Gradient of the Peaks function.
+
+    Examples
+    --------
+    >>> import fbench
+    >>> fbench.peaks_hess([0, 0]).round(4)
+    array([[-0.2453,  4.4146],
+           [ 4.4146,  2.4525]])
+    """
+    x1, x2 = _as_float(fbench.check_vector(x, n_min=2, n_max=2))
+    terms = (
+        (
+            3 * (1 - x1) ** 2,
+            np.array([-6 * (1 - x1), 0]),
+            np.array([[6, 0], [0, 0]]),
+            -(x1**2) - (x2 + 1) ** 2,
+            np.array([-2 * x1, -2 * (x2 + 1)]),
+        ),
+        (
+            -10 * (x1 / 5 - x1**3 - x2**5),
+            np.array([-2 + 30 * x1**2, 50 * x2**4]),
+            np.array([[60 * x1, 0], [0, 200 * x2**3]]),
+            -(x1**2) - x2**2,
+            np.array([-2 * x1, -2 * x2]),
+        ),
+        (
+            -1 / 3,
+            np.zeros(2),
+            np.zeros((2, 2)),
+            -((x1 + 1) ** 2) - x2**2,
+            np.array([-2 * (x1 + 1), -2 * x2]),
+        ),
+    )
+
+    # Hessian of g * exp(q) for quadratic q with Hessian -2I
+    hess = np.zeros((2, 2))
+    for g, dg, d2g, q, dq in terms:
+        hess += np.exp(q) * (
+            d2g
+            + np.outer(dg, dq)
+            + np.outer(dq, dg)
+            + g * np.outer(dq, dq)
+            - 2 * g * np.eye(2)
+        )
+    return hess
+
+
+def peaks_value_and_grad(x, /):
+    """Value and gradient of the Peaks function.
+
+    Computes :func:`peaks` and :func:`peaks_grad` in a single pass,
+    reusing intermediate terms of the function value for the gradient.
+    The three exponential terms are shared.
+
+    Parameters
+    ----------
+    x : array_like
+        The :math:`2`-vector or an :math:`(m, 2)`-matrix whose rows are
+        :math:`2`-vectors.
+
+    Returns
+    -------
+    value : float or np.ndarray
+        Function value at :math:`\\mathbf{x}` if ``x`` is a vector,
+        otherwise the :math:`m`-vector of function values.
+    grad : np.ndarray
+        Gradient at :math:`\\mathbf{x}` with the same shape as ``x``.
+
+    See Also
+    --------
+    peaks : Peaks function.
+    peaks_grad : Gradient of the Peaks function.
+
+    Examples
+    --------
+    >>> import fbench
+    >>> fx, grad = fbench.peaks_value_and_grad([0, 0])
+    >>> round(fx, 4), grad.round(4)
+    (0.981, array([-3.962 , -2.2073]))
+    """
+    x = _check_array(x, n_min=2, n_max=2)
+    x1, x2 = x[..., 0], x[..., 1]
+    e1 = np.exp(-(x1**2) - (x2 + 1) ** 2)
+    e2 = np.exp(-(x1**2) - x2**2)
+    e3 = np.exp(-((x1 + 1) ** 2) - x2**2)
+    h = x1 / 5 - x1**3 - x2**5
+    value = 3 * (1 - x1) ** 2 * e1 - 10 * h * e2 - 1 / 3 * e3
+    g1 = (
+        -6 * (1 - x1) * (1 + x1 - x1**2) * e1
+        - 10 * (1 / 5 - 3 * x1**2 - 2 * x1 * h) * e2
+        + 2 / 3 * (x1 + 1) * e3
+    )
+    g2 = (
+        -6 * (1 - x1) ** 2 * (x2 + 1) * e1
+        + 10 * (5 * x2**4 + 2 * x2 * h) * e2
+        + 2 / 3 * x2 * e3
+    )
+    return _as_value(value), np.stack([g1, g2], axis=-1)
+
+
+def rastrigin(x, /, *, validate=True):
+    """Rastrigin function.
+
+    A function :math:`f\\colon \\mathbb{R}^{n} \\rightarrow \\mathbb{R}`
+    that takes an :math:`n`-vector as input and returns a scalar value.
+
+    .. math::
+
+        f(\\mathbf{x}) =
+        10n + \\sum_{i=1}^{n} \\left( x_i^2 - 10 \\cos(2 \\pi x_i) \\right)
+
+    Parameters
+    ----------
+    x : array_like
+        The :math:`n`-vector.
+    validate : bool, default=True
+        Specify if the input should be validated with :func:`check_vector`.
+        Set to False for trusted input to reduce the call overhead.
+
+    Returns
+    -------
+    float
+        Function value at :math:`\\mathbf{x}`.
+
+    References
+    ----------
+    .. [1] "Test functions for optimization", Wikipedia,
+           `<https://en.wikipedia.org/wiki/Test_functions_for_optimization>`_
+
+    Examples
+    --------
+    >>> import fbench
+    >>> round(fbench.rastrigin([0, 0]), 4)
+    0.0
+
+    >>> round(fbench.rastrigin([1, 2]), 4)
+    5.0
+
+    >>> round(fbench.rastrigin([4.5, 4.5]), 4)
+    80.5
+
+    >>> round(fbench.rastrigin([1, 2, 3]), 4)
+    14.0
+    """
+    x = _as_small_vector(x, validate=validate)
+    if isinstance(x, list):
+        # plain float arithmetic as NumPy has a large overhead for scalars
+        return float(
+            10 * len(x) + sum([xi * xi - 10 * math.cos(2 * math.pi * xi) for xi in x])
+        )
+
+    return float(10 * len(x) + (x**2 - 10 * np.cos(2 * np.pi * x)).sum())
+
+
+def rastrigin_batch(x, /, *, out=None, workspace=None):
+    """Rastrigin function for a batch of vectors.
+
+    Vectorized counterpart of :func:`rastrigin` that evaluates the function for
+    each row of an :math:`(m, n)`-matrix in a single pass.
+
+    Parameters
+    ----------
+    x : array_like
+        The :math:`(m, n)`-matrix whose rows are :math:`n`-vectors.
+    out : np.ndarray, default=None
+        Optionally supply an :math:`m`-vector to store the function values.
+    workspace : Workspace, default=None
+        Optionally supply a workspace to reuse its scratch arrays.
+        If None, scratch arrays are allocated per call.
+
+    Returns
+    -------
+    np.ndarray
+        The :math:`m`-vector of function values, which is ``out`` if supplied.
+        It has the floating-point dtype of ``x`` or float64 for other dtypes.
+
+    See Also
+    --------
+    rastrigin : Rastrigin function.
+
+    Examples
+    --------
+    >>> import fbench
+    >>> fbench.rastrigin_batch([[0, 0], [1, 2]]).round(4)
+    array([0., 5.])
+    """
+    x = _as_float(fbench.check_matrix(x))
+    m, n = x.shape
+    out = _check_out(out, m, x.dtype)
+    tmp = _empty(workspace, "tmp", x.shape, x.dtype)
+    row = _empty(workspace, "row", (m,), x.dtype)
+
+    # out = 10 n + sum(x^2) - 10 sum(cos(2 pi x))
+    np.square(x, out=tmp)
+    np.sum(tmp, axis=1, out=out)
+    np.multiply(x, 2 * np.pi, out=tmp)
+    np.cos(tmp, out=tmp)
+    np.sum(tmp, axis=1, out=row)
+    row *= 10
+    out -= row
+    out += 10 * n
+    return out
+
+
+def rastrigin_grad(x, /):
+    """Gradient of the Rastrigin function.
+
+    .. math::
+
+        \\frac{\\partial f}{\\partial x_i} = 2 x_i + 20 \\pi \\sin(2 \\pi x_i)
+
+    Parameters
+    ----------
+    x : array_like
+        The :math:`n`-vector or an :math:`(m, n)`-matrix whose rows are
+        :math:`n`-vectors.
+
+    Returns
+    -------
+    np.ndarray
+        Gradient at :math:`\\mathbf{x}` with the same shape as ``x``.
+
+    See Also
+    --------
+    rastrigin : Rastrigin function.
+
+    Examples
+    --------
+    >>> import fbench
+    >>> fbench.rastrigin_grad([[0, 0], [1, 2]]).round(4)
+    array([[0., 0.],
+           [2., 4.]])
+    """
+    x = _check_array(x)
+    return 2 * x + 20 * np.pi * np.sin(2 * np.pi * x)
+
+
+def rastrigin_hess(x, /):
+    """Hessian of the Rastrigin function.
+
+    For large :math:`n`, prefer :func:`rastrigin_hessp`,
+    which never forms the :math:`n \\times n` matrix.
+
+    Parameters
+    ----------
+    x : array_like
+        The :math:`n`-vector.
+
+    Returns
+    -------
+    np.ndarray
+        The :math:`(n, n)` Hessian matrix at :math:`\\mathbf{x}`.
+
+    See Also
+    --------
+    rastrigin : Rastrigin function.
+    rastrigin_grad : Gradient of the Rastrigin function.
+
+    Examples
+    --------
+    >>> import fbench
+    >>> fbench.rastrigin_hess([0, 0]).round(4)
+    array([[396.7842,   0.    ],
+           [  0.    , 396.7842]])
+    """
+    x = _as_float(fbench.check_vector(x))
+    return np.diag(2 + 40 * np.pi**2 * np.cos(2 * np.pi * x))
+
+
+def rastrigin_hessp(x, p, /):
+    """Hessian-vector product of the Rastrigin function.
+
+    Computes :math:`\\nabla^2 f(\\mathbf{x}) \\, \\mathbf{p}` without forming
+    the Hessian, in :math:`O(n)` time and memory.
+
+    Parameters
+    ----------
+    x : array_like
+        The :math:`n`-vector or an :math:`(m, n)`-matrix whose rows are
+        :math:`n`-vectors.
+    p : array_like
+        The vector to multiply with the Hessian, with the same shape as ``x``.
+
+    Returns
+    -------
+    np.ndarray
+        Hessian-vector product with the same shape as ``x``.
+
+    See Also
+    --------
+    rastrigin_hess : Hessian of the Rastrigin function.
+
+    Examples
+    --------
+    >>> import fbench
+    >>> fbench.rastrigin_hessp([0, 0], [1, 2]).round(4)
+    array([396.7842, 793.5684])
+    """
+    x, p = _check_array_pair(x, p)
+    return (2 + 40 * np.pi**2 * np.cos(2 * np.pi * x)) * p
+
+
+def rastrigin_value_and_grad(x, /):
+    """Value and gradient of the Rastrigin function.
+
+    Computes :func:`rastrigin` and :func:`rastrigin_grad` in a single pass,
+    reusing intermediate terms of the function value for the gradient.
+    The scaled input :math:`2 \\pi x_i` is shared.
+
+    Parameters
+    ----------
+    x : array_like
+        The :math:`n`-vector or an :math:`(m, n)`-matrix whose rows are
+        :math:`n`-vectors.
+
+    Returns
+    -------
+    value : float or np.ndarray
+        Function value at :math:`\\mathbf{x}` if ``x`` is a vector,
+        otherwise the :math:`m`-vector of function values.
+    grad : np.ndarray
+        Gradient at :math:`\\mathbf{x}` with the same shape as ``x``.
+
+    See Also
+    --------
+    rastrigin : Rastrigin function.
+    rastrigin_grad : Gradient of the Rastrigin function.
+
+    Examples
+    --------
+    >>> import fbench
+    >>> fx, grad = fbench.rastrigin_value_and_grad([[0, 0], [1, 2]])
+    >>> fx.round(4), grad.round(4)
+    (array([0., 5.]), array([[0., 0.],
+           [2., 4.]]))
+    """
+    x = _check_array(x)
+    angle = 2 * np.pi * x
+    value = 10 * x.shape[-1] + (x**2 - 10 * np.cos(angle)).sum(axis=-1)
+    grad = 2 * x + 20 * np.pi * np.sin(angle)
+    return _as_value(value), grad
+
+
+def rosenbrock(x, /, *, validate=True):
+    """Rosenbrock function.
+
+    A function :math:`f\\colon \\mathbb{R}^{n} \\rightarrow \\mathbb{R}`
+    that takes an :math:`n`-vector as input and returns a scalar value.
+
+    .. math::
+
+        f(\\mathbf{x}) =
+        \\sum_{i=1}^{n-1} \\left(
+            100 (x_{i+1} - x_i^2)^2 + (1 - x_i)^2
+        \\right)
+
+    Parameters
+    ----------
+    x : array_like
+        The :math:`n`-vector.
+    validate : bool, default=True
+        Specify if the input should be validated with :func:`check_vector`.
+        Set to False for trusted input to reduce the call overhead.
+
+    Returns
+    -------
+    float
+        Function value at :math:`\\mathbf{x}`.
+
+    References
+    ----------
+    .. [1] "Test functions for optimization", Wikipedia,
+           `<https://en.wikipedia.org/wiki/Test_functions_for_optimization>`_
+
+    Examples
+    --------
+    >>> import fbench
+    >>> round(fbench.rosenbrock([0, 0]), 4)
+    1.0
+
+    >>> round(fbench.rosenbrock([1, 1]), 4)
+    0.0
+
+    >>> round(fbench.rosenbrock([1, 1, 1]), 4)
+    0.0
+
+    >>> round(fbench.rosenbrock([1, 2, 3]), 4)
+    201.0
+
+    >>> round(fbench.rosenbrock([3, 3]), 4)
+    3604.0
+    """
+    x = _as_small_vector(x, validate=validate, n_min=2)
+    if isinstance(x, list):
+        # plain float arithmetic as NumPy has a large overhead for scalars
+        return float(
+            sum(
+                [
+                    100 * (x2 - x1 * x1) * (x2 - x1 * x1) + (1 - x1) * (1 - x1)
+                    for x1, x2 in zip(x, x[1:])
+                ]
+            )
+        )
+
+    return float((100 * (x[1:] - x[:-1] ** 2) ** 2 + (1 - x[:-1]) ** 2).sum())
+
+
+def rosenbrock_batch(x, /, *, out=None, workspace=None):
+    """Rosenbrock function for a batch of vectors.
+
+    Vectorized counterpart of :func:`rosenbrock` that evaluates the function for
+    each row of an :math:`(m, n)`-matrix in a single pass.
+
+    Parameters
+    ----------
+    x : array_like
+        The :math:`(m, n)`-matrix whose rows are :math:`n`-vectors.
+    out : np.ndarray, default=None
+        Optionally supply an :math:`m`-vector to store the function values.
+    workspace : Workspace, default=None
+        Optionally supply a workspace to reuse its scratch arrays.
+        If None, scratch arrays are allocated per call.
+
+    Returns
+    -------
+    np.ndarray
+        The :math:`m`-vector of function values, which is ``out`` if supplied.
+        It has the floating-point dtype of ``x`` or float64 for other dtypes.
+
+    See Also
+    --------
+    rosenbrock : Rosenbrock function.
+
+    Examples
+    --------
+    >>> import fbench
+    >>> fbench.rosenbrock_batch([[0, 0], [1, 1]]).round(4)
+    array([1., 0.])
+    """
+    x = _as_float(fbench.check_matrix(x, n_min=2))
+    m, n = x.shape
+    out = _check_out(out, m, x.dtype)
+    x_head, x_tail = x[:, :-1], x[:, 1:]
+    tmp1 = _empty(workspace, "tmp1", (m, n - 1), x.dtype)
+    tmp2 = _empty(workspace, "tmp2", (m, n - 1), x.dtype)
+
+    # out = sum(100 (x_tail - x_head^2)^2 + (1 - x_head)^2)
+    np.square(x_head, out=tmp1)
+    np.subtract(x_tail, tmp1, out=tmp1)
+    np.square(tmp1, out=tmp1)
+    tmp1 *= 100
+    np.subtract(1, x_head, out=tmp2)
+    np.square(tmp2, out=tmp2)
+    tmp1 += tmp2
+    np.sum(tmp1, axis=1, out=out)
+    return out
+
+
+def rosenbrock_grad(x, /):
+    """Gradient of the Rosenbrock function.
+
+    .. math::
+
+        \\frac{\\partial f}{\\partial x_i} =
+        -400 x_i (x_{i+1} - x_i^2) - 2 (1 - x_i)
+        + 200 (x_i - x_{i-1}^2)
+
+    Parameters
+    ----------
+    x : array_like
+        The :math:`n`-vector or an :math:`(m, n)`-matrix whose rows are
+        :math:`n`-vectors.
+
+    Returns
+    -------
+    np.ndarray
+        Gradient at :math:`\\mathbf{x}` with the same shape as ``x``.
+
+    Notes
+    -----
+    The first term is omitted for :math:`i = n`
+    and the last term is omitted for :math:`i = 1`.
+
+    See Also
+    --------
+    rosenbrock : Rosenbrock function.
+
+    Examples
+    --------
+    >>> import fbench
+    >>> fbench.rosenbrock_grad([0, 0])
+    array([-2.,  0.])
+    """
+    x = _check_array(x, n_min=2)
+    x_head, x_tail = x[..., :-1], x[..., 1:]
+    r = x_tail - x_head**2
+    grad = np.zeros_like(x)
+    grad[..., :-1] = -400 * x_head * r - 2 * (1 - x_head)
+    grad[..., 1:] += 200 * r
+    return grad
+
+
+def rosenbrock_hess(x, /):
+    """Hessian of the Rosenbrock function.
+
+    For large :math:`n`, prefer :func:`rosenbrock_hessp`,
+    which never forms the :math:`n \\times n` matrix.
+
+    Parameters
+    ----------
+    x : array_like
+        The :math:`n`-vector.
+
+    Returns
+    -------
+    np.ndarray
+        The :math:`(n, n)` Hessian matrix at :math:`\\mathbf{x}`.
+
+    See Also
+    --------
+    rosenbrock : Rosenbrock function.
+    rosenbrock_grad : Gradient of the Rosenbrock function.
+
+    Examples
+    --------
+    >>> import fbench
+    >>> fbench.rosenbrock_hess([1, 1])
+    array([[ 802., -400.],
+           [-400.,  200.]])
+    """
+    x = _as_float(fbench.check_vector(x, n_min=2))
+    x_head, x_tail = x[:-1], x[1:]
+    diagonal = np.zeros_like(x)
+    diagonal[:-1] = 1200 * x_head**2 - 400 * x_tail + 2
+    diagonal[1:] += 200
+    off_diagonal = -400 * x_head
+    return np.diag(diagonal) + np.diag(off_diagonal, 1) + np.diag(off_diagonal, -1)
+
+
+def rosenbrock_hessp(x, p, /):
+    """Hessian-vector product of the Rosenbrock function.
+
+    Computes :math:`\\nabla^2 f(\\mathbf{x}) \\, \\mathbf{p}` without forming
+    the Hessian, in :math:`O(n)` time and memory.
+
+    Parameters
+    ----------
+    x : array_like
+        The :math:`n`-vector or an :math:`(m, n)`-matrix whose rows are
+        :math:`n`-vectors.
+    p : array_like
+        The vector to multiply with the Hessian, with the same shape as ``x``.
+
+    Returns
+    -------
+    np.ndarray
+        Hessian-vector product with the same shape as ``x``.
+
+    See Also
+    --------
+    rosenbrock_hess : Hessian of the Rosenbrock function.
+
+    Examples
+    --------
+    >>> import fbench
+    >>> fbench.rosenbrock_hessp([1, 1], [1, 0])
+    array([ 802., -400.])
+    """
+    x, p = _check_array_pair(x, p, n_min=2)
+    x_head, x_tail = x[..., :-1], x[..., 1:]
+    hp = np.zeros_like(x)
+    hp[..., :-1] = (1200 * x_head**2 - 400 * x_tail + 2) * p[..., :-1]
+    hp[..., :-1] -= 400 * x_head * p[..., 1:]
+    hp[..., 1:] += 200 * p[..., 1:] - 400 * x_head * p[..., :-1]
+    return hp
+
+
+def rosenbrock_value_and_grad(x, /):
+    """Value and gradient of the Rosenbrock function.
+
+    Computes :func:`rosenbrock` and :func:`rosenbrock_grad` in a single pass,
+    reusing intermediate terms of the function value for the gradient.
+    The terms :math:`x_{i+1} - x_i^2` and :math:`1 - x_i` are shared.
+
+    Parameters
+    ----------
+    x : array_like
+        The :math:`n`-vector or an :math:`(m, n)`-matrix whose rows are
+        :math:`n`-vectors.
+
+    Returns
+    -------
+    value : float or np.ndarray
+        Function value at :math:`\\mathbf{x}` if ``x`` is a vector,
+        otherwise the :math:`m`-vector of function values.
+    grad : np.ndarray
+        Gradient at :math:`\\mathbf{x}` with the same shape as ``x``.
+
+    See Also
+    --------
+    rosenbrock : Rosenbrock function.
+    rosenbrock_grad : Gradient of the Rosenbrock function.
+
+    Examples
+    --------
+    >>> import fbench
+    >>> fbench.rosenbrock_value_and_grad([0, 0])
+    (1.0, array([-2.,  0.]))
+    """
+    x = _check_array(x, n_min=2)
+    x_head, x_tail = x[..., :-1], x[..., 1:]
+    r = x_tail - x_head**2
+    d = 1 - x_head
+    value = (100 * r**2 + d**2).sum(axis=-1)
+    grad = np.zeros_like(x)
+    grad[..., :-1] = -400 * x_head * r - 2 * d
+    grad[..., 1:] += 200 * r
+    return _as_value(value), grad
+
+
+def schwefel(x, /, *, validate=True):
+    """Schwefel function.
+
+    A function :math:`f\\colon \\mathbb{R}^{n} \\rightarrow \\mathbb{R}`
+    that takes an :math:`n`-vector as input and returns a scalar value.
+
+    .. math::
+
+        f(\\mathbf{x}) =
+        418.9829 n - \\sum_{i=1}^{n} x_{i} \\sin\\left( \\sqrt{|x_{i}|} \\right)
+
+    Parameters
+    ----------
+    x : array_like
+        The :math:`n`-vector.
+    validate : bool, default=True
+        Specify if the input should be validated with :func:`check_vector`.
+        Set to False for trusted input to reduce the call overhead.
+
+    Returns
+    -------
+    float
+        Function value at :math:`\\mathbf{x}`.
+
+    References
+    ----------
+    .. [1] "Schwefel function", Virtual Library of Simulation Experiments:
+           Test Functions and Datasets, `<https://www.sfu.ca/~ssurjano/schwef.html>`_
+
+    Examples
+    --------
+    >>> import fbench
+    >>> round(fbench.schwefel([420.9687]), 4)
+    0.0
+
+    >>> round(fbench.schwefel([0, 0]), 4)
+    837.9658
+
+    >>> round(fbench.schwefel([1, 2]), 4)
+    835.1488
+
+    >>> round(fbench.schwefel([1, 2, 3]), 4)
+    1251.1706
+    """
+    x = _as_small_vector(x, validate=validate)
+    if isinstance(x, list):
+        # plain float arithmetic as NumPy has a large overhead for scalars
+        return float(
+            418.9829 * len(x) - sum([xi * math.sin(math.sqrt(abs(xi))) for xi in x])
+        )
+
+    n = len(x)
+    return float(418.9829 * n - sum(x * np.sin(np.sqrt(np.abs(x)))))
+
+
+def schwefel_batch(x, /, *, out=None, workspace=None):
+    """Schwefel function for a batch of vectors.
+
+    Vectorized counterpart of :func:`schwefel` that evaluates the function for
+    each row of an :math:`(m, n)`-matrix in a single pass.
+
+    Parameters
+    ----------
+    x : array_like
+        The :math:`(m, n)`-matrix whose rows are :math:`n`-vectors.
+    out : np.ndarray, default=None
+        Optionally supply an :math:`m`-vector to store the function values.
+    workspace : Workspace, default=None
+        Optionally supply a workspace to reuse its scratch arrays.
+        If None, scratch arrays are allocated per call.
+
+    Returns
+    -------
+    np.ndarray
+        The :math:`m`-vector of function values, which is ``out`` if supplied.
+        It has the floating-point dtype of ``x`` or float64 for other dtypes.
+
+    See Also
+    --------
+    schwefel : Schwefel function.
+
+    Examples
+    --------
+    >>> import fbench
+    >>> fbench.schwefel_batch([[0, 0], [1, 2]]).round(4)
+    array([837.9658, 835.1488])
+    """
+    x = _as_float(fbench.check_matrix(x))
+    m, n = x.shape
+    out = _check_out(out, m, x.dtype)
+    tmp = _empty(workspace, "tmp", x.shape, x.dtype)
+
+    # out = 418.9829 n - sum(x sin(sqrt(|x|)))
+    np.abs(x, out=tmp)
+    np.sqrt(tmp, out=tmp)
+    np.sin(tmp, out=tmp)
+    tmp *= x
+    np.sum(tmp, axis=1, out=out)
+    np.subtract(418.9829 * n, out, out=out)
+    return out
+
+
+def schwefel_grad(x, /):
+    """Gradient of the Schwefel function.
+
+    .. math::
+
+        \\frac{\\partial f}{\\partial x_i} =
+        - \\sin\\left( \\sqrt{|x_i|} \\right)
+        - \\frac{1}{2} \\sqrt{|x_i|} \\cos\\left( \\sqrt{|x_i|} \\right)
+
+    Parameters
+    ----------
+    x : array_like
+        The :math:`n`-vector or an :math:`(m, n)`-matrix whose rows are
+        :math:`n`-vectors.
+
+    Returns
+    -------
+    np.ndarray
+        Gradient at :math:`\\mathbf{x}` with the same shape as ``x``.
+
+    See Also
+    --------
+    schwefel : Schwefel function.
+
+    Examples
+    --------
+    >>> import fbench
+    >>> fbench.schwefel_grad([420.9687]).round(4)
+    array([-0.])
+    """
+    x = _check_array(x)
+    s = np.sqrt(np.abs(x))
+    return -np.sin(s) - 0.5 * s * np.cos(s)
+
+
+def schwefel_hess(x, /):
+    """Hessian of the Schwefel function.
+
+    For large :math:`n`, prefer :func:`schwefel_hessp`,
+    which never forms the :math:`n \\times n` matrix.
+
+    Parameters
+    ----------
+    x : array_like
+        The :math:`n`-vector.
+
+    Returns
+    -------
+    np.ndarray
+        The :math:`(n, n)` Hessian matrix at :math:`\\mathbf{x}`.
+
+    Notes
+    -----
+    The function is not twice differentiable at :math:`x_i = 0`,
+    where the corresponding diagonal entry is set to zero.
+
+    See Also
+    --------
+    schwefel : Schwefel function.
+    schwefel_grad : Gradient of the Schwefel function.
+
+    Examples
+    --------
+    >>> import fbench
+    >>> fbench.schwefel_hess([1, 4]).round(4)
+    array([[-0.1949,  0.    ],
+           [ 0.    ,  0.3834]])
+    """
+    x = _as_float(fbench.check_vector(x))
+    return np.diag(_schwefel_hess_diagonal(x))
+
+
+def schwefel_hessp(x, p, /):
+    """Hessian-vector product of the Schwefel function.
+
+    Computes :math:`\\nabla^2 f(\\mathbf{x}) \\, \\mathbf{p}` without forming
+    the Hessian, in :math:`O(n)` time and memory.
+
+    Parameters
+    ----------
+    x : array_like
+        The :math:`n`-vector or an :math:`(m, n)`-matrix whose rows are
+        :math:`n`-vectors.
+    p : array_like
+        The vector to multiply with the Hessian, with the same shape as ``x``.
+
+    Returns
+    -------
+    np.ndarray
+        Hessian-vector product with the same shape as ``x``.
+
+    Notes
+    -----
+    The function is not twice differentiable at :math:`x_i = 0`,
+    where the corresponding diagonal entry is set to zero.
+
+    See Also
+    --------
+    schwefel_hess : Hessian of the Schwefel function.
+
+    Examples
+    --------
+    >>> import fbench
+    >>> fbench.schwefel_hessp([1, 4], [1, 1]).round(4)
+    array([-0.1949,  0.3834])
+    """
+    x, p = _check_array_pair(x, p)
+    return _schwefel_hess_diagonal(x) * p
+
+
+def schwefel_value_and_grad(x, /):
+    """Value and gradient of the Schwefel function.
+
+    Computes :func:`schwefel` and :func:`schwefel_grad` in a single pass,
+    reusing intermediate terms of the function value for the gradient.
+    The terms :math:`\\sqrt{|x_i|}` and their sine are shared.
+
+    Parameters
+    ----------
+    x : array_like
+        The :math:`n`-vector or an :math:`(m, n)`-matrix whose rows are
+        :math:`n`-vectors.
+
+    Returns
+    -------
+    value : float or np.ndarray
+        Function value at :math:`\\mathbf{x}` if ``x`` is a vector,
+        otherwise the :math:`m`-vector of function values.
+    grad : np.ndarray
+        Gradient at :math:`\\mathbf{x}` with the same shape as ``x``.
+
+    See Also
+    --------
+    schwefel : Schwefel function.
+    schwefel_grad : Gradient of the Schwefel function.
+
+    Examples
+    --------
+    >>> import fbench
+    >>> fx, grad = fbench.schwefel_value_and_grad([0, 0])
+    >>> round(fx, 4), grad
+    (837.9658, array([-0., -0.]))
+    """
+    x = _check_array(x)
+    s = np.sqrt(np.abs(x))
+    sin_s = np.sin(s)
+    value = 418.9829 * x.shape[-1] - (x * sin_s).sum(axis=-1)
+    grad = -sin_s - 0.5 * s * np.cos(s)
+    return _as_value(value), grad
+
+
+def sinc(x, /, *, validate=True):
+    """Sinc function.
+
+    A function :math:`f\\colon \\mathbb{R}^{1} \\rightarrow \\mathbb{R}`
+    that takes an :math:`1`-vector as input and returns a scalar value.
+
+    .. math::
+
+        f(\\mathbf{x}) =
+        \\begin{cases}
+            \\frac{\\sin(x)}{x} & \\text{ if } x \\neq 0 \\\\
+            1 & \\text{ if } x = 0
+        \\end{cases}
+
+    Parameters
+    ----------
+    x : array_like
+        The :math:`1`-vector.
+    validate : bool, default=True
+        Specify if the input should be validated with :func:`check_vector`.
+        Set to False for trusted input to reduce the call overhead.
+
+    Returns
+    -------
+    float
+        Function value at :math:`\\mathbf{x}`.
+
+    References
+    ----------
+    .. [1] "Sinc Function", Wolfram MathWorld,
+           `<https://mathworld.wolfram.com/SincFunction.html>`_
+
+    Examples
+    --------
+    >>> import fbench
+    >>> fbench.sinc([0])
+    1.0
+
+    >>> round(fbench.sinc([1]), 4)
+    0.8415
+    """
+    if validate:
+        x = fbench.check_vector(x, n_max=1).tolist()
+
+    (x,) = x
+    if x == 0:
+        return 1.0
+    return math.sin(x) / x if math.isfinite(x) else math.nan
+
+
+def sinc_batch(x, /, *, out=None, workspace=None):
+    """Sinc function for a batch of vectors.
+
+    Vectorized counterpart of :func:`sinc` that evaluates the function for
+    each row of an :math:`(m, 1)`-matrix in a single pass.
+
+    Parameters
+    ----------
+    x : array_like
+        The :math:`(m, 1)`-matrix whose rows are :math:`1`-vectors.
+    out : np.ndarray, default=None
+        Optionally supply an :math:`m`-vector to store the function values.
+    workspace : Workspace, default=None
+        Optionally supply a workspace to reuse its scratch arrays.
+        If None, scratch arrays are allocated per call.
+
+    Returns
+    -------
+    np.ndarray
+        The :math:`m`-vector of function values, which is ``out`` if supplied.
+        It has the floating-point dtype of ``x`` or float64 for other dtypes.
+
+    See Also
+    --------
+    sinc : Sinc function.
+
+    Examples
+    --------
+    >>> import fbench
+    >>> fbench.sinc_batch([[0], [1]]).round(4)
+    array([1.    , 0.8415])
+    """
+    x = _as_float(fbench.check_matrix(x, n_min=1, n_max=1))[:, 0]
+    out = _check_out(out, len(x), x.dtype)
+    nonzero = _empty(workspace, "nonzero", x.shape, bool)
+
+    np.not_equal(x, 0, out=nonzero)
+    np.sin(x, out=out)
+    np.divide(out, x, out=out, where=nonzero)
+    np.logical_not(nonzero, out=nonzero)
+    np.copyto(out, 1, where=nonzero)
+    return out
+
+
+def sinc_grad(x, /):
+    """Gradient of the Sinc function.
+
+    .. math::
+
+        f'(x) =
+        \\begin{cases}
+            \\frac{x \\cos(x) - \\sin(x)}{x^2} & \\text{ if } x \\neq 0 \\\\
+            0 & \\text{ if } x = 0
+        \\end{cases}
+
+    Parameters
+    ----------
+    x : array_like
+        The :math:`1`-vector or an :math:`(m, 1)`-matrix whose rows are
+        :math:`1`-vectors.
+
+    Returns
+    -------
+    np.ndarray
+        Gradient at :math:`\\mathbf{x}` with the same shape as ``x``.
+
+    See Also
+    --------
+    sinc : Sinc function.
+
+    Examples
+    --------
+    >>> import fbench
+    >>> fbench.sinc_grad([0])
+    array([0.])
+    """
+    x = _check_array(x, n_min=1, n_max=1)
+    grad = np.zeros_like(x)
+    nonzero = x != 0
+    x_nonzero = x[nonzero]
+    grad[nonzero] = (x_nonzero * np.cos(x_nonzero) - np.sin(x_nonzero)) / x_nonzero**2
+    return grad
+
+
+def sinc_hess(x, /):
+    """Hessian of the Sinc function.
+
+    Parameters
+    ----------
+    x : array_like
+        The :math:`1`-vector.
+
+    Returns
+    -------
+    np.ndarray
+        The :math:`(1, 1)` Hessian matrix at :math:`\\mathbf{x}`.
+
+    See Also
+    --------
+    sinc : Sinc function.
+    sinc_grad : Gradient of the Sinc function.
+
+    Examples
+    --------
+    >>> import fbench
+    >>> fbench.sinc_hess([0]).round(4)
+    array([[-0.3333]])
+    """
+    x = _as_float(fbench.check_vector(x, n_min=1, n_max=1))[0]
+    if x == 0:
+        return np.array([[-1 / 3]])
+    return np.array([[((2 - x**2) * np.sin(x) - 2 * x * np.cos(x)) / x**3]])
+
+
+def sinc_value_and_grad(x, /):
+    """Value and gradient of the Sinc function.
+
+    Computes :func:`sinc` and :func:`sinc_grad` in a single pass,
+    reusing intermediate terms of the function value for the gradient.
+    The function value is reused to compute the derivative.
+
+    Parameters
+    ----------
+    x : array_like
+        The :math:`1`-vector or an :math:`(m, 1)`-matrix whose rows are
+        :math:`1`-vectors.
+
+    Returns
+    -------
+    value : float or np.ndarray
+        Function value at :math:`\\mathbf{x}` if ``x`` is a vector,
+        otherwise the :math:`m`-vector of function values.
+    grad : np.ndarray
+        Gradient at :math:`\\mathbf{x}` with the same shape as ``x``.
+
+    See Also
+    --------
+    sinc : Sinc function.
+    sinc_grad : Gradient of the Sinc function.
+
+    Examples
+    --------
+    >>> import fbench
+    >>> fbench.sinc_value_and_grad([0])
+    (1.0, array([0.]))
+    """
+    x = _check_array(x, n_min=1, n_max=1)
+    value = np.ones_like(x)
+    grad = np.zeros_like(x)
+    nonzero = x != 0
+    x_nonzero = x[nonzero]
+    value[nonzero] = np.sin(x_nonzero) / x_nonzero
+    grad[nonzero] = (np.cos(x_nonzero) - value[nonzero]) / x_nonzero
+    return _as_value(value[..., 0]), grad
+
+
+def sphere(x, /, *, validate=True):
+    """Sphere function.
+
+    A function :math:`f\\colon \\mathbb{R}^{n} \\rightarrow \\mathbb{R}`
+    that takes an :math:`n`-vector as input and returns a scalar value.
+
+    .. math::
+
+       f(\\mathbf{x}) = \\sum_{i=1}^{n} x_i^2
+
+    Parameters
+    ----------
+    x : array_like
+        The :math:`n`-vector.
+    validate : bool, default=True
+        Specify if the input should be validated with :func:`check_vector`.
+        Set to False for trusted input to reduce the call overhead.
+
+    Returns
+    -------
+    float
+        Function value at :math:`\\mathbf{x}`.
+
+    References
+    ----------
+    .. [1] "Test functions for optimization", Wikipedia,
+           `<https://en.wikipedia.org/wiki/Test_functions_for_optimization>`_
 
     Examples
     --------
@@ -445,5 +2100,414 @@ def sphere(x, /):
     >>> fbench.sphere([1, 2, 3])
     14.0
     """
-    x = fbench.check_vector(x)
+    x = _as_small_vector(x, validate=validate)
+    if isinstance(x, list):
+        # plain float arithmetic as NumPy has a large overhead for scalars
+        return float(sum([xi * xi for xi in x]))
+
     return float((x**2).sum())
+
+
+def sphere_batch(x, /, *, out=None, workspace=None):
+    """Sphere function for a batch of vectors.
+
+    Vectorized counterpart of :func:`sphere` that evaluates the function for
+    each row of an :math:`(m, n)`-matrix in a single pass.
+
+    Parameters
+    ----------
+    x : array_like
+        The :math:`(m, n)`-matrix whose rows are :math:`n`-vectors.
+    out : np.ndarray, default=None
+        Optionally supply an :math:`m`-vector to store the function values.
+    workspace : Workspace, default=None
+        Optionally supply a workspace to reuse its scratch arrays.
+        If None, scratch arrays are allocated per call.
+
+    Returns
+    -------
+    np.ndarray
+        The :math:`m`-vector of function values, which is ``out`` if supplied.
+        It has the floating-point dtype of ``x`` or float64 for other dtypes.
+
+    See Also
+    --------
+    sphere : Sphere function.
+
+    Examples
+    --------
+    >>> import fbench
+    >>> fbench.sphere_batch([[0, 0], [1, 2]])
+    array([0., 5.])
+    """
+    x = _as_float(fbench.check_matrix(x))
+    out = _check_out(out, len(x), x.dtype)
+    tmp = _empty(workspace, "tmp", x.shape, x.dtype)
+
+    np.square(x, out=tmp)
+    np.sum(tmp, axis=1, out=out)
+    return out
+
+
+def sphere_grad(x, /):
+    """Gradient of the Sphere function.
+
+    .. math::
+
+        \\frac{\\partial f}{\\partial x_i} = 2 x_i
+
+    Parameters
+    ----------
+    x : array_like
+        The :math:`n`-vector or an :math:`(m, n)`-matrix whose rows are
+        :math:`n`-vectors.
+
+    Returns
+    -------
+    np.ndarray
+        Gradient at :math:`\\mathbf{x}` with the same shape as ``x``.
+
+    See Also
+    --------
+    sphere : Sphere function.
+
+    Examples
+    --------
+    >>> import fbench
+    >>> fbench.sphere_grad([[1, 2], [3, 4]])
+    array([[2., 4.],
+           [6., 8.]])
+    """
+    x = _check_array(x)
+    return 2 * x
+
+
+def sphere_hess(x, /):
+    """Hessian of the Sphere function.
+
+    For large :math:`n`, prefer :func:`sphere_hessp`,
+    which never forms the :math:`n \\times n` matrix.
+
+    Parameters
+    ----------
+    x : array_like
+        The :math:`n`-vector.
+
+    Returns
+    -------
+    np.ndarray
+        The :math:`(n, n)` Hessian matrix at :math:`\\mathbf{x}`.
+
+    See Also
+    --------
+    sphere : Sphere function.
+    sphere_grad : Gradient of the Sphere function.
+
+    Examples
+    --------
+    >>> import fbench
+    >>> fbench.sphere_hess([1, 2])
+    array([[2., 0.],
+           [0., 2.]])
+    """
+    x = _as_float(fbench.check_vector(x))
+    return np.diag(np.full_like(x, 2))
+
+
+def sphere_hessp(x, p, /):
+    """Hessian-vector product of the Sphere function.
+
+    Computes :math:`\\nabla^2 f(\\mathbf{x}) \\, \\mathbf{p}` without forming
+    the Hessian, in :math:`O(n)` time and memory.
+
+    Parameters
+    ----------
+    x : array_like
+        The :math:`n`-vector or an :math:`(m, n)`-matrix whose rows are
+        :math:`n`-vectors.
+    p : array_like
+        The vector to multiply with the Hessian, with the same shape as ``x``.
+
+    Returns
+    -------
+    np.ndarray
+        Hessian-vector product with the same shape as ``x``.
+
+    See Also
+    --------
+    sphere_hess : Hessian of the Sphere function.
+
+    Examples
+    --------
+    >>> import fbench
+    >>> fbench.sphere_hessp([[1, 2], [3, 4]], [[1, 0], [0, 1]])
+    array([[2., 0.],
+           [0., 2.]])
+    """
+    x, p = _check_array_pair(x, p)
+    return 2 * p
+
+
+def sphere_value_and_grad(x, /):
+    """Value and gradient of the Sphere function.
+
+    Computes :func:`sphere` and :func:`sphere_grad` in a single pass,
+    reusing intermediate terms of the function value for the gradient.
+
+    Parameters
+    ----------
+    x : array_like
+        The :math:`n`-vector or an :math:`(m, n)`-matrix whose rows are
+        :math:`n`-vectors.
+
+    Returns
+    -------
+    value : float or np.ndarray
+        Function value at :math:`\\mathbf{x}` if ``x`` is a vector,
+        otherwise the :math:`m`-vector of function values.
+    grad : np.ndarray
+        Gradient at :math:`\\mathbf{x}` with the same shape as ``x``.
+
+    See Also
+    --------
+    sphere : Sphere function.
+    sphere_grad : Gradient of the Sphere function.
+
+    Examples
+    --------
+    >>> import fbench
+    >>> fbench.sphere_value_and_grad([1, 2])
+    (5.0, array([2., 4.]))
+    """
+    x = _check_array(x)
+    return _as_value((x**2).sum(axis=-1)), 2 * x
+
+
+def _check_array_pair(x, p, /, *, n_min=1, n_max=np.inf):
+    """Validate point and direction of a Hessian-vector product."""
+    x = _check_array(x, n_min=n_min, n_max=n_max)
+    p = _as_float(np.asarray(p))
+    if p.shape != x.shape:
+        raise TypeError(f"p must have shape={x.shape} - it has shape={p.shape}")
+    return x, p
+
+
+def _schwefel_hess_diagonal(x, /):
+    """Diagonal of the Schwefel Hessian, which is zero where ``x`` is zero."""
+    s = np.sqrt(np.abs(x))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        diagonal = np.sign(x) * (0.25 * s * np.sin(s) - 0.75 * np.cos(s)) / s
+    return np.where(x != 0, diagonal, 0)
+
+
+_PLAIN_N_MAX = 16
+
+
+def _as_small_vector(x, /, *, validate, n_min=1):
+    """Convert a small, finite vector to a sequence of Python numbers.
+
+    Larger or non-finite vectors are returned as arrays since NumPy is faster on
+    long vectors and handles non-finite values without raising.
+    """
+    if validate:
+        x = fbench.check_vector(x, n_min=n_min)
+    if len(x) > _PLAIN_N_MAX:
+        return np.asarray(x)
+
+    if isinstance(x, np.ndarray):
+        x = x.tolist()
+    return x if math.isfinite(sum(x)) else np.asarray(x)
+
+
+def _check_out(out, m, dtype, /):
+    """Validate output array of a batch function or allocate a new one."""
+    if out is None:
+        return np.empty(m, dtype=dtype)
+
+    if out.shape != (m,):
+        raise TypeError(f"out must have shape=({m},) - it has shape={out.shape}")
+
+    if not np.can_cast(dtype, out.dtype, "same_kind"):
+        raise TypeError(f"cannot store {dtype} values in out with dtype={out.dtype}")
+
+    return out
+
+
+def _empty(workspace, name, shape, dtype, /):
+    """Get scratch array from workspace or allocate a new one."""
+    if workspace is None:
+        return np.empty(shape, dtype=dtype)
+    return workspace.get(name, shape, dtype)
+
+
+def _as_value(value, /):
+    """Convert function value of a vector to float, keep batch values as array."""
+    return float(value) if np.ndim(value) == 0 else value
+
+
+def _check_array(x, /, *, n_min=1, n_max=np.inf):
+    """Validate :math:`n`-vector or :math:`(m, n)`-matrix and cast it to float."""
+    x = np.asarray(x)
+    check = fbench.check_matrix if x.ndim == 2 else fbench.check_vector
+    return _as_float(check(x, n_min=n_min, n_max=n_max))
+
+
+def _as_float(x, /):
+    """Cast non-floating arrays to float, keeping floating dtypes as they are."""
+    return x if np.issubdtype(x.dtype, np.floating) else x.astype(float)
+
+
+def _rastrigin_term(x, /):
+    """Elementwise term of the Rastrigin function."""
+    x = _as_float(np.asarray(x))
+    return x**2 - 10 * np.cos(2 * np.pi * x) + 10
+
+
+def _schwefel_term(x, /):
+    """Elementwise term of the Schwefel function."""
+    x = _as_float(np.asarray(x))
+    return 418.9829 - x * np.sin(np.sqrt(np.abs(x)))
+
+
+def _sinc_term(x, /):
+    """Elementwise term of the Sinc function."""
+    x = np.asarray(x)
+    return sinc_batch(x.reshape(-1, 1)).reshape(x.shape)
+
+
+def _sphere_term(x, /):
+    """Elementwise term of the Sphere function."""
+    x = _as_float(np.asarray(x))
+    return x**2
+
+
+def _cache_optima(optima, /):
+    """Build optima lazily and cache them per number of dimensions."""
+
+    @functools.lru_cache(maxsize=32)
+    def get_optima(n, /):
+        output = []
+        for x, fx in optima(n):
+            x = fbench.check_vector(x)
+            x.flags.writeable = False
+            output.append(fbench.structure.Optimum(x, fx))
+        return tuple(output)
+
+    return get_optima
+
+
+def _create_benchmarks():
+    """Create lookup table of benchmarks by function and by name."""
+    benchmarks = (
+        fbench.structure.Benchmark(
+            name="ackley",
+            func=ackley,
+            batch=ackley_batch,
+            n_min=1,
+            n_max=np.inf,
+            bounds=(-32.768, 32.768),
+            separable=False,
+            term=None,
+            symmetry=("mirror", "permutation"),
+            get_optima=_cache_optima(lambda n: [(np.zeros(n, dtype=int), 0)]),
+        ),
+        fbench.structure.Benchmark(
+            name="beale",
+            func=beale,
+            batch=beale_batch,
+            n_min=2,
+            n_max=2,
+            bounds=(-4.5, 4.5),
+            separable=False,
+            term=None,
+            symmetry=(),
+            get_optima=_cache_optima(lambda n: [([3, 0.5], 0)]),
+        ),
+        fbench.structure.Benchmark(
+            name="peaks",
+            func=peaks,
+            batch=peaks_batch,
+            n_min=2,
+            n_max=2,
+            bounds=(-4, 4),
+            separable=False,
+            term=None,
+            symmetry=(),
+            get_optima=_cache_optima(
+                lambda n: [
+                    ([0.228279999979237, -1.625531071954464], -6.551133332622496),
+                ]
+            ),
+        ),
+        fbench.structure.Benchmark(
+            name="rastrigin",
+            func=rastrigin,
+            batch=rastrigin_batch,
+            n_min=1,
+            n_max=np.inf,
+            bounds=(-5.12, 5.12),
+            separable=True,
+            term=_rastrigin_term,
+            symmetry=("mirror", "permutation"),
+            get_optima=_cache_optima(lambda n: [(np.zeros(n, dtype=int), 0)]),
+        ),
+        fbench.structure.Benchmark(
+            name="rosenbrock",
+            func=rosenbrock,
+            batch=rosenbrock_batch,
+            n_min=2,
+            n_max=np.inf,
+            bounds=(-5, 10),
+            separable=False,
+            term=None,
+            symmetry=(),
+            get_optima=_cache_optima(lambda n: [(np.ones(n, dtype=int), 0)]),
+        ),
+        fbench.structure.Benchmark(
+            name="schwefel",
+            func=schwefel,
+            batch=schwefel_batch,
+            n_min=1,
+            n_max=np.inf,
+            bounds=(-500, 500),
+            separable=True,
+            term=_schwefel_term,
+            symmetry=("permutation",),
+            get_optima=_cache_optima(lambda n: [(np.full(n, 420.9687), 0)]),
+        ),
+        fbench.structure.Benchmark(
+            name="sinc",
+            func=sinc,
+            batch=sinc_batch,
+            n_min=1,
+            n_max=1,
+            bounds=(-100, 100),
+            separable=True,
+            term=_sinc_term,
+            symmetry=("mirror",),
+            get_optima=_cache_optima(
+                lambda n: [
+                    ([-4.493409471849579], -0.217233628211222),
+                    ([4.493409471849579], -0.217233628211222),
+                ]
+            ),
+        ),
+        fbench.structure.Benchmark(
+            name="sphere",
+            func=sphere,
+            batch=sphere_batch,
+            n_min=1,
+            n_max=np.inf,
+            bounds=(-5.12, 5.12),
+            separable=True,
+            term=_sphere_term,
+            symmetry=("mirror", "permutation"),
+            get_optima=_cache_optima(lambda n: [(np.zeros(n, dtype=int), 0)]),
+        ),
+    )
+    lookup = {benchmark.name: benchmark for benchmark in benchmarks}
+    lookup.update({benchmark.func: benchmark for benchmark in benchmarks})
+    return lookup
+
+
+_BENCHMARKS = _create_benchmarks()
@@ -1,14 +1,91 @@
-from typing import NamedTuple
+import pathlib
+from typing import Callable, NamedTuple, Optional, Sequence, Tuple
 
 import numpy as np
 
 __all__ = (
+    "Benchmark",
+    "CacheInfo",
+    "ContourGeometry",
     "CoordinateMatrices",
     "CoordinatePairs",
+    "EvaluationStats",
     "Optimum",
+    "RenderResult",
+    "Workspace",
 )
 
 
+class Benchmark(NamedTuple):
+    """An immutable data structure for a benchmark function and its metadata.
+
+    Attributes
+    ----------
+    name : str
+        The name of the benchmark function.
+    func : callable
+        The benchmark function.
+    batch : callable
+        The batch counterpart of the benchmark function.
+    n_min : int
+        The minimum number of dimensions :math:`n`.
+    n_max : int
+        The maximum number of dimensions :math:`n`.
+    bounds : tuple[float, float]
+        The recommended ``(min, max)`` bounds for each element of the vector.
+    separable : bool
+        Whether the function is a sum of terms that each depend on one element.
+    term : callable or None
+        The elementwise term :math:`g` of a separable function, i.e.,
+        :math:`f(x) = \\sum_{i=1}^{n} g(x_i)`, or None if it is not separable.
+    symmetry : tuple[str, ...]
+        The symmetries of the function: ``"mirror"`` if the function value does
+        not change when an element changes its sign, and ``"permutation"`` if
+        it does not change when elements are swapped.
+    get_optima : Callable[[int], Sequence[Optimum]]
+        Returns the optima with :math:`n` dimensions.
+        Optima are built on first request and cached per :math:`n`.
+    """
+
+    name: str
+    func: Callable
+    batch: Optional[Callable]
+    n_min: int
+    n_max: float
+    bounds: Tuple[float, float]
+    separable: bool
+    term: Optional[Callable]
+    symmetry: Tuple[str, ...]
+    get_optima: Callable[[int], Sequence["Optimum"]]
+
+
+class CacheInfo(NamedTuple):
+    """An immutable data structure for the statistics of an evaluation cache."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class ContourGeometry(NamedTuple):
+    """An immutable data structure for the polygons of filled contours.
+
+    Attributes
+    ----------
+    levels : np.ndarray
+        The contour levels.
+    allsegs : list[list[np.ndarray]]
+        The polygon vertices of each region between two consecutive levels.
+    allkinds : list[list[np.ndarray]]
+        The path codes of the polygon vertices of each region.
+    """
+
+    levels: np.ndarray
+    allsegs: list
+    allkinds: list
+
+
 class CoordinateMatrices(NamedTuple):
     """An immutable data structure for X, Y, Z coordinate matrices."""
 
@@ -16,6 +93,51 @@ class CoordinateMatrices(NamedTuple):
     y: np.ndarray
     z: np.ndarray
 
+    @classmethod
+    def from_axes(cls, x_coord, y_coord, z):
+        """Create coordinate matrices from coordinate vectors.
+
+        The X and Y coordinate matrices are read-only broadcast views of the
+        coordinate vectors. Hence, they take no memory beyond the vectors, and
+        pickling only stores the vectors and the Z coordinate matrix.
+
+        Parameters
+        ----------
+        x_coord : np.ndarray
+            An one-dimensional array for the x-coordinates of the grid.
+        y_coord : np.ndarray
+            An one-dimensional array for the y-coordinates of the grid.
+        z : np.ndarray
+            The z-coordinates of shape ``(len(y_coord), len(x_coord))``.
+
+        Returns
+        -------
+        CoordinateMatrices
+            The coordinate matrices.
+
+        Examples
+        --------
+        >>> import fbench
+        >>> import numpy as np
+        >>> coord = fbench.structure.CoordinateMatrices.from_axes(
+        ...     np.array([0, 1, 2]), np.array([3, 4]), np.zeros((2, 3))
+        ... )
+        >>> coord.y
+        array([[3, 3, 3],
+               [4, 4, 4]])
+        >>> coord.y.strides
+        (8, 0)
+        """
+        shape = (len(y_coord), len(x_coord))
+        x = np.broadcast_to(x_coord, shape)
+        y = np.broadcast_to(np.reshape(y_coord, (-1, 1)), shape)
+        return cls(x, y, z)
+
+    def __reduce__(self):
+        if _is_broadcast_axis(self.x, 0) and _is_broadcast_axis(self.y, 1):
+            return type(self).from_axes, (self.x[0], self.y[:, 0], self.z)
+        return type(self), tuple(self)
+
 
 class CoordinatePairs(NamedTuple):
     """An immutable data structure for (x, y) pairs."""
@@ -24,6 +146,31 @@ class CoordinatePairs(NamedTuple):
     y: np.ndarray
 
 
+class EvaluationStats(NamedTuple):
+    """An immutable data structure for the evaluation statistics of a function.
+
+    Attributes
+    ----------
+    n_calls : int
+        The number of function calls.
+    n_points : int
+        The number of evaluated points, where a batch call counts all its rows.
+    total_time : float
+        The total wall time of all calls in seconds.
+    bin_edges : tuple[float, ...]
+        The edges of the wall-time histogram bins in seconds.
+    histogram : tuple[int, ...]
+        The number of calls per wall-time bin. Calls outside of the bin edges
+        are counted in the first or last bin, respectively.
+    """
+
+    n_calls: int
+    n_points: int
+    total_time: float
+    bin_edges: Tuple[float, ...]
+    histogram: Tuple[int, ...]
+
+
 class Optimum(NamedTuple):
     """Define optimum for :math:`f\\colon \\mathbb{R}^{n} \\rightarrow \\mathbb{R}`."""
 
@@ -34,3 +181,90 @@ class Optimum(NamedTuple):
     def n(self):
         """Dimensionality of :math:`x`."""
         return len(self.x)
+
+
+class RenderResult(NamedTuple):
+    """An immutable data structure for the result of rendering a plot to a file.
+
+    Attributes
+    ----------
+    path : pathlib.Path
+        The path of the image file.
+    evaluation_time : float
+        The wall time to evaluate the grid in seconds.
+    plotting_time : float
+        The wall time to plot the figure and save it to the file in seconds.
+    """
+
+    path: pathlib.Path
+    evaluation_time: float
+    plotting_time: float
+
+
+class Workspace:
+    """A mutable collection of reusable scratch arrays.
+
+    The batch functions of fBench accept a workspace to hold their intermediate
+    results. A scratch array is allocated on first request and its memory is
+    reused by later requests with the same name and dtype that need at most
+    as many elements. Hence, repeated calls on batches of the same or smaller
+    size allocate no temporary arrays.
+
+    Examples
+    --------
+    >>> import fbench
+    >>> import numpy as np
+    >>> workspace = fbench.structure.Workspace()
+    >>> out = np.empty(2)
+    >>> fbench.sphere_batch([[1.0, 2.0], [3.0, 4.0]], out=out, workspace=workspace)
+    array([ 5., 25.])
+    >>> workspace.nbytes
+    32
+    """
+
+    def __init__(self):
+        self._buffers = dict()
+
+    def __repr__(self):
+        return f"{type(self).__name__}(nbytes={self.nbytes})"
+
+    @property
+    def nbytes(self):
+        """Total number of bytes held by the scratch arrays."""
+        return sum(buffer.nbytes for buffer in self._buffers.values())
+
+    def get(self, name, shape, dtype):
+        """Get scratch array.
+
+        Parameters
+        ----------
+        name : str
+            The name of the scratch array.
+        shape : tuple[int, ...]
+            The shape of the scratch array.
+        dtype : data-type
+            The dtype of the scratch array.
+
+        Returns
+        -------
+        np.ndarray
+            An uninitialized array with the requested shape and dtype.
+        """
+        dtype = np.dtype(dtype)
+        size = int(np.prod(shape))
+        buffer = self._buffers.get((name, dtype))
+
+        if buffer is None or buffer.size < size:
+            buffer = np.empty(size, dtype=dtype)
+            self._buffers[(name, dtype)] = buffer
+
+        return buffer[:size].reshape(shape)
+
+    def clear(self):
+        """Release all scratch arrays."""
+        self._buffers.clear()
+
+
+def _is_broadcast_axis(a, axis, /):
+    """Check if matrix ``a`` repeats a vector along ``axis`` without memory."""
+    return isinstance(a, np.ndarray) and a.ndim == 2 and a.strides[axis] == 0
@@ -1,6 +1,53 @@
 import numpy as np
 
-__all__ = ("check_vector",)
+__all__ = (
+    "check_matrix",
+    "check_vector",
+)
+
+
+def check_matrix(x, /, *, n_min=1, n_max=np.inf):
+    """Validate :math:`(m, n)`-matrix.
+
+    Each of the :math:`m` rows of the matrix represents an :math:`n`-vector.
+
+    Parameters
+    ----------
+    x : array_like
+        The input object to be validated to represent an :math:`(m, n)`-matrix.
+    n_min : int, default=1
+        Specify the minimum number of :math:`n`.
+    n_max : int, default=inf
+        Specify the maximum number of :math:`n`.
+
+    Returns
+    -------
+    np.ndarray
+        The :math:`(m, n)`-matrix.
+
+    Raises
+    ------
+    TypeError
+        - If ``x`` is not matrix-like.
+        - If ``n`` is not between ``n_min`` and ``n_max``.
+
+    Examples
+    --------
+    >>> import fbench
+    >>> fbench.check_matrix([[0, 0], [1, 1]])
+    array([[0, 0],
+           [1, 1]])
+    """
+    x = np.asarray(x)
+
+    if len(x.shape) != 2:
+        raise TypeError(f"input must be a matrix-like object - it has shape={x.shape}")
+
+    n = x.shape[1]
+    if not (n_min <= n <= n_max):
+        raise TypeError(f"n={n} is not between n_min={n_min} and n_max={n_max}")
+
+    return x
 
 
 def check_vector(x, /, *, n_min=1, n_max=np.inf):
@@ -32,9 +79,12 @@ def check_vector(x, /, *, n_min=1, n_max=np.inf):
     >>> fbench.check_vector([0, 0])
     array([0, 0])
     """
-    x = np.atleast_1d(x)
+    x = np.asarray(x)
+
+    if x.ndim == 0:
+        x = x.reshape(1)
 
-    if len(x.shape) != 1:
+    if x.ndim != 1:
         raise TypeError(f"input must be a vector-like object - it has shape={x.shape}")
 
     if not (n_min <= len(x) <= n_max):
@@ -1,26 +1,64 @@
+import collections
+import concurrent.futures
+import hashlib
+import itertools
+import math
+import multiprocessing
+import os
+import pathlib
+import sys
+import time
+import types
 from enum import Enum
 
+import contourpy
+import matplotlib.artist
+import matplotlib.collections
+import matplotlib.contour
 import matplotlib.pyplot as plt
+import matplotlib.ticker
 import numpy as np
 import toolz
 from mpl_toolkits.axes_grid1 import make_axes_locatable
+from mpl_toolkits.mplot3d import art3d
 
 import fbench
 
 __all__ = (
     "VizConfig",
     "FunctionPlotter",
+    "GridCache",
+    "TileCache",
+    "ZoomRenderer",
+    "create_contour_geometry",
     "create_contour_plot",
     "create_coordinates2d",
     "create_coordinates3d",
     "create_line_plot",
     "create_surface_plot",
     "create_discrete_cmap",
+    "create_heatmap_plot",
     "get_1d_plotter",
     "get_2d_plotter",
     "plot_optima",
+    "render_plotters",
 )
 
+# plotters of the current render worker process, see render_plotters()
+_RENDER_PLOTTERS = dict()
+
+# bytes per grid point of a block: two float64 coordinates and a float64 value
+_GRID_POINT_NBYTES = 3 * 8
+
+# number of grid points per axis that adaptive refinement starts from
+_ADAPTIVE_COARSE_POINTS = 17
+
+# maximum number of grid points per axis for the contour lines of a heatmap
+_HEATMAP_CONTOUR_POINTS = 501
+
+# maximum number of grid points per axis for the surface plot next to a heatmap
+_HEATMAP_SURFACE_POINTS = 201
+
 
 class VizConfig(Enum):
     """Visualization configurations."""
@@ -69,6 +107,39 @@ class VizConfig(Enum):
         output.update(cls.get_kws_contourf__base())
         return output
 
+    @classmethod
+    def get_kws_imshow__base(cls):
+        """Returns kwargs for ``.imshow()``: base configuration."""
+        return dict(
+            origin="lower",
+            aspect="auto",
+            interpolation="nearest",
+            alpha=0.61803,
+            zorder=0,
+        )
+
+    @classmethod
+    def get_kws_imshow__YlOrBr(cls):
+        """Returns kwargs for ``.imshow()``:
+        ``YlOrBr`` configuration for dark max.
+        """
+        output = dict(
+            cmap=plt.get_cmap("YlOrBr"),
+        )
+        output.update(cls.get_kws_imshow__base())
+        return output
+
+    @classmethod
+    def get_kws_imshow__YlOrBr_r(cls):
+        """Returns kwargs for ``.imshow()``:
+        ``YlOrBr_r`` configuration for dark min.
+        """
+        output = dict(
+            cmap=plt.get_cmap("YlOrBr_r"),
+        )
+        output.update(cls.get_kws_imshow__base())
+        return output
+
     @classmethod
     def get_kws_plot__base(cls):
         """Returns kwargs for ``.plot()``: base configuration."""
@@ -129,6 +200,8 @@ class FunctionPlotter:
     ----------
     func : callable
         The function to plot.
+        If it is batch-capable (see :func:`fbench.batchable`),
+        the grid is evaluated in a single vectorized call.
     bounds : sequence
         A sequence of ``(min, max)`` pairs for each element of the vector.
     with_surface : bool, default=True
@@ -168,6 +241,39 @@ class FunctionPlotter:
         ``mpl_toolkits.mplot3d.axes3d.Axes3D.scatter``.
         By default, using configuration: ``VizConfig.get_kws_scatter__base()``.
         Optionally specify a dict of keyword arguments to update configurations.
+    n_workers : int, default=1
+        Specify the number of worker processes to evaluate the grid points.
+        If None, the number of CPUs is used.
+        See :func:`create_coordinates3d` for details.
+    chunk_size : int, default=None
+        Specify the number of grid points each worker evaluates per task.
+        If None, the grid points are split into four tasks per worker.
+    max_memory : int, default=None
+        Specify the approximate number of bytes for the grid points that are
+        evaluated at once. See :func:`create_coordinates3d` for details.
+    symmetry : sequence of str, default=None
+        Specify the symmetries of the function to evaluate fewer grid points.
+        See :func:`create_coordinates3d` for details.
+    cache : GridCache, default=None
+        Optionally supply a persistent cache to load the evaluated grid from
+        and to save it to. See :class:`GridCache` for details.
+    with_heatmap : bool, default=False
+        Specify if the contour plot should be a heatmap of the function values
+        with contour lines, see :func:`create_heatmap_plot`.
+        This renders dense grids much faster than filled contours.
+        The surface plot, including the filled contours on its floor, is then
+        drawn on a subgrid with at most 201 points per axis.
+    kws_imshow : dict of keyword arguments, default=None
+        The kwargs are passed to ``matplotlib.axes.Axes.imshow``.
+        By default, using configuration: ``VizConfig.get_kws_imshow__YlOrBr_r()``.
+        Optionally specify a dict of keyword arguments to update configurations.
+    adaptive_tol : float, default=None
+        If specified, evaluate the grid adaptively with far fewer evaluations,
+        see :func:`create_coordinates3d` for details. The grid is not cached.
+    interactive : bool, default=False
+        Specify if the contour plot should be a heatmap that is re-evaluated at
+        screen resolution when it is zoomed or panned, see :class:`ZoomRenderer`.
+        The renderer is available as the ``zoom_renderer`` attribute.
 
     Notes
     -----
@@ -201,6 +307,15 @@ class FunctionPlotter:
         kws_contour=None,
         kws_plot=None,
         kws_scatter=None,
+        n_workers=1,
+        chunk_size=None,
+        max_memory=None,
+        symmetry=None,
+        cache=None,
+        with_heatmap=False,
+        kws_imshow=None,
+        adaptive_tol=None,
+        interactive=False,
     ):
         self._func = func
         self._bounds = bounds
@@ -216,9 +331,20 @@ class FunctionPlotter:
         self._kws_surface = kws_surface
         self._kws_plot = kws_plot
         self._kws_scatter = kws_scatter
+        self._n_workers = n_workers
+        self._chunk_size = chunk_size
+        self._max_memory = max_memory
+        self._symmetry = symmetry
+        self._cache = cache
+        self._with_heatmap = with_heatmap
+        self._kws_imshow = kws_imshow
+        self._adaptive_tol = adaptive_tol
+        self._interactive = interactive
 
         self._size = len(bounds)
         self._coord = None
+        self._contour_geometry = None
+        self._zoom_renderer = None
 
         if self._size not in (1, 2):
             raise TypeError("the total number of bounds must be either 1 or 2")
@@ -239,6 +365,11 @@ class FunctionPlotter:
         """Bounds to use for the plot."""
         return self._bounds
 
+    @property
+    def zoom_renderer(self):
+        """The renderer of an interactive contour plot, or None."""
+        return self._zoom_renderer
+
     def plot(self, fig=None, ax=None, ax3d=None):
         """Generate the plot.
 
@@ -269,7 +400,9 @@ class FunctionPlotter:
         ``ax`` or ``ax3d`` is specified, it is best to also supply ``fig``.
         To this end, it might be easier to only supply a ``fig`` object.
         """
-        self._set_coord_attr()
+        if self._size == 1 or self._with_surface or not self._interactive:
+            # an interactive contour plot evaluates its own tiles
+            self._set_coord_attr()
 
         if self._size == 1:
             fig, ax, ax3d = self._plot_line(fig, ax, ax3d)
@@ -294,20 +427,15 @@ class FunctionPlotter:
 
         ax3d = ax3d or fig.add_subplot(1, 2, 1, projection="3d")
         ax3d = create_surface_plot(
-            self._coord,
+            self._get_surface_coord(),
             kws_surface=self._kws_surface,
             kws_contourf=self._kws_contourf,
+            geometry=self._get_contour_geometry(),
             ax=ax3d,
         )
 
         ax = ax or fig.add_subplot(1, 2, 2)
-        ax = create_contour_plot(
-            self._coord,
-            kws_contourf=self._kws_contourf,
-            kws_contour=self._kws_contour,
-            ax=ax,
-        )
-        ax.axis("scaled")
+        ax = self._create_contour_plot(ax)
 
         return fig, ax, ax3d
 
@@ -316,9 +444,10 @@ class FunctionPlotter:
 
         ax3d = ax3d or fig.add_subplot(1, 1, 1, projection="3d")
         ax3d = create_surface_plot(
-            self._coord,
+            self._get_surface_coord(),
             kws_surface=self._kws_surface,
             kws_contourf=self._kws_contourf,
+            geometry=self._get_contour_geometry(),
             ax=ax3d,
         )
 
@@ -332,16 +461,65 @@ class FunctionPlotter:
         ax3d = None
 
         ax = ax or fig.add_subplot(1, 1, 1)
-        ax = create_contour_plot(
-            self._coord,
-            kws_contourf=self._kws_contourf,
-            kws_contour=self._kws_contour,
-            ax=ax,
-        )
-        ax.axis("scaled")
+        ax = self._create_contour_plot(ax)
 
         return fig, ax, ax3d
 
+    def _create_contour_plot(self, ax):
+        if self._interactive:
+            self._zoom_renderer = ZoomRenderer(
+                self._func,
+                ax,
+                bounds=self._bounds,
+                n_workers=self._n_workers,
+                chunk_size=self._chunk_size,
+                kws_imshow=self._kws_imshow,
+            )
+            plt.colorbar(
+                self._zoom_renderer.image,
+                cax=make_axes_locatable(ax).append_axes("right", size="5%", pad=0.15),
+            )
+
+        elif self._with_heatmap:
+            ax = create_heatmap_plot(
+                self._coord,
+                kws_imshow=self._kws_imshow,
+                kws_contour=self._kws_contour,
+                ax=ax,
+            )
+
+        else:
+            ax = create_contour_plot(
+                self._coord,
+                kws_contourf=self._kws_contourf,
+                kws_contour=self._kws_contour,
+                geometry=self._get_contour_geometry(),
+                ax=ax,
+            )
+
+        ax.axis("scaled")
+        return ax
+
+    def _get_contour_geometry(self):
+        """Compute the filled contours once and share them between the plots."""
+        settings_contourf = VizConfig.get_kws_contourf__YlOrBr_r()
+        settings_contourf.update(self._kws_contourf or dict())
+        if not _uses_contour_geometry(settings_contourf):
+            return None
+
+        if self._contour_geometry is None:
+            self._contour_geometry = create_contour_geometry(
+                self._get_surface_coord(), levels=settings_contourf["levels"]
+            )
+
+        return self._contour_geometry
+
+    def _get_surface_coord(self):
+        if self._with_heatmap:
+            # the polygons of a dense surface are indiscernible but slow to draw
+            return _subsample_coord(self._coord, _HEATMAP_SURFACE_POINTS)
+        return self._coord
+
     def _plot_line(self, fig, ax, ax3d):
         fig = fig or plt.gcf()
 
@@ -372,26 +550,605 @@ class FunctionPlotter:
     def _set_coord_attr(self):
         """Private setter for coordinate attribute."""
         if self._coord is None:
-            if self._size == 1:
-                (x_bounds,) = self._bounds
-                x_coord = self._x_coord or np.linspace(
-                    min(x_bounds), max(x_bounds), self._n_grid_points
-                )
-                self._coord = create_coordinates2d(self._func, x_coord)
+            coords = self._get_coords()
+            # adaptive grids are partly interpolated, hence, they are not cached
+            cache = self._cache if self._adaptive_tol is None else None
+
+            if cache is not None:
+                self._coord = cache.load(self._func, *coords)
+
+            if self._coord is None:
+                self._coord = self._create_coordinates(*coords)
+
+                if cache is not None:
+                    cache.save(self._func, self._coord)
+
+    def _get_coords(self):
+        """Get the coordinate vectors of the grid."""
+        x_bounds, *y_bounds = self._bounds
+        x_coord = self._x_coord or np.linspace(
+            min(x_bounds), max(x_bounds), self._n_grid_points
+        )
+
+        if self._size == 1:
+            return (fbench.check_vector(x_coord, n_min=2),)
+
+        (y_bounds,) = y_bounds
+        y_coord = self._y_coord or np.linspace(
+            min(y_bounds), max(y_bounds), self._n_grid_points
+        )
+        return fbench.check_vector(x_coord, n_min=2), fbench.check_vector(
+            y_coord, n_min=2
+        )
+
+    def _create_coordinates(self, x_coord, y_coord=None):
+        """Evaluate the function on the grid of the coordinate vectors."""
+        if self._size == 1:
+            return create_coordinates2d(
+                self._func,
+                x_coord,
+                n_workers=self._n_workers,
+                chunk_size=self._chunk_size,
+                adaptive_tol=self._adaptive_tol,
+            )
+
+        return create_coordinates3d(
+            self._func,
+            x_coord,
+            y_coord,
+            n_workers=self._n_workers,
+            chunk_size=self._chunk_size,
+            max_memory=self._max_memory,
+            symmetry=self._symmetry,
+            adaptive_tol=self._adaptive_tol,
+        )
+
+
+class GridCache:
+    """A persistent cache of evaluated grids in a directory of ``.npz`` files.
+
+    A grid is stored in a compressed ``.npz`` file whose name is a hash of the
+    fBench version, a stable identity of the function, and the coordinate vectors,
+    which determine the bounds and the number of grid points.
+    Only functions with a stable identity are cached: fBench functions,
+    module-level functions, NumPy ufuncs, and ``toolz`` compositions of them.
+    The identity of a module-level function includes its bytecode, constants,
+    and default arguments, such that an edited function misses the cache,
+    but not the global variables or other functions it calls.
+    If the files exceed the size limit, the least recently used ones are removed.
+
+    Parameters
+    ----------
+    directory : str or os.PathLike
+        The directory of the cache files. It is created if it does not exist.
+    max_bytes : int, default=2**30
+        Specify the maximum total size of the cache files in bytes.
+
+    Examples
+    --------
+    >>> import fbench
+    >>> import tempfile
+    >>> with tempfile.TemporaryDirectory() as tmp_dir:
+    ...     cache = fbench.viz.GridCache(tmp_dir)
+    ...     coord = fbench.viz.create_coordinates2d(fbench.sphere, [-1, 0, 1])
+    ...     cache.save(fbench.sphere, coord)
+    ...     cache.load(fbench.sphere, [-1, 0, 1])
+    True
+    CoordinatePairs(x=array([-1,  0,  1]), y=array([1., 0., 1.]))
+    """
+
+    def __init__(self, directory, /, *, max_bytes=2**30):
+        self._directory = pathlib.Path(directory)
+        self._max_bytes = max_bytes
+        self._directory.mkdir(parents=True, exist_ok=True)
+
+    def __repr__(self):
+        return (
+            f"{type(self).__name__}(directory={str(self.directory)!r}, "
+            f"max_bytes={self.max_bytes})"
+        )
+
+    @property
+    def directory(self):
+        """The directory of the cache files."""
+        return self._directory
+
+    @property
+    def max_bytes(self):
+        """The maximum total size of the cache files in bytes."""
+        return self._max_bytes
+
+    @property
+    def nbytes(self):
+        """The total size of the cache files in bytes."""
+        return sum(path.stat().st_size for path in self._get_files())
+
+    def load(self, func, x_coord, y_coord=None):
+        """Load an evaluated grid.
+
+        Parameters
+        ----------
+        func : callable
+            The evaluated function.
+        x_coord : array_like
+            An one-dimensional array for the x-coordinates of the grid.
+        y_coord : array_like, default=None
+            An one-dimensional array for the y-coordinates of the grid.
+            If None, load the (x, y) pairs of a function with an 1-vector input.
+
+        Returns
+        -------
+        CoordinatePairs or CoordinateMatrices or None
+            The cached coordinates, or None if the grid is not cached.
+        """
+        coords = [x_coord] if y_coord is None else [x_coord, y_coord]
+        path = self._get_path(func, coords)
+        if path is None or not path.exists():
+            return None
+
+        # mark as recently used
+        os.utime(path)
+        with np.load(path) as data:
+            if y_coord is None:
+                return fbench.structure.CoordinatePairs(data["x"], data["y"])
+            return fbench.structure.CoordinateMatrices.from_axes(
+                data["x"], data["y"], data["z"]
+            )
+
+    def save(self, func, coord):
+        """Save an evaluated grid.
+
+        Parameters
+        ----------
+        func : callable
+            The evaluated function.
+        coord : CoordinatePairs or CoordinateMatrices
+            The coordinates returned by :func:`create_coordinates2d` or
+            :func:`create_coordinates3d`.
+
+        Returns
+        -------
+        bool
+            True if the grid is saved, False if the function has no stable identity.
+        """
+        if isinstance(coord, fbench.structure.CoordinateMatrices):
+            arrays = dict(x=coord.x[0], y=coord.y[:, 0], z=coord.z)
+            path = self._get_path(func, [arrays["x"], arrays["y"]])
+        else:
+            arrays = dict(x=coord.x, y=coord.y)
+            path = self._get_path(func, [arrays["x"]])
+
+        if path is None:
+            return False
+
+        # write to a temporary file first, such that readers never see partial files
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as file:
+            np.savez_compressed(file, **arrays)
+        os.replace(tmp_path, path)
+
+        self._evict()
+        return True
+
+    def clear(self):
+        """Remove all cache files."""
+        for path in self._get_files():
+            path.unlink(missing_ok=True)
+
+    def _get_files(self):
+        return list(self._directory.glob("*.npz"))
+
+    def _get_path(self, func, coords):
+        func_id = _get_func_id(func)
+        if func_id is None:
+            return None
+
+        digest = hashlib.sha256(f"{fbench.__version__}|{func_id}".encode())
+        for coord in coords:
+            coord = np.ascontiguousarray(coord)
+            digest.update(f"|{coord.dtype.str}{coord.shape}".encode())
+            digest.update(coord.tobytes())
+
+        return self._directory / f"{digest.hexdigest()}.npz"
+
+    def _evict(self):
+        """Remove least recently used files until the size limit is met."""
+        files = [(path.stat(), path) for path in self._get_files()]
+        nbytes = sum(stat.st_size for stat, _ in files)
+
+        for stat, path in sorted(files, key=lambda item: item[0].st_mtime_ns):
+            if nbytes <= self._max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            nbytes -= stat.st_size
+
+
+class TileCache:
+    """An in-memory cache of evaluated tiles at multiple resolutions.
+
+    A tile is a square block of function values, see :class:`ZoomRenderer`.
+    Tiles of all zoom levels are kept in the same cache, such that panning or
+    zooming back to a region that was visible before does not evaluate anything.
+    If the cache exceeds the size limit, the least recently used tiles are removed.
+
+    Parameters
+    ----------
+    max_tiles : int, default=4096
+        Specify the maximum number of tiles in the cache.
+
+    Examples
+    --------
+    >>> import fbench
+    >>> import numpy as np
+    >>> cache = fbench.viz.TileCache(max_tiles=2)
+    >>> cache.save("a", np.zeros((2, 2)))
+    >>> cache.save("b", np.ones((2, 2)))
+    >>> cache.load("a")
+    array([[0., 0.],
+           [0., 0.]])
+    >>> cache.save("c", np.ones((2, 2)))
+    >>> cache.load("b") is None
+    True
+    """
+
+    def __init__(self, max_tiles=4096):
+        self._max_tiles = max_tiles
+        self._tiles = collections.OrderedDict()
+
+    def __repr__(self):
+        return f"{type(self).__name__}(max_tiles={self.max_tiles})"
+
+    def __len__(self):
+        return len(self._tiles)
+
+    @property
+    def max_tiles(self):
+        """The maximum number of tiles in the cache."""
+        return self._max_tiles
+
+    def load(self, key):
+        """Load a tile.
+
+        Parameters
+        ----------
+        key : hashable
+            The key of the tile.
+
+        Returns
+        -------
+        np.ndarray or None
+            The cached tile, or None if the tile is not cached.
+        """
+        tile = self._tiles.get(key)
+        if tile is not None:
+            # mark as recently used
+            self._tiles.move_to_end(key)
+        return tile
+
+    def save(self, key, tile):
+        """Save a tile.
+
+        Parameters
+        ----------
+        key : hashable
+            The key of the tile.
+        tile : np.ndarray
+            The function values of the tile.
+        """
+        self._tiles[key] = tile
+        self._tiles.move_to_end(key)
+        while len(self._tiles) > self._max_tiles:
+            self._tiles.popitem(last=False)
+
+    def clear(self):
+        """Remove all tiles."""
+        self._tiles.clear()
+
+
+class ZoomRenderer:
+    """Re-evaluate a function on the visible region of an ``Axes`` on zoom and pan.
+
+    The function is drawn as a heatmap of square tiles with ``tile_points`` by
+    ``tile_points`` values. At zoom level :math:`L`, the ``bounds`` span
+    :math:`2^L` tiles per axis, and the level is chosen such that a tile has at
+    least one value per screen pixel. When the axis limits change, only the tiles
+    of the visible region that are not in the cache are evaluated, right before
+    the ``Axes`` is drawn again.
+
+    Parameters
+    ----------
+    func : Callable[[np.ndarray], float]
+        A scalar-valued function that takes a two-dimensional, real vector as input.
+    ax : matplotlib.axes.Axes
+        The ``Axes`` object to draw the heatmap on. Its autoscaling is turned off.
+    bounds : sequence of tuple, default=None
+        Specify the (x, y) bounds of the region that is spanned by one tile at
+        zoom level 0, which are also the initial axis limits.
+        If None, the current axis limits are used.
+    tile_points : int, default=64
+        Specify the number of function values per axis of a tile.
+    cache : TileCache, default=None
+        Optionally supply a cache of evaluated tiles, e.g., to share it with
+        another renderer of the same function and bounds.
+        If None, a new cache is created.
+    n_workers : int, default=1
+        Specify the number of worker processes to evaluate the tiles.
+        If None, the number of CPUs is used.
+        See :func:`create_coordinates3d` for details.
+    chunk_size : int, default=None
+        Specify the number of points each worker evaluates per task.
+        If None, the points are split into four tasks per worker.
+    kws_imshow : dict of keyword arguments, default=None
+        The kwargs are passed to ``matplotlib.axes.Axes.imshow``.
+        By default, using configuration: ``VizConfig.get_kws_imshow__YlOrBr_r()``.
+        Optionally specify a dict of keyword arguments to update configurations.
+        Unless ``norm``, ``vmin``, or ``vmax`` is specified, the colors are
+        scaled to the values of the visible tiles.
+
+    Notes
+    -----
+    - The renderer stays active as long as the heatmap is part of the ``Axes``.
+      Call :meth:`disconnect` to freeze the heatmap.
+    - All missing tiles are evaluated at once, such that batch-capable functions
+      (see :func:`fbench.batchable`) are called once per redraw.
+
+    Examples
+    --------
+    >>> import fbench
+    >>> import matplotlib.pyplot as plt
+    >>> fig, ax = plt.subplots()
+    >>> renderer = fbench.viz.ZoomRenderer(fbench.schwefel, ax, bounds=[(-500, 500)] * 2)
+    >>> ax.set_xlim(0, 100)
+    (0.0, 100.0)
+    >>> renderer.update()
+    True
+    >>> plt.close(fig)
+    """  # noqa: E501
+
+    def __init__(
+        self,
+        func,
+        ax,
+        /,
+        *,
+        bounds=None,
+        tile_points=64,
+        cache=None,
+        n_workers=1,
+        chunk_size=None,
+        kws_imshow=None,
+    ):
+        self._func = func
+        self._ax = ax
+        self._tile_points = tile_points
+        self._cache = TileCache() if cache is None else cache
+        self._n_workers = n_workers
+        self._chunk_size = chunk_size
+        self._n_evaluated = 0
+        self._stale = True
+        self._view = None
+
+        x_bounds, y_bounds = bounds or (ax.get_xlim(), ax.get_ylim())
+        self._origin = (min(x_bounds), min(y_bounds))
+        self._size = (max(x_bounds) - min(x_bounds), max(y_bounds) - min(y_bounds))
+
+        settings_imshow = VizConfig.get_kws_imshow__YlOrBr_r()
+        settings_imshow.update(kws_imshow or dict())
+        self._autoscale = not {"norm", "vmin", "vmax"} & settings_imshow.keys()
+
+        ax.set_xlim(min(x_bounds), max(x_bounds))
+        ax.set_ylim(min(y_bounds), max(y_bounds))
+        self._image = ax.imshow(np.zeros((1, 1)), **settings_imshow)
+        ax.set_autoscale_on(False)
+
+        # the hook holds the only strong reference to the renderer
+        self._hook = ax.add_artist(_DrawHook(self._update_if_stale))
+        self._callback_ids = [
+            ax.callbacks.connect(signal, self._on_lim_changed)
+            for signal in ("xlim_changed", "ylim_changed")
+        ]
+        self.update()
+
+    def __repr__(self):
+        return (
+            f"{type(self).__name__}(func={self.func.__name__}, "
+            f"tile_points={self._tile_points})"
+        )
+
+    @property
+    def func(self):
+        """The function to evaluate."""
+        return self._func
+
+    @property
+    def cache(self):
+        """The cache of evaluated tiles."""
+        return self._cache
+
+    @property
+    def image(self):
+        """The ``AxesImage`` object of the heatmap."""
+        return self._image
+
+    @property
+    def n_evaluated(self):
+        """The total number of function evaluations."""
+        return self._n_evaluated
+
+    def update(self):
+        """Update the heatmap to the visible region of the ``Axes``.
+
+        Returns
+        -------
+        bool
+            True if the heatmap is updated, False if the visible tiles are unchanged.
+        """
+        self._stale = False
+        view = self._get_visible_tiles()
+        if view == self._view:
+            return False
+
+        level, i_range, j_range = view
+        n = self._tile_points
+        keys = [
+            (self._func, self._origin, self._size, n, level, i, j)
+            for j in j_range
+            for i in i_range
+        ]
+        tiles = [self._cache.load(key) for key in keys]
+
+        missing = [k for k, tile in enumerate(tiles) if tile is None]
+        if missing:
+            points = np.concatenate([self._get_tile_points(keys[k]) for k in missing])
+            z = _evaluate_points(
+                self._func,
+                points,
+                n_workers=self._n_workers,
+                chunk_size=self._chunk_size,
+            )
+            self._n_evaluated += len(z)
+
+            for k, tile in zip(missing, np.split(z, len(missing))):
+                tiles[k] = tile.reshape(n, n)
+                self._cache.save(keys[k], tiles[k])
+
+        n_cols = len(i_range)
+        mosaic = np.block([list(row) for row in toolz.partition(n_cols, tiles)])
+        (x0, y0), (width, height) = self._origin, self._get_tile_size(level)
+        self._image.set_data(mosaic)
+        self._image.set_extent(
+            (
+                x0 + i_range.start * width,
+                x0 + i_range.stop * width,
+                y0 + j_range.start * height,
+                y0 + j_range.stop * height,
+            )
+        )
+        if self._autoscale:
+            self._image.autoscale()
+
+        self._view = view
+        return True
+
+    def disconnect(self):
+        """Stop updating the heatmap."""
+        for callback_id in self._callback_ids:
+            self._ax.callbacks.disconnect(callback_id)
+        self._callback_ids = []
+        self._hook.remove()
+
+    def _on_lim_changed(self, ax):
+        # defer the update until both limits of a zoom are set
+        self._stale = True
+
+    def _update_if_stale(self):
+        if self._stale:
+            self.update()
+
+    def _get_tile_size(self, level):
+        return tuple(size / 2**level for size in self._size)
+
+    def _get_visible_tiles(self):
+        """Get the zoom level and the index ranges of the visible tiles."""
+        limits = [sorted(self._ax.get_xlim()), sorted(self._ax.get_ylim())]
+        pixels = [self._ax.bbox.width, self._ax.bbox.height]
+        level = max(
+            math.ceil(
+                math.log2(size * max(n_pixels, 1) / ((hi - lo) * self._tile_points))
+            )
+            for size, n_pixels, (lo, hi) in zip(self._size, pixels, limits)
+        )
+
+        ranges = []
+        for origin, tile_size, (lo, hi) in zip(
+            self._origin, self._get_tile_size(level), limits
+        ):
+            start = math.floor((lo - origin) / tile_size)
+            stop = max(math.ceil((hi - origin) / tile_size), start + 1)
+            ranges.append(range(start, stop))
+
+        return level, *ranges
+
+    def _get_tile_points(self, key):
+        """Get the (x, y)-points at the pixel centers of a tile."""
+        *_, n, level, i, j = key
+        centers = (np.arange(n) + 0.5) / n
+        x = self._origin[0] + (i + centers) * self._get_tile_size(level)[0]
+        y = self._origin[1] + (j + centers) * self._get_tile_size(level)[1]
+        x, y = np.meshgrid(x, y)
+        return np.column_stack([x.ravel(), y.ravel()])
 
-            else:
-                x_bounds, y_bounds = self._bounds
-                x_coord = self._x_coord or np.linspace(
-                    min(x_bounds), max(x_bounds), self._n_grid_points
-                )
-                y_coord = self._y_coord or np.linspace(
-                    min(y_bounds), max(y_bounds), self._n_grid_points
-                )
-                self._coord = create_coordinates3d(self._func, x_coord, y_coord)
+
+class _DrawHook(matplotlib.artist.Artist):
+    """An invisible artist that calls a function before the other artists are drawn."""
+
+    def __init__(self, func):
+        super().__init__()
+        self._func = func
+        self.set_zorder(-np.inf)
+
+    def draw(self, renderer):
+        self._func()
+
+
+@toolz.curry
+def create_contour_geometry(coord, /, *, levels=100):
+    """Compute the polygons of filled contours of X, Y, Z coordinate matrices.
+
+    The polygons are the expensive part of a filled contour plot. Computing
+    them once allows to draw them in several plots, e.g., the contour plot and
+    the floor of the surface plot of :class:`FunctionPlotter`.
+
+    Parameters
+    ----------
+    coord : CoordinateMatrices
+        The X, Y, Z coordinate matrices.
+    levels : int or array_like, default=100
+        Specify the number of contour levels or the levels in increasing order.
+        As with ``matplotlib.axes.Axes.contourf``, an integer :math:`n` yields
+        about :math:`n + 1` levels that span the range of the z-coordinates.
+
+    Returns
+    -------
+    ContourGeometry
+        The contour levels and the polygons of the regions between them.
+
+    Notes
+    -----
+    Function is curried.
+
+    Examples
+    --------
+    >>> import fbench
+    >>> coord = fbench.viz.create_coordinates3d(fbench.sphere, [-1, 0, 1])
+    >>> fbench.viz.create_contour_geometry(coord, levels=4).levels
+    array([0. , 0.4, 0.8, 1.2, 1.6, 2. ])
+    """
+    z = np.ma.masked_invalid(coord.z, copy=False)
+    levels = _get_contour_levels(z, levels)
+    generator = contourpy.contour_generator(
+        coord.x,
+        coord.y,
+        z,
+        corner_mask=True,
+        fill_type=contourpy.FillType.OuterCode,
+    )
+
+    # as matplotlib, include the minimum in the lowest region
+    lowers = levels[:-1].copy()
+    if lowers[0] == z.min():
+        lowers[0] -= 1
+
+    allsegs, allkinds = zip(
+        *(generator.filled(lower, upper) for lower, upper in zip(lowers, levels[1:]))
+    )
+    return fbench.structure.ContourGeometry(levels, list(allsegs), list(allkinds))
 
 
 @toolz.curry
-def create_contour_plot(coord, /, *, kws_contourf=None, kws_contour=None, ax=None):
+def create_contour_plot(
+    coord, /, *, kws_contourf=None, kws_contour=None, geometry=None, ax=None
+):
     """Create a contour plot from X, Y, Z coordinate matrices.
 
     Parameters
@@ -406,6 +1163,11 @@ def create_contour_plot(coord, /, *, kws_contourf=None, kws_contour=None, ax=Non
         The kwargs are passed to ``matplotlib.axes.Axes.contour``.
         By default, using configuration: ``VizConfig.get_kws_contour__base()``.
         Optionally specify a dict of keyword arguments to update configurations.
+    geometry : ContourGeometry, default=None
+        Optionally supply the filled contours from :func:`create_contour_geometry`
+        to reuse them, in which case the ``levels`` of ``kws_contourf`` are ignored.
+        The geometry is not used if ``kws_contourf`` specifies ``extend``,
+        ``locator``, or ``norm``, whose levels are left to matplotlib.
     ax : matplotlib.axes.Axes, default=None
         Optionally supply an ``Axes`` object.
         If None, the current ``Axes`` object is retrieved.
@@ -425,7 +1187,13 @@ def create_contour_plot(coord, /, *, kws_contourf=None, kws_contour=None, ax=Non
 
     settings_contourf = VizConfig.get_kws_contourf__YlOrBr_r()
     settings_contourf.update(kws_contourf or dict())
-    contour_plot = ax.contourf(coord.x, coord.y, coord.z, **settings_contourf)
+    if _uses_contour_geometry(settings_contourf):
+        geometry = geometry or create_contour_geometry(
+            coord, levels=settings_contourf["levels"]
+        )
+        contour_plot = _draw_contour_geometry(geometry, settings_contourf, ax=ax)
+    else:
+        contour_plot = ax.contourf(coord.x, coord.y, coord.z, **settings_contourf)
 
     settings_contour = VizConfig.get_kws_contour__base()
     settings_contour.update(kws_contour or dict())
@@ -440,10 +1208,16 @@ def create_contour_plot(coord, /, *, kws_contourf=None, kws_contour=None, ax=Non
 
 
 @toolz.curry
-def create_coordinates2d(func, x_coord, /):
+def create_coordinates2d(
+    func, x_coord, /, *, n_workers=1, chunk_size=None, adaptive_tol=None
+):
     """Create (x, y) pairs from coordinate vector and function.
 
     For each value of :math:`x`, compute function value :math:`y = f(x)`.
+    If the function is batch-capable (see :func:`fbench.batchable`),
+    all values are computed in a single call of its batch counterpart.
+    Otherwise, the function is called once per value of :math:`x`
+    with an 1-vector as input.
 
     Parameters
     ----------
@@ -451,6 +1225,16 @@ def create_coordinates2d(func, x_coord, /):
         A scalar-valued function that takes an 1-vector as input.
     x_coord : array_like
         An one-dimensional array for the x-coordinates of the grid.
+    n_workers : int, default=1
+        Specify the number of worker processes to evaluate the function.
+        If None, the number of CPUs is used.
+    chunk_size : int, default=None
+        Specify the number of x-values each worker evaluates per task.
+        If None, the x-values are split into four tasks per worker.
+    adaptive_tol : float, default=None
+        If specified, only evaluate the x-values that are needed to interpolate
+        the function linearly with an error of about ``adaptive_tol`` times the
+        range of the function values, and return only the evaluated pairs.
 
     Returns
     -------
@@ -459,7 +1243,14 @@ def create_coordinates2d(func, x_coord, /):
 
     Notes
     -----
-    Function is curried.
+    - Function is curried.
+    - With more than one worker, the x-values are split into chunks that are
+      evaluated in a process pool and reassembled in order. This pays off for
+      expensive functions, which must be picklable, i.e., defined at module level.
+    - With ``adaptive_tol``, the function is first evaluated on 17 evenly spaced
+      x-values. Then, intervals are halved where the second differences of the
+      function values indicate a large interpolation error, until the spacing
+      of ``x_coord`` is reached.
 
     Examples
     --------
@@ -468,16 +1259,42 @@ def create_coordinates2d(func, x_coord, /):
     CoordinatePairs(x=array([-2, -1,  0,  1,  2]), y=array([4., 1., 0., 1., 4.]))
     """
     x = fbench.check_vector(x_coord, n_min=2)
-    y = np.apply_along_axis(func1d=func, axis=1, arr=np.c_[x.ravel()])
+
+    if adaptive_tol is not None:
+        y, evaluated = _evaluate_adaptive_grid(
+            func, (x,), adaptive_tol, n_workers=n_workers, chunk_size=chunk_size
+        )
+        return fbench.structure.CoordinatePairs(x[evaluated], y[evaluated])
+
+    y = _evaluate_points(
+        func, x[:, np.newaxis], n_workers=n_workers, chunk_size=chunk_size
+    )
     return fbench.structure.CoordinatePairs(x, y)
 
 
 @toolz.curry
-def create_coordinates3d(func, x_coord, y_coord=None, /):
+def create_coordinates3d(
+    func,
+    x_coord,
+    y_coord=None,
+    /,
+    *,
+    n_workers=1,
+    chunk_size=None,
+    out=None,
+    max_memory=None,
+    symmetry=None,
+    adaptive_tol=None,
+):
     """Create X, Y, Z coordinate matrices from coordinate vectors and function.
 
     First, a meshgrid of (x, y)-coordinates is constructed from the coordinate vectors.
     Then, the z-coordinate for each (x, y)-point is computed using the function.
+    The X and Y coordinate matrices are read-only broadcast views of the
+    coordinate vectors, see :meth:`fbench.structure.CoordinateMatrices.from_axes`.
+    If the function is batch-capable (see :func:`fbench.batchable`),
+    all grid points are evaluated in a single call of its batch counterpart.
+    Otherwise, the function is called once per grid point.
 
     Parameters
     ----------
@@ -488,15 +1305,65 @@ def create_coordinates3d(func, x_coord, y_coord=None, /):
     y_coord : array_like, default=None
         An one-dimensional array for the y-coordinates of the grid.
         If None, ``y_coord`` equals ``x_coord``.
+    n_workers : int, default=1
+        Specify the number of worker processes to evaluate the function.
+        If None, the number of CPUs is used.
+    chunk_size : int, default=None
+        Specify the number of grid points each worker evaluates per task.
+        If None, the grid points are split into four tasks per worker.
+    out : np.ndarray, default=None
+        Optionally supply an array of shape ``(len(y_coord), len(x_coord))``
+        to write the z-coordinates to, e.g., a ``np.memmap``.
+    max_memory : int, default=None
+        Specify the approximate number of bytes for the grid points that are
+        evaluated at once. If None, all grid points are evaluated at once.
+    symmetry : sequence of str, default=None
+        Specify the symmetries of the function, i.e., ``"mirror"`` and/or
+        ``"permutation"``, see :class:`fbench.structure.Benchmark`.
+        If None, the symmetries of a fBench function are used.
+    adaptive_tol : float, default=None
+        If specified, only evaluate the grid points that are needed to interpolate
+        the function bilinearly with an error of about ``adaptive_tol`` times the
+        range of the function values, and interpolate the other grid points.
 
     Returns
     -------
     CoordinateMatrices
         The coordinate matrices.
 
+    Raises
+    ------
+    TypeError
+        If ``out`` does not have shape ``(len(y_coord), len(x_coord))``.
+    ValueError
+        If ``symmetry`` contains an unknown symmetry.
+
     Notes
     -----
-    Function is curried.
+    - Function is curried.
+    - With more than one worker, the grid points are split into chunks that are
+      evaluated in a process pool and reassembled in order. This pays off for
+      expensive functions, which must be picklable, i.e., defined at module level.
+    - With ``max_memory``, the grid is evaluated in blocks of rows such that
+      the (x, y)-points and function values of a block take about ``max_memory``
+      bytes, but at least one row. Together with a memory-mapped ``out``,
+      this bounds the memory to evaluate grids that do not fit in memory.
+    - Separable fBench functions, e.g., :func:`fbench.sphere`, are evaluated as
+      the outer sum :math:`g(x) + g(y)` of their elementwise term :math:`g`,
+      see :class:`fbench.structure.Benchmark`. This takes :math:`O(N)` instead of
+      :math:`O(N^2)` term evaluations, and ``n_workers``, ``chunk_size``, and
+      ``max_memory`` do not apply.
+    - Symmetric functions are only evaluated on the fundamental domain of the grid.
+      With ``"mirror"``, an axis that is symmetric about the origin is reduced
+      to one half. With ``"permutation"`` and equal axes, only the grid points
+      with :math:`x \\geq y` are evaluated. The other z-coordinates are copied,
+      which saves up to seven eighths of the evaluations.
+    - With ``adaptive_tol``, the function is first evaluated on a grid of 17 by 17
+      points. Then, cells are halved where the second differences of the function
+      values indicate a large interpolation error, until the spacing of the
+      coordinate vectors is reached. Smooth functions need a fraction of the
+      evaluations for a visually equivalent grid. ``max_memory`` and ``symmetry``
+      do not apply, but separable fBench functions are still evaluated exactly.
 
     Examples
     --------
@@ -512,9 +1379,18 @@ def create_coordinates3d(func, x_coord, y_coord=None, /):
     """
     x_coord = fbench.check_vector(x_coord, n_min=2)
     y_coord = x_coord if y_coord is None else fbench.check_vector(y_coord, n_min=2)
-    x, y = np.meshgrid(x_coord, y_coord)
-    z = np.apply_along_axis(func1d=func, axis=1, arr=np.c_[x.ravel(), y.ravel()])
-    return fbench.structure.CoordinateMatrices(x, y, z.reshape(x.shape))
+    z = _evaluate_grid(
+        func,
+        x_coord,
+        y_coord,
+        n_workers=n_workers,
+        chunk_size=chunk_size,
+        out=out,
+        max_memory=max_memory,
+        symmetry=_get_symmetry(func, symmetry),
+        adaptive_tol=adaptive_tol,
+    )
+    return fbench.structure.CoordinateMatrices.from_axes(x_coord, y_coord, z)
 
 
 @toolz.curry
@@ -551,6 +1427,66 @@ def create_discrete_cmap(n, /, *, name="viridis_r", lower_bound=0.05, upper_boun
     return [cmap(i) for i in np.linspace(lower_bound, upper_bound, num=n)]
 
 
+@toolz.curry
+def create_heatmap_plot(
+    coord, /, *, kws_imshow=None, kws_contour=None, with_contour=True, ax=None
+):
+    """Create a heatmap from X, Y, Z coordinate matrices.
+
+    The z-coordinates are drawn as a raster image, which takes a fraction of the
+    time and memory of filled contours on dense grids.
+
+    Parameters
+    ----------
+    coord : CoordinateMatrices
+        The X, Y, Z coordinate matrices to plot. The grid must be evenly spaced.
+    kws_imshow : dict of keyword arguments, default=None
+        The kwargs are passed to ``matplotlib.axes.Axes.imshow``.
+        By default, using configuration: ``VizConfig.get_kws_imshow__YlOrBr_r()``.
+        Optionally specify a dict of keyword arguments to update configurations.
+    kws_contour : dict of keyword arguments, default=None
+        The kwargs are passed to ``matplotlib.axes.Axes.contour``.
+        By default, using configuration: ``VizConfig.get_kws_contour__base()``.
+        Optionally specify a dict of keyword arguments to update configurations.
+    with_contour : bool, default=True
+        Specify if contour lines should be superimposed.
+    ax : matplotlib.axes.Axes, default=None
+        Optionally supply an ``Axes`` object.
+        If None, the current ``Axes`` object is retrieved.
+
+    Returns
+    -------
+    ax : matplotlib.axes.Axes
+        The ``Axes`` object with the heatmap and superimposed contour lines.
+
+    Notes
+    -----
+    - Function is curried.
+    - The contour lines are computed on a subgrid with at most 501 points per axis.
+    """
+    ax = ax or plt.gca()
+    x_coord, y_coord = coord.x[0], coord.y[:, 0]
+
+    settings_imshow = VizConfig.get_kws_imshow__YlOrBr_r()
+    settings_imshow["extent"] = (*_get_pixel_edges(x_coord), *_get_pixel_edges(y_coord))
+    settings_imshow.update(kws_imshow or dict())
+    image = ax.imshow(coord.z, **settings_imshow)
+
+    if with_contour:
+        settings_contour = VizConfig.get_kws_contour__base()
+        settings_contour.update(kws_contour or dict())
+        ax.contour(
+            *_subsample_coord(coord, _HEATMAP_CONTOUR_POINTS), **settings_contour
+        )
+
+    plt.colorbar(
+        image,
+        cax=make_axes_locatable(ax).append_axes("right", size="5%", pad=0.15),
+    )
+
+    return ax
+
+
 @toolz.curry
 def create_line_plot(coord, /, *, kws_plot=None, ax=None):
     """Create a line plot from (x, y) pairs.
@@ -588,7 +1524,9 @@ def create_line_plot(coord, /, *, kws_plot=None, ax=None):
 
 
 @toolz.curry
-def create_surface_plot(coord, /, *, kws_surface=None, kws_contourf=None, ax=None):
+def create_surface_plot(
+    coord, /, *, kws_surface=None, kws_contourf=None, geometry=None, ax=None
+):
     """Create a surface plot from X, Y, Z coordinate matrices.
 
     Parameters
@@ -603,6 +1541,11 @@ def create_surface_plot(coord, /, *, kws_surface=None, kws_contourf=None, ax=Non
         The kwargs are passed to ``mpl_toolkits.mplot3d.axes3d.Axes3D.contourf``.
         By default, using configuration: ``VizConfig.get_kws_contourf__YlOrBr_r()``.
         Optionally specify a dict of keyword arguments to update configurations.
+    geometry : ContourGeometry, default=None
+        Optionally supply the filled contours from :func:`create_contour_geometry`
+        to reuse them, in which case the ``levels`` of ``kws_contourf`` are ignored.
+        The geometry only applies to filled contours with ``zdir="z"`` and
+        without ``extend``, ``locator``, or ``norm`` in ``kws_contourf``.
     ax : mpl_toolkits.mplot3d.axes3d.Axes3D, default=None
         Optionally supply an ``Axes3D`` object.
         If None, the current ``Axes3D`` object is retrieved.
@@ -638,7 +1581,25 @@ def create_surface_plot(coord, /, *, kws_surface=None, kws_contourf=None, ax=Non
     ax.set_zlim3d(coord.z.min(), coord.z.max())
     settings_contourf["offset"] = coord.z.min()
 
-    ax.contourf(coord.x, coord.y, coord.z, **settings_contourf)
+    if settings_contourf["zdir"] != "z" or not _uses_contour_geometry(
+        settings_contourf
+    ):
+        ax.contourf(coord.x, coord.y, coord.z, **settings_contourf)
+        return ax
+
+    offset = settings_contourf.pop("offset")
+    del settings_contourf["zdir"]
+    geometry = geometry or create_contour_geometry(
+        coord, levels=settings_contourf["levels"]
+    )
+    contour_plot = _draw_contour_geometry(geometry, settings_contourf, ax=ax)
+
+    if isinstance(contour_plot, matplotlib.collections.Collection):
+        art3d.collection_2d_to_3d(contour_plot, zs=offset, zdir="z")
+    else:
+        # matplotlib<3.8 has one collection per level
+        for collection in contour_plot.collections:
+            art3d.poly_collection_2d_to_3d(collection, zs=offset, zdir="z")
 
     return ax
 
@@ -658,7 +1619,7 @@ def get_1d_plotter():
             n_grid_points=1001,
         ),
         "Peaks_x2=0": FunctionPlotter(
-            func=lambda x: fbench.peaks([x[0], 0]),
+            func=_peaks_x2_zero,
             bounds=((-5, 5),),
             n_grid_points=1001,
             optima=[
@@ -777,3 +1738,541 @@ def plot_optima(optima, /, *, ax=None, ax3d=None, kws_scatter=None):
             ax3d.scatter(*optimum.x, optimum.fx, **settings_scatter)
 
     return ax, ax3d
+
+
+def render_plotters(
+    plotters,
+    directory,
+    /,
+    *,
+    n_workers=None,
+    file_format="png",
+    kws_savefig=None,
+    start_method=None,
+):
+    """Render FunctionPlotter instances to image files in parallel.
+
+    Each plot is evaluated, plotted, and saved in a pool of worker processes
+    that use the non-interactive ``agg`` backend of matplotlib.
+
+    Parameters
+    ----------
+    plotters : dict[str, FunctionPlotter]
+        The FunctionPlotter instances by name, e.g., from :func:`get_2d_plotter`.
+    directory : str or os.PathLike
+        The directory to save the image files ``<name>.<file_format>`` to.
+        It is created if it does not exist.
+    n_workers : int, default=None
+        Specify the number of worker processes.
+        If None, the number of CPUs is used.
+    file_format : str, default="png"
+        Specify the file format of the images.
+    kws_savefig : dict of keyword arguments, default=None
+        The kwargs are passed to ``matplotlib.figure.Figure.savefig``.
+    start_method : str, default=None
+        Specify the start method of the worker processes, see
+        ``multiprocessing.get_context``. If None, ``"fork"`` is used on Linux
+        and the default start method of the platform otherwise.
+
+    Returns
+    -------
+    dict[str, RenderResult]
+        The path and timings of each image file by name.
+
+    Notes
+    -----
+    With the ``fork`` start method, the workers inherit the plotters.
+    Otherwise, the plotters are pickled, which requires module-level functions.
+    The plotters of :func:`get_1d_plotter` and :func:`get_2d_plotter` are picklable.
+
+    Examples
+    --------
+    >>> import fbench
+    >>> import tempfile
+    >>> with tempfile.TemporaryDirectory() as tmp_dir:
+    ...     results = fbench.viz.render_plotters(fbench.viz.get_1d_plotter(), tmp_dir)
+    ...     results["Sinc"].path.name
+    'Sinc.png'
+    """
+    directory = pathlib.Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    kws_savefig = kws_savefig or dict()
+    n_workers = n_workers or os.cpu_count()
+
+    if start_method is None and sys.platform == "linux":
+        # fork is safe on Linux and spares pickling the plotters
+        start_method = "fork"
+    mp_context = multiprocessing.get_context(start_method)
+
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=n_workers,
+        mp_context=mp_context,
+        initializer=_init_render_worker,
+        initargs=(dict(plotters),),
+    ) as executor:
+        futures = {
+            name: executor.submit(
+                _render_plotter, name, directory / f"{name}.{file_format}", kws_savefig
+            )
+            for name in plotters
+        }
+        return {name: future.result() for name, future in futures.items()}
+
+
+def _get_contour_levels(z, levels, /):
+    """Get contour levels as chosen by ``matplotlib.axes.Axes.contourf``."""
+    if np.ndim(levels) > 0:
+        return np.asarray(levels, dtype=float)
+
+    zmin, zmax = z.min(), z.max()
+    levels = matplotlib.ticker.MaxNLocator(levels + 1, min_n_ticks=1).tick_values(
+        zmin, zmax
+    )
+
+    # trim levels outside of the data range, but keep at least two regions
+    i0 = max(np.searchsorted(levels, zmin, side="left") - 1, 0)
+    i1 = min(np.searchsorted(levels, zmax, side="right") + 1, len(levels))
+    if i1 - i0 < 3:
+        i0, i1 = 0, len(levels)
+
+    return levels[i0:i1]
+
+
+def _subsample_coord(coord, max_points, /):
+    """Take every k-th grid point to keep at most ``max_points`` per axis."""
+    step_y, step_x = (math.ceil(size / max_points) for size in coord.z.shape)
+    return fbench.structure.CoordinateMatrices(
+        *(matrix[::step_y, ::step_x] for matrix in coord)
+    )
+
+
+def _uses_contour_geometry(settings_contourf, /):
+    """Check if filled contours can be drawn from a precomputed geometry."""
+    # the levels of extended, custom-located, or normalized contours are not mirrored
+    return (
+        settings_contourf.get("extend", "neither") == "neither"
+        and settings_contourf.get("locator") is None
+        and settings_contourf.get("norm") is None
+    )
+
+
+def _draw_contour_geometry(geometry, settings_contourf, /, *, ax):
+    """Draw filled contours from their precomputed polygons."""
+    settings = {k: v for k, v in settings_contourf.items() if k != "levels"}
+    return matplotlib.contour.ContourSet(
+        ax,
+        geometry.levels,
+        geometry.allsegs,
+        geometry.allkinds,
+        filled=True,
+        **settings,
+    )
+
+
+def _get_pixel_edges(coord, /):
+    """Get the outer edges of the pixels centered on an evenly spaced axis."""
+    half_step = (coord[-1] - coord[0]) / (len(coord) - 1) / 2
+    return coord[0] - half_step, coord[-1] + half_step
+
+
+def _get_func_id(func, /):
+    """Get a stable identity of a function, or None if it has none."""
+    benchmark = fbench.get_benchmark(func)
+    if benchmark is not None:
+        return f"fbench.{benchmark.name}"
+
+    if isinstance(func, np.ufunc):
+        return f"numpy.{func.__name__}"
+
+    if isinstance(func, toolz.functoolz.Compose):
+        func_ids = [_get_func_id(f) for f in (func.first, *func.funcs)]
+        return None if None in func_ids else f"compose({', '.join(func_ids)})"
+
+    if isinstance(func, types.FunctionType) and "<" not in func.__qualname__:
+        # the code distinguishes equally named functions of different scripts or edits
+        digest = hashlib.sha256(repr((func.__defaults__, func.__kwdefaults__)).encode())
+        _update_code_digest(digest, func.__code__)
+        return f"{func.__module__}.{func.__qualname__}|{digest.hexdigest()}"
+
+    return None
+
+
+def _update_code_digest(digest, code, /):
+    """Update a hash with the bytecode, constants, and names of a code object."""
+    digest.update(code.co_code)
+    digest.update(repr(code.co_names).encode())
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            _update_code_digest(digest, const)
+        else:
+            digest.update(repr(const).encode())
+
+
+def _peaks_x2_zero(x, /):
+    """Peaks function along the line :math:`x_{2} = 0`."""
+    return fbench.peaks([x[0], 0])
+
+
+def _init_render_worker(plotters, /):
+    """Initialize a render worker process with a non-interactive backend."""
+    plt.switch_backend("agg")
+    _RENDER_PLOTTERS.update(plotters)
+
+
+def _render_plotter(name, path, kws_savefig, /):
+    """Evaluate, plot, and save a plotter of the render worker process."""
+    plotter = _RENDER_PLOTTERS[name]
+
+    start = time.perf_counter()
+    plotter._set_coord_attr()
+    evaluation_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    fig, _, _ = plotter.plot()
+    fig.savefig(path, **kws_savefig)
+    plt.close(fig)
+    plotting_time = time.perf_counter() - start
+
+    return fbench.structure.RenderResult(path, evaluation_time, plotting_time)
+
+
+def _evaluate_grid(
+    func,
+    x_coord,
+    y_coord,
+    /,
+    *,
+    n_workers=1,
+    chunk_size=None,
+    out=None,
+    max_memory=None,
+    symmetry=(),
+    adaptive_tol=None,
+):
+    """Evaluate function on the grid of the coordinate vectors.
+
+    The grid is evaluated in blocks of rows whose (x, y)-points and function values
+    take about ``max_memory`` bytes, such that only ``out`` spans the full grid.
+    Separable benchmark functions are evaluated as the outer sum of their terms
+    on the coordinate vectors, symmetric functions on the fundamental domain.
+    With ``adaptive_tol``, the grid is refined adaptively and interpolated.
+    """
+    shape = (len(y_coord), len(x_coord))
+    if out is not None and out.shape != shape:
+        raise TypeError(f"out must have shape={shape} - it has shape={out.shape}")
+
+    benchmark = fbench.get_benchmark(func)
+    if (
+        benchmark is not None
+        and benchmark.term is not None
+        and benchmark.n_min <= 2 <= benchmark.n_max
+    ):
+        # separable function: f(x, y) = g(x) + g(y)
+        return np.add(
+            benchmark.term(y_coord)[:, np.newaxis],
+            benchmark.term(x_coord)[np.newaxis, :],
+            out=out,
+        )
+
+    if adaptive_tol is not None:
+        z, _ = _evaluate_adaptive_grid(
+            func,
+            (y_coord, x_coord),
+            adaptive_tol,
+            n_workers=n_workers,
+            chunk_size=chunk_size,
+        )
+        if out is None:
+            return z
+        out[...] = z
+        return out
+
+    if symmetry:
+        return _evaluate_symmetric_grid(
+            func,
+            x_coord,
+            y_coord,
+            symmetry,
+            n_workers=n_workers,
+            chunk_size=chunk_size,
+            out=out,
+            max_memory=max_memory,
+        )
+
+    n_rows = (
+        shape[0]
+        if max_memory is None
+        else max(1, int(max_memory) // (_GRID_POINT_NBYTES * shape[1]))
+    )
+    dtype = np.result_type(x_coord, y_coord)
+
+    for i in range(0, shape[0], n_rows):
+        rows = slice(i, i + n_rows)
+        y_block = y_coord[rows]
+        points = np.empty((len(y_block), shape[1], 2), dtype=dtype)
+        points[..., 0] = x_coord
+        points[..., 1] = y_block[:, np.newaxis]
+        z_block = _evaluate_points(
+            func, points.reshape(-1, 2), n_workers=n_workers, chunk_size=chunk_size
+        )
+
+        if out is None:
+            out = np.empty(shape, dtype=z_block.dtype)
+        out[rows] = z_block.reshape(len(y_block), shape[1])
+
+    return out
+
+
+def _evaluate_symmetric_grid(
+    func,
+    x_coord,
+    y_coord,
+    symmetry,
+    /,
+    *,
+    n_workers=1,
+    chunk_size=None,
+    out=None,
+    max_memory=None,
+):
+    """Evaluate function on the fundamental domain of the grid and copy the rest.
+
+    Each grid index is mapped to the index of a representative coordinate:
+    with mirror symmetry, the index of the coordinate with the opposite sign
+    if the axis is symmetric about the origin. With permutation symmetry and
+    equal axes, only the upper triangle of the reduced grid is evaluated.
+    The reduced grid is evaluated in blocks of rows that take about ``max_memory``
+    bytes, and each block is copied to ``out`` before the next one is evaluated.
+    """
+    x_index = (
+        _mirror_index(x_coord) if "mirror" in symmetry else np.arange(len(x_coord))
+    )
+    y_index = (
+        _mirror_index(y_coord) if "mirror" in symmetry else np.arange(len(y_coord))
+    )
+    x_unique, x_first, x_inverse = np.unique(
+        x_index, return_index=True, return_inverse=True
+    )
+    y_unique, y_first, y_inverse = np.unique(
+        y_index, return_index=True, return_inverse=True
+    )
+    x_coord, y_coord = x_coord[x_unique], y_coord[y_unique]
+    permutation = "permutation" in symmetry and _is_close_axis(x_coord, y_coord)
+
+    n_rows = (
+        len(y_coord)
+        if max_memory is None
+        else max(1, int(max_memory) // (_GRID_POINT_NBYTES * len(x_coord)))
+    )
+
+    for start in range(0, len(y_coord), n_rows):
+        stop = min(start + n_rows, len(y_coord))
+        # upper triangle of the block rows, i.e., column index >= row index
+        mask = np.arange(len(x_coord)) >= np.arange(start, stop)[:, np.newaxis]
+        rows, cols = np.nonzero(mask if permutation else np.ones_like(mask))
+        values = _evaluate_points(
+            func,
+            np.c_[x_coord[cols], y_coord[start + rows]],
+            n_workers=n_workers,
+            chunk_size=chunk_size,
+        )
+        z = np.empty((stop - start, len(x_coord)), dtype=values.dtype)
+        z[rows, cols] = values
+
+        if permutation:
+            # the lower triangle mirrors the upper triangle of this and earlier blocks
+            rows, cols = np.tril_indices(stop - start, -1)
+            z[rows, start + cols] = z[cols, start + rows]
+            if start > 0:
+                z[:, :start] = out[np.ix_(y_first[:start], x_first[start:stop])].T
+
+        if out is None:
+            out = np.empty((len(y_inverse), len(x_inverse)), dtype=z.dtype)
+
+        for i in np.flatnonzero((start <= y_inverse) & (y_inverse < stop)):
+            out[i] = z[y_inverse[i] - start, x_inverse]
+
+    return out
+
+
+def _evaluate_adaptive_grid(func, axes, tol, /, *, n_workers=1, chunk_size=None):
+    """Evaluate function adaptively on the grid of the coordinate vectors.
+
+    The coordinate vectors are in the order of the array axes, i.e., ``(y, x)``
+    for a two-dimensional grid. Starting from a coarse subgrid, the subgrid is
+    refined by halving its intervals until it spans the full grid. The values
+    of the refined subgrid are interpolated multilinearly, and only the points
+    in cells whose estimated interpolation error exceeds ``tol`` times the range
+    of the values are evaluated. Returns the values and a mask of evaluated points.
+    """
+    shape = tuple(len(axis) for axis in axes)
+    z = np.empty(shape)
+    evaluated = np.zeros(shape, dtype=bool)
+
+    index = [_get_coarse_index(n) for n in shape]
+    coarse_shape = [len(i) for i in index]
+    values = _evaluate_masked(
+        func, axes, index, np.ones(coarse_shape, dtype=bool), n_workers, chunk_size
+    ).reshape(coarse_shape)
+    z[np.ix_(*index)] = values
+    evaluated[np.ix_(*index)] = True
+
+    while any(len(i) < n for i, n in zip(index, shape)):
+        coords = [axis[i] for axis, i in zip(axes, index)]
+        refine = _get_refine_cells(values, coords, tol)
+        new_index = [_refine_index(i) for i in index]
+        values = _interpolate_subgrid(values, axes, index, new_index)
+
+        mask = _get_points_in_cells(refine, index, new_index)
+        mask &= ~evaluated[np.ix_(*new_index)]
+        if mask.any():
+            values[mask] = _evaluate_masked(
+                func, axes, new_index, mask, n_workers, chunk_size
+            )
+
+        z[np.ix_(*new_index)] = values
+        evaluated[np.ix_(*new_index)] |= mask
+        index = new_index
+
+    return z, evaluated
+
+
+def _get_coarse_index(n, /):
+    """Get evenly spaced indices of the coarse subgrid of an axis."""
+    num = min(n, _ADAPTIVE_COARSE_POINTS)
+    return np.unique(np.linspace(0, n - 1, num).round().astype(int))
+
+
+def _refine_index(index, /):
+    """Add the midpoints of the intervals of a subgrid axis."""
+    return np.union1d(index, (index[:-1] + index[1:]) // 2)
+
+
+def _evaluate_masked(func, axes, index, mask, n_workers, chunk_size, /):
+    """Evaluate function on the masked points of a subgrid."""
+    positions = np.nonzero(mask)
+    columns = [axis[i[p]] for axis, i, p in zip(axes, index, positions)]
+    points = np.column_stack(columns[::-1])
+    return _evaluate_points(func, points, n_workers=n_workers, chunk_size=chunk_size)
+
+
+def _get_refine_cells(values, coords, tol, /):
+    """Flag cells whose interpolation error estimate exceeds the tolerance.
+
+    The error of multilinear interpolation in a cell is estimated as the sum over
+    the axes of :math:`h^2 |f''| / 8`, where :math:`h` is the width of the cell and
+    :math:`|f''|` the largest second divided difference at its corners.
+    """
+    cell_shape = [n - 1 for n in values.shape]
+    cell_error = np.zeros(cell_shape)
+    for k, coord in enumerate(coords):
+        if len(coord) < 3:
+            continue
+
+        shape = [-1 if i == k else 1 for i in range(values.ndim)]
+        h = np.diff(coord)
+        slope = np.diff(values, axis=k) / h.reshape(shape)
+        curvature = np.abs(np.diff(slope, axis=k)) * (
+            2 / (h[:-1] + h[1:]).reshape(shape)
+        )
+        curvature = np.concatenate(
+            [curvature.take([0], axis=k), curvature, curvature.take([-1], axis=k)],
+            axis=k,
+        )
+
+        for i, n in enumerate(cell_shape):
+            curvature = np.maximum(
+                curvature.take(range(n), axis=i),
+                curvature.take(range(1, n + 1), axis=i),
+            )
+
+        cell_error += curvature * (h**2 / 8).reshape(shape)
+
+    threshold = tol * (np.nanmax(values) - np.nanmin(values))
+    return ~(cell_error <= threshold)
+
+
+def _interpolate_subgrid(values, axes, index, new_index, /):
+    """Interpolate the values of a subgrid multilinearly on a finer subgrid."""
+    for k, (axis, old, new) in enumerate(zip(axes, index, new_index)):
+        lower = np.clip(np.searchsorted(old, new, side="right") - 1, 0, len(old) - 2)
+        x0, x1 = axis[old[lower]], axis[old[lower + 1]]
+        weight = (axis[new] - x0) / (x1 - x0)
+        weight = weight.reshape([-1 if i == k else 1 for i in range(values.ndim)])
+        values = (1 - weight) * values.take(lower, axis=k) + weight * values.take(
+            lower + 1, axis=k
+        )
+
+    return values
+
+
+def _get_points_in_cells(cells, index, new_index, /):
+    """Flag points of a finer subgrid that lie in the flagged cells of a subgrid."""
+    candidates = []
+    for old, new in zip(index, new_index):
+        n_cells = len(old) - 1
+        upper = np.clip(np.searchsorted(old, new, side="right") - 1, 0, n_cells - 1)
+        lower = np.clip(np.searchsorted(old, new, side="left") - 1, 0, n_cells - 1)
+        candidates.append((lower, upper))
+
+    mask = np.zeros([len(i) for i in new_index], dtype=bool)
+    for cell_index in itertools.product(*candidates):
+        mask |= cells[np.ix_(*cell_index)]
+
+    return mask
+
+
+def _mirror_index(coord, /):
+    """Map indices of an axis that is symmetric about the origin to one half."""
+    index = np.arange(len(coord))
+    if _is_close_axis(coord, -coord[::-1]):
+        index = np.maximum(index, index[::-1])
+    return index
+
+
+def _is_close_axis(a, b, /):
+    """Check if two coordinate vectors are equal up to rounding errors."""
+    atol = 1e-12 * np.max(np.abs(a))
+    return len(a) == len(b) and np.allclose(a, b, rtol=0, atol=atol)
+
+
+def _get_symmetry(func, symmetry, /):
+    """Get and validate the symmetries of a function."""
+    if symmetry is None:
+        benchmark = fbench.get_benchmark(func)
+        return () if benchmark is None else benchmark.symmetry
+
+    unknown = set(symmetry) - {"mirror", "permutation"}
+    if unknown:
+        raise ValueError(f"unknown symmetry - got {sorted(unknown)}")
+
+    return tuple(symmetry)
+
+
+def _evaluate_points(func, x, /, *, n_workers=1, chunk_size=None):
+    """Evaluate function for each row of the matrix ``x``.
+
+    With more than one worker, chunks of rows are evaluated in a process pool.
+    """
+    if n_workers == 1:
+        return _evaluate_chunk(func, x)
+
+    n_workers = n_workers or os.cpu_count()
+    chunk_size = chunk_size or max(1, math.ceil(len(x) / (4 * n_workers)))
+    chunks = np.split(x, range(chunk_size, len(x), chunk_size))
+    with concurrent.futures.ProcessPoolExecutor(max_workers=n_workers) as executor:
+        return np.concatenate(
+            list(executor.map(_evaluate_chunk, itertools.repeat(func), chunks))
+        )
+
+
+def _evaluate_chunk(func, x, /):
+    """Evaluate function for each row of the matrix ``x``.
+
+    Batch-capable functions are evaluated in a single vectorized call,
+    any other callable is called once per row.
+    """
+    func_batch = fbench.get_batch_func(func)
+    if func_batch is not None:
+        return np.asarray(func_batch(x))
+    return np.apply_along_axis(func1d=func, axis=1, arr=x)
@@ -0,0 +1,403 @@
+import concurrent.futures
+import pickle
+
+import numpy as np
+import numpy.testing as npt
+import pytest
+
+import fbench
+
+
+@pytest.mark.parametrize(
+    "func, n",
+    [
+        (fbench.ackley, 5),
+        (fbench.beale, 2),
+        (fbench.peaks, 2),
+        (fbench.rastrigin, 5),
+        (fbench.rosenbrock, 5),
+        (fbench.schwefel, 5),
+        (fbench.sinc, 1),
+        (fbench.sphere, 5),
+    ],
+)
+@pytest.mark.parametrize("n_threads, chunk_size", [(1, None), (3, 7), (None, 64)])
+def test_evaluate_batch(func, n, n_threads, chunk_size):
+    x = np.random.default_rng(0).uniform(-5, 5, size=(1_000, n))
+    actual = fbench.evaluate_batch(func, x, n_threads=n_threads, chunk_size=chunk_size)
+    expected = fbench.get_batch_func(func)(x)
+    npt.assert_allclose(actual, expected, rtol=1e-12, atol=1e-12)
+
+
+def test_evaluate_batch_with_out():
+    x = np.random.default_rng(0).uniform(-5, 5, size=(100, 3)).astype(np.float32)
+    out = np.empty(100, dtype=np.float32)
+    actual = fbench.evaluate_batch(fbench.rastrigin, x, n_threads=2, out=out)
+    assert actual is out
+    npt.assert_allclose(actual, fbench.rastrigin_batch(x), rtol=1e-6)
+
+    with pytest.raises(TypeError, match=r"out must have shape=\(100,\)"):
+        fbench.evaluate_batch(fbench.rastrigin, x, out=np.empty(10))
+
+    with pytest.raises(TypeError, match=r"cannot store float32 values"):
+        fbench.evaluate_batch(fbench.rastrigin, x, out=np.empty(100, dtype=int))
+
+
+def test_evaluate_chunks():
+    rng = np.random.default_rng(1)
+    chunks = [rng.uniform(-5, 5, size=(m, 3)) for m in (4, 1, 7)]
+    actual = list(fbench.evaluate_chunks(fbench.rastrigin, iter(chunks)))
+    assert [values.shape for values in actual] == [(4,), (1,), (7,)]
+    for x, values in zip(chunks, actual):
+        npt.assert_allclose(values, fbench.rastrigin_batch(x))
+
+
+def test_evaluate_chunks_with_out(tmp_path):
+    x = np.random.default_rng(4).uniform(-5, 5, size=(12, 3))
+    chunks = [x[:4], x[4:5].tolist(), x[5:]]
+    expected = fbench.rastrigin_batch(x)
+
+    out = np.empty(12)
+    actual = list(fbench.evaluate_chunks(fbench.rastrigin, chunks, out=out))
+    assert all(np.shares_memory(values, out) for values in actual)
+    npt.assert_allclose(np.concatenate(actual), expected)
+    npt.assert_allclose(out, expected)
+
+    path = tmp_path / "y.npy"
+    for _ in fbench.evaluate_chunks(fbench.rastrigin, chunks, out=path, n_rows=12):
+        pass
+    npt.assert_allclose(np.load(path), expected)
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["y.npy"]
+
+    memmap = np.lib.format.open_memmap(tmp_path / "z.npy", mode="w+", shape=(12,))
+    list(fbench.evaluate_chunks(fbench.rastrigin, chunks, out=memmap))
+    npt.assert_allclose(np.load(tmp_path / "z.npy"), expected)
+
+    assert list(fbench.evaluate_chunks(fbench.rastrigin, [], out=out)) == []
+
+
+@pytest.mark.parametrize("out", ["y.npy", "z.npy"])
+def test_evaluate_chunks_resume(tmp_path, out):
+    x = np.random.default_rng(5).uniform(-5, 5, size=(20, 2))
+    chunks = [x[i : i + 3] for i in range(0, 20, 3)]  # noqa: E203
+    if out == "z.npy":
+        np.lib.format.open_memmap(tmp_path / out, mode="w+", shape=(20,))
+
+    def get_out():
+        if out == "z.npy":
+            return np.lib.format.open_memmap(tmp_path / out, mode="r+")
+        return tmp_path / out
+
+    interrupted = fbench.InstrumentedFunction(fbench.sphere, budget=8)
+    with pytest.raises(fbench.BudgetExhaustedError):
+        list(fbench.evaluate_chunks(interrupted, chunks, out=get_out(), n_rows=20))
+    assert (tmp_path / f"{out}.progress").read_text() == "6"
+
+    resumed = fbench.InstrumentedFunction(fbench.sphere)
+    actual = list(fbench.evaluate_chunks(resumed, chunks, out=get_out(), n_rows=20))
+    assert resumed.stats.n_points == 14
+    npt.assert_allclose(np.concatenate(actual), fbench.sphere_batch(x))
+    npt.assert_allclose(np.load(tmp_path / out), fbench.sphere_batch(x))
+    assert not (tmp_path / f"{out}.progress").exists()
+
+
+def test_evaluate_chunks_with_invalid_out(tmp_path):
+    chunks = [np.ones((3, 2)), np.ones((2, 2))]
+    with pytest.raises(ValueError, match=r"n_rows must be specified"):
+        list(fbench.evaluate_chunks(fbench.sphere, chunks, out=tmp_path / "y.npy"))
+
+    with pytest.raises(ValueError, match=r"chunks have more rows than out"):
+        list(fbench.evaluate_chunks(fbench.sphere, chunks, out=np.empty(4)))
+
+
+@pytest.mark.parametrize("chunk_size", [None, 1, 7, 100])
+def test_evaluate_npy(tmp_path, chunk_size):
+    x = np.random.default_rng(2).uniform(-5, 5, size=(50, 4))
+    np.save(tmp_path / "x.npy", x)
+    out = fbench.evaluate_npy(
+        fbench.rosenbrock, tmp_path / "x.npy", tmp_path / "y.npy", chunk_size=chunk_size
+    )
+    assert isinstance(out, np.memmap)
+    npt.assert_allclose(out, fbench.rosenbrock_batch(x))
+    npt.assert_allclose(np.load(tmp_path / "y.npy"), fbench.rosenbrock_batch(x))
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["x.npy", "y.npy"]
+
+
+def test_evaluate_npy_with_array(tmp_path):
+    x = np.arange(12, dtype=np.float32).reshape(4, 3)
+    out = fbench.evaluate_npy(fbench.sphere, x, str(tmp_path / "y.npy"))
+    assert out.dtype == np.float32
+    npt.assert_allclose(out, fbench.sphere_batch(x))
+
+
+def test_evaluate_npy_resume(tmp_path):
+    x = np.random.default_rng(3).uniform(-5, 5, size=(20, 2))
+    np.save(tmp_path / "x.npy", x)
+    interrupted = fbench.InstrumentedFunction(fbench.sphere, budget=8)
+    with pytest.raises(fbench.BudgetExhaustedError):
+        fbench.evaluate_npy(
+            interrupted, tmp_path / "x.npy", tmp_path / "y.npy", chunk_size=3
+        )
+    assert (tmp_path / "y.npy.progress").read_text() == "6"
+
+    resumed = fbench.InstrumentedFunction(fbench.sphere)
+    out = fbench.evaluate_npy(
+        resumed, tmp_path / "x.npy", tmp_path / "y.npy", chunk_size=3
+    )
+    assert resumed.stats.n_points == 14
+    npt.assert_allclose(out, fbench.sphere_batch(x))
+    assert not (tmp_path / "y.npy.progress").exists()
+
+
+def test_evaluate_npy_resume_with_wrong_shape(tmp_path):
+    np.save(tmp_path / "y.npy", np.zeros(3))
+    (tmp_path / "y.npy.progress").write_text("1")
+    with pytest.raises(ValueError, match=r"cannot resume .* with shape=\(3,\)"):
+        fbench.evaluate_npy(fbench.sphere, np.ones((4, 2)), tmp_path / "y.npy")
+
+
+def test_evaluate_batch_with_batchable():
+    @fbench.batchable
+    def func(x):
+        return np.abs(x).sum(axis=1)
+
+    x = np.arange(20).reshape(10, 2)
+    actual = fbench.evaluate_batch(func, x, n_threads=2, chunk_size=3)
+    npt.assert_array_equal(actual, np.abs(x).sum(axis=1))
+    assert actual.dtype == np.float64
+
+    with pytest.raises(TypeError, match=r"is not batch-capable"):
+        fbench.evaluate_batch(lambda x: x, x)
+
+
+class TestInstrumentedFunction:
+    def test_call(self):
+        func = fbench.InstrumentedFunction(fbench.rastrigin)
+        assert func.__name__ == "rastrigin"
+        assert func.func is fbench.rastrigin
+        assert func([1, 2]) == fbench.rastrigin([1, 2])
+        assert func([1, 2], validate=False) == fbench.rastrigin([1, 2])
+
+        x = np.ones((10, 3))
+        npt.assert_array_equal(func.batch(x), fbench.rastrigin_batch(x))
+        npt.assert_array_equal(fbench.get_batch_func(func)(x), func.batch(x))
+
+        stats = func.stats
+        assert isinstance(stats, fbench.structure.EvaluationStats)
+        assert stats.n_calls == 5
+        assert stats.n_points == 32
+        assert stats.total_time > 0
+        assert sum(stats.histogram) == 5
+        assert len(stats.histogram) == len(stats.bin_edges) - 1
+
+        func.reset()
+        assert func.stats.n_calls == 0
+        assert repr(func).startswith("InstrumentedFunction(func=<function rastrigin")
+
+    def test_pickle(self):
+        func = fbench.InstrumentedFunction(fbench.sphere, budget=3, bin_edges=[0, 1])
+        func([1, 2])
+        actual = pickle.loads(pickle.dumps(func))
+        assert actual.budget == 3
+        assert actual.stats.n_calls == 0
+        assert actual.stats.bin_edges == (0.0, 1.0)
+
+    def test_not_batch_capable(self):
+        func = fbench.InstrumentedFunction(lambda x: sum(x))
+        assert func.batch is None
+        assert fbench.get_batch_func(func) is None
+
+    def test_histogram(self):
+        func = fbench.InstrumentedFunction(fbench.sphere, bin_edges=[1, 2, 3])
+        func([1])
+        assert func.stats.histogram == (1, 0)
+
+        with pytest.raises(ValueError, match=r"at least two values"):
+            fbench.InstrumentedFunction(fbench.sphere, bin_edges=[1])
+
+    def test_budget(self):
+        func = fbench.InstrumentedFunction(fbench.sphere, budget=5)
+        assert func.budget == 5
+        func.batch(np.ones((3, 2)))
+        func([1, 2])
+        assert func.remaining == 1
+
+        with pytest.raises(fbench.BudgetExhaustedError, match=r"budget=5"):
+            func.batch(np.ones((2, 2)))
+
+        assert func.stats.n_points == 4
+        func([1, 2])
+        with pytest.raises(fbench.BudgetExhaustedError):
+            func([1, 2])
+
+        assert fbench.InstrumentedFunction(fbench.sphere).remaining is None
+
+    def test_budget_of_failed_calls(self):
+        func = fbench.InstrumentedFunction(fbench.sphere, budget=3)
+        with pytest.raises(TypeError):
+            func([[1, 2]])
+        with pytest.raises(TypeError):
+            func.batch([[[1, 2]]])
+
+        assert func.remaining == 3
+        assert func.stats.n_calls == 0
+        func.batch(np.ones((3, 2)))
+        assert func.remaining == 0
+
+    def test_threads(self):
+        func = fbench.InstrumentedFunction(fbench.sphere)
+        x = np.ones((1_000, 2))
+        fbench.evaluate_batch(func, x, n_threads=4, chunk_size=10)
+        assert func.stats.n_calls == 100
+        assert func.stats.n_points == 1_000
+
+    def test_merge_from_worker_processes(self):
+        func = fbench.InstrumentedFunction(fbench.sphere, budget=100)
+        func([1, 2])
+
+        with concurrent.futures.ProcessPoolExecutor(max_workers=2) as executor:
+            worker_stats = list(executor.map(_evaluate_in_worker, [func] * 3))
+
+        for stats in worker_stats:
+            assert stats.n_points == 10
+            func.merge(stats)
+
+        assert func.stats.n_calls == 1 + 3 * 10
+        assert func.stats.n_points == 1 + 3 * 10
+        assert func.remaining == 100 - 31
+
+        other = fbench.InstrumentedFunction(fbench.sphere, bin_edges=[0, 1])
+        with pytest.raises(ValueError, match=r"different bin edges"):
+            func.merge(other.stats)
+
+    def test_merge_from_threads(self):
+        func = fbench.InstrumentedFunction(fbench.sphere)
+        stats = fbench.InstrumentedFunction(fbench.sphere)
+        stats([1, 2])
+
+        def merge(_):
+            for _ in range(1_000):
+                func.merge(stats.stats)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(merge, range(4)))
+
+        assert func.stats.n_calls == 4_000
+        assert func.stats.n_points == 4_000
+
+    def test_batch_is_a_single_call(self):
+        calls = []
+
+        @fbench.batchable
+        def func(x):
+            calls.append(x)
+            return np.abs(x).sum(axis=1)
+
+        instrumented = fbench.InstrumentedFunction(func, budget=10_000)
+        x = np.ones((10_000, 10))
+        actual = instrumented.batch(x)
+
+        assert len(calls) == 1
+        assert calls[0] is x
+        npt.assert_array_equal(actual, np.full(10_000, 10))
+        assert instrumented.stats.n_calls == 1
+        assert instrumented.stats.n_points == 10_000
+        assert sum(instrumented.stats.histogram) == 1
+        assert instrumented.remaining == 0
+
+
+def _evaluate_in_worker(func):
+    for x in np.ones((10, 2)):
+        func(x)
+    return func.stats
+
+
+class TestCachedFunction:
+    def test_call(self):
+        calls = []
+
+        def func(x):
+            calls.append(x)
+            return fbench.sphere(x)
+
+        cached = fbench.CachedFunction(func, maxsize=2)
+        assert cached.func is func
+        assert cached([1, 2]) == 5
+        assert cached([1, 2]) == 5
+        assert cached([1.0, 2.0]) == 5
+        assert len(calls) == 2
+        assert cached.cache_info() == fbench.structure.CacheInfo(1, 2, 2, 2)
+
+        cached([1, 2])
+        cached([3, 4])
+        assert cached.cache_info().currsize == 2
+        cached([1.0, 2.0])
+        assert len(calls) == 4
+
+        cached.cache_clear()
+        assert cached.cache_info() == fbench.structure.CacheInfo(0, 0, 2, 0)
+        assert repr(cached).endswith("maxsize=2)")
+
+    def test_batch(self):
+        shapes = []
+
+        @fbench.batchable
+        def func(x):
+            shapes.append(x.shape)
+            return fbench.sphere_batch(x)
+
+        cached = fbench.CachedFunction(func)
+        x = np.array([[1.0, 2.0], [3.0, 4.0], [1.0, 2.0]])
+        npt.assert_array_equal(cached.batch(x), [5, 25, 5])
+        assert shapes == [(2, 2)]
+        assert cached.cache_info().hits == 1
+
+        assert cached(np.array([3.0, 4.0])) == 25
+        npt.assert_array_equal(cached.batch([[3.0, 4.0], [0.0, 1.0]]), [25, 1])
+        assert shapes == [(2, 2), (1, 2)]
+        npt.assert_array_equal(
+            fbench.viz.create_coordinates3d(cached, [0.0, 1.0]).z, [[0, 1], [1, 2]]
+        )
+        assert shapes[-1] == (3, 2)
+
+    @pytest.mark.parametrize("dtype", [np.float32, np.float64, np.int64])
+    def test_batch_dtype(self, dtype):
+        x = np.array([[1, 2], [3, 4]], dtype=dtype)
+        cached = fbench.CachedFunction(fbench.sphere)
+        expected = fbench.sphere_batch(x)
+        actual = cached.batch(x)
+        assert actual.dtype == expected.dtype
+        npt.assert_array_equal(actual, expected)
+
+        # cached values are returned as stored by the batch counterpart
+        actual = cached.batch(x)
+        assert actual.dtype == expected.dtype
+        npt.assert_array_equal(actual, expected)
+        assert cached(x[0]) == expected[0]
+        assert type(cached(x[0])) is type(expected[0])
+        assert cached.cache_info().hits == 4
+
+    def test_cache_clear_keeps_lock(self):
+        cached = fbench.CachedFunction(fbench.sphere)
+        cached([1, 2])
+        lock = cached._lock
+        cached.cache_clear()
+        assert cached._lock is lock
+        assert cached.cache_info() == fbench.structure.CacheInfo(0, 0, 1024, 0)
+
+    def test_batch_of_function_that_is_not_batch_capable(self):
+        cached = fbench.CachedFunction(lambda x: float(np.sum(x)))
+        npt.assert_array_equal(cached.batch([[1, 2], [3, 4], [1, 2]]), [3, 7, 3])
+        assert cached.cache_info().misses == 2
+        assert cached([1, 2]) == 3
+        assert cached.cache_info().hits == 2
+
+    def test_pickle(self):
+        cached = fbench.CachedFunction(fbench.sphere, maxsize=3)
+        cached([1, 2])
+        actual = pickle.loads(pickle.dumps(cached))
+        assert actual.cache_info() == fbench.structure.CacheInfo(0, 0, 3, 0)
+
+    def test_invalid_maxsize(self):
+        with pytest.raises(ValueError, match=r"maxsize=0 must be positive"):
+            fbench.CachedFunction(fbench.sphere, maxsize=0)
@@ -130,6 +130,94 @@ def test_sphere(x, expected):
     assert actual == expected
 
 
+def test_batchable():
+    @fbench.batchable
+    def func(x):
+        return (np.asarray(x) ** 2).sum(axis=1)
+
+    assert func.batch is func
+    assert fbench.get_batch_func(func) is func
+
+    def func_batch(x):
+        return (np.asarray(x) ** 2).sum(axis=1)
+
+    def func_scalar(x):
+        return (np.asarray(x) ** 2).sum()
+
+    func = fbench.batchable(func_scalar, batch=func_batch)
+    assert func is func_scalar
+    assert fbench.get_batch_func(func_scalar) is func_batch
+
+
+def test_get_batch_func():
+    assert fbench.get_batch_func(fbench.sphere) is fbench.sphere_batch
+    assert fbench.get_batch_func(lambda x: (x**2).sum()) is None
+
+    def func(x):
+        return (np.asarray(x) ** 2).sum()
+
+    func.batch = lambda x: (np.asarray(x) ** 2).sum(axis=1)
+    assert fbench.get_batch_func(func) is func.batch
+
+
+@pytest.mark.parametrize(
+    "func, name, n_min, n_max, separable",
+    [
+        (fbench.ackley, "ackley", 1, np.inf, False),
+        (fbench.beale, "beale", 2, 2, False),
+        (fbench.peaks, "peaks", 2, 2, False),
+        (fbench.rastrigin, "rastrigin", 1, np.inf, True),
+        (fbench.rosenbrock, "rosenbrock", 2, np.inf, False),
+        (fbench.schwefel, "schwefel", 1, np.inf, True),
+        (fbench.sinc, "sinc", 1, 1, True),
+        (fbench.sphere, "sphere", 1, np.inf, True),
+    ],
+)
+def test_get_benchmark(func, name, n_min, n_max, separable):
+    benchmark = fbench.get_benchmark(func)
+    assert isinstance(benchmark, fbench.structure.Benchmark)
+    assert fbench.get_benchmark(name) is benchmark
+    assert fbench.get_benchmarks()[name] is benchmark
+    assert benchmark.func is func
+    assert benchmark.batch is fbench.get_batch_func(func)
+    assert (benchmark.name, benchmark.n_min, benchmark.n_max) == (name, n_min, n_max)
+    assert benchmark.separable is separable
+    assert (benchmark.term is not None) is separable
+    lower, upper = benchmark.bounds
+    assert lower < upper
+
+
+@pytest.mark.parametrize("name", ["rastrigin", "schwefel", "sinc", "sphere"])
+def test_benchmark_term(name):
+    benchmark = fbench.get_benchmark(name)
+    n = min(benchmark.n_max, 3)
+    x = np.random.default_rng(4).uniform(*benchmark.bounds, size=(10, n))
+    npt.assert_allclose(
+        benchmark.term(x).sum(axis=1), benchmark.batch(x), rtol=1e-12, atol=1e-9
+    )
+    assert benchmark.term([1, 2]).dtype == np.float64
+
+
+def test_get_benchmark_of_unknown_function():
+    assert fbench.get_benchmark(lambda x: x) is None
+    assert fbench.get_benchmark("unknown") is None
+    assert fbench.get_benchmark([]) is None
+    assert fbench.get_optima(2, lambda x: x) is None
+
+
+def test_get_optima_is_cached():
+    get_optima = fbench.get_benchmark(fbench.rastrigin).get_optima
+    actual = fbench.get_optima(1_000_000, fbench.rastrigin)
+    hits = get_optima.cache_info().hits
+    expected = fbench.get_optima(1_000_000, fbench.rastrigin)
+    npt.assert_array_equal(actual[0].x, expected[0].x)
+    assert get_optima.cache_info().hits == hits + 1
+
+    # callers get writeable copies of the cached optima
+    actual[0].x[0] = 1
+    assert fbench.get_optima(1_000_000, fbench.rastrigin)[0].x[0] == 0
+
+
 @pytest.mark.parametrize(
     "func, n, idx, expected_x, expected_fx",
     [
@@ -143,8 +231,284 @@ def test_sphere(x, expected):
 )
 def test_get_optima(func, n, idx, expected_x, expected_fx):
     actual = fbench.get_optima(n, func)
+    curried = fbench.get_optima(n)(func)
+    npt.assert_array_equal(curried[idx].x, actual[idx].x)
     assert all(isinstance(opt, fbench.structure.Optimum) for opt in actual)
     opt = actual[idx]
     npt.assert_array_almost_equal(opt.x, expected_x)
     assert opt.fx == expected_fx
     assert opt.n == n
+
+
+@pytest.mark.parametrize(
+    "func, func_batch, n",
+    [
+        (fbench.ackley, fbench.ackley_batch, 1),
+        (fbench.ackley, fbench.ackley_batch, 5),
+        (fbench.beale, fbench.beale_batch, 2),
+        (fbench.peaks, fbench.peaks_batch, 2),
+        (fbench.rastrigin, fbench.rastrigin_batch, 1),
+        (fbench.rastrigin, fbench.rastrigin_batch, 5),
+        (fbench.rosenbrock, fbench.rosenbrock_batch, 2),
+        (fbench.rosenbrock, fbench.rosenbrock_batch, 5),
+        (fbench.schwefel, fbench.schwefel_batch, 1),
+        (fbench.schwefel, fbench.schwefel_batch, 5),
+        (fbench.sinc, fbench.sinc_batch, 1),
+        (fbench.sphere, fbench.sphere_batch, 1),
+        (fbench.sphere, fbench.sphere_batch, 5),
+    ],
+)
+def test_batch(func, func_batch, n):
+    rng = np.random.default_rng(0)
+    x = np.vstack([np.zeros(n), rng.uniform(-5, 5, size=(99, n))])
+    actual = func_batch(x)
+    expected = np.array([func(row) for row in x])
+    assert actual.shape == (len(x),)
+    npt.assert_allclose(actual, expected, rtol=1e-12, atol=1e-12)
+
+
+@pytest.mark.parametrize(
+    "func_batch, x",
+    [
+        (fbench.beale_batch, [[1, 2, 3]]),
+        (fbench.peaks_batch, [[1]]),
+        (fbench.rosenbrock_batch, [[1]]),
+        (fbench.sinc_batch, [[1, 2]]),
+        (fbench.sphere_batch, [1, 2]),
+    ],
+)
+def test_batch_with_invalid_input(func_batch, x):
+    with pytest.raises(TypeError):
+        func_batch(x)
+
+
+@pytest.mark.parametrize(
+    "func, func_grad, n",
+    [
+        (fbench.ackley, fbench.ackley_grad, 1),
+        (fbench.ackley, fbench.ackley_grad, 5),
+        (fbench.beale, fbench.beale_grad, 2),
+        (fbench.peaks, fbench.peaks_grad, 2),
+        (fbench.rastrigin, fbench.rastrigin_grad, 5),
+        (fbench.rosenbrock, fbench.rosenbrock_grad, 2),
+        (fbench.rosenbrock, fbench.rosenbrock_grad, 5),
+        (fbench.schwefel, fbench.schwefel_grad, 5),
+        (fbench.sinc, fbench.sinc_grad, 1),
+        (fbench.sphere, fbench.sphere_grad, 5),
+    ],
+)
+def test_grad(func, func_grad, n):
+    rng = np.random.default_rng(0)
+    x = rng.uniform(-3, 3, size=(20, n))
+    h = 1e-6
+    eye = np.eye(n)
+    expected = np.array(
+        [[(func(row + h * e) - func(row - h * e)) / (2 * h) for e in eye] for row in x]
+    )
+
+    actual = func_grad(x)
+    assert actual.shape == x.shape
+    npt.assert_allclose(actual, expected, rtol=1e-5, atol=1e-5)
+
+    for row, expected_row in zip(x, actual):
+        npt.assert_allclose(func_grad(row), expected_row, rtol=1e-12, atol=1e-12)
+
+
+@pytest.mark.parametrize(
+    "func_grad, x",
+    [
+        (fbench.ackley_grad, [0, 0]),
+        (fbench.rastrigin_grad, [0, 0]),
+        (fbench.schwefel_grad, [0, 0]),
+        (fbench.sinc_grad, [0]),
+        (fbench.sphere_grad, [0, 0]),
+    ],
+)
+def test_grad_at_zero(func_grad, x):
+    npt.assert_array_equal(func_grad(x), np.zeros(len(x)))
+
+
+@pytest.mark.parametrize(
+    "func, func_grad, func_value_and_grad, n",
+    [
+        (fbench.ackley, fbench.ackley_grad, fbench.ackley_value_and_grad, 5),
+        (fbench.beale, fbench.beale_grad, fbench.beale_value_and_grad, 2),
+        (fbench.peaks, fbench.peaks_grad, fbench.peaks_value_and_grad, 2),
+        (fbench.rastrigin, fbench.rastrigin_grad, fbench.rastrigin_value_and_grad, 5),
+        (
+            fbench.rosenbrock,
+            fbench.rosenbrock_grad,
+            fbench.rosenbrock_value_and_grad,
+            5,
+        ),
+        (fbench.schwefel, fbench.schwefel_grad, fbench.schwefel_value_and_grad, 5),
+        (fbench.sinc, fbench.sinc_grad, fbench.sinc_value_and_grad, 1),
+        (fbench.sphere, fbench.sphere_grad, fbench.sphere_value_and_grad, 5),
+    ],
+)
+def test_value_and_grad(func, func_grad, func_value_and_grad, n):
+    rng = np.random.default_rng(0)
+    x = np.vstack([np.zeros(n), rng.uniform(-5, 5, size=(19, n))])
+
+    value, grad = func_value_and_grad(x)
+    npt.assert_allclose(value, [func(row) for row in x], rtol=1e-12, atol=1e-12)
+    npt.assert_allclose(grad, func_grad(x), rtol=1e-12, atol=1e-12)
+
+    value, grad = func_value_and_grad(x[1])
+    assert isinstance(value, float)
+    npt.assert_allclose(value, func(x[1]), rtol=1e-12, atol=1e-12)
+    npt.assert_allclose(grad, func_grad(x[1]), rtol=1e-12, atol=1e-12)
+
+
+@pytest.mark.parametrize(
+    "func_grad, func_hess, n",
+    [
+        (fbench.ackley_grad, fbench.ackley_hess, 5),
+        (fbench.beale_grad, fbench.beale_hess, 2),
+        (fbench.peaks_grad, fbench.peaks_hess, 2),
+        (fbench.rastrigin_grad, fbench.rastrigin_hess, 5),
+        (fbench.rosenbrock_grad, fbench.rosenbrock_hess, 2),
+        (fbench.rosenbrock_grad, fbench.rosenbrock_hess, 5),
+        (fbench.schwefel_grad, fbench.schwefel_hess, 5),
+        (fbench.sinc_grad, fbench.sinc_hess, 1),
+        (fbench.sphere_grad, fbench.sphere_hess, 5),
+    ],
+)
+def test_hess(func_grad, func_hess, n):
+    rng = np.random.default_rng(0)
+    h = 1e-6
+    eye = np.eye(n)
+    for x in rng.uniform(-3, 3, size=(10, n)):
+        actual = func_hess(x)
+        expected = np.array(
+            [(func_grad(x + h * e) - func_grad(x - h * e)) / (2 * h) for e in eye]
+        )
+        assert actual.shape == (n, n)
+        npt.assert_allclose(actual, expected, rtol=1e-5, atol=1e-5)
+
+
+@pytest.mark.parametrize(
+    "func_hess, func_hessp",
+    [
+        (fbench.ackley_hess, fbench.ackley_hessp),
+        (fbench.rastrigin_hess, fbench.rastrigin_hessp),
+        (fbench.rosenbrock_hess, fbench.rosenbrock_hessp),
+        (fbench.schwefel_hess, fbench.schwefel_hessp),
+        (fbench.sphere_hess, fbench.sphere_hessp),
+    ],
+)
+def test_hessp(func_hess, func_hessp):
+    rng = np.random.default_rng(0)
+    x = np.vstack([np.zeros(5), rng.uniform(-3, 3, size=(9, 5))])
+    p = rng.normal(size=x.shape)
+
+    actual = func_hessp(x, p)
+    assert actual.shape == x.shape
+    for x_row, p_row, actual_row in zip(x, p, actual):
+        expected_row = func_hess(x_row) @ p_row
+        npt.assert_allclose(func_hessp(x_row, p_row), expected_row, atol=1e-10)
+        npt.assert_allclose(actual_row, expected_row, atol=1e-10)
+
+    with pytest.raises(TypeError, match=r"p must have shape=\(5,\) - it has shape="):
+        func_hessp(x[0], p[0, :3])
+
+
+def test_sinc_hess_at_zero():
+    npt.assert_allclose(fbench.sinc_hess([0]), [[-1 / 3]])
+
+
+@pytest.mark.parametrize(
+    "func_batch, n",
+    [
+        (fbench.ackley_batch, 5),
+        (fbench.beale_batch, 2),
+        (fbench.peaks_batch, 2),
+        (fbench.rastrigin_batch, 5),
+        (fbench.rosenbrock_batch, 5),
+        (fbench.schwefel_batch, 5),
+        (fbench.sinc_batch, 1),
+        (fbench.sphere_batch, 5),
+    ],
+)
+def test_batch_with_out_and_workspace(func_batch, n):
+    rng = np.random.default_rng(0)
+    x = np.vstack([np.zeros(n), rng.uniform(-3, 3, size=(99, n))])
+    expected = func_batch(x)
+
+    out = np.empty(len(x))
+    workspace = fbench.structure.Workspace()
+    actual = func_batch(x, out=out, workspace=workspace)
+    assert actual is out
+    npt.assert_allclose(actual, expected, rtol=1e-12, atol=1e-12)
+
+    nbytes = workspace.nbytes
+    actual = func_batch(x[:50], out=out[:50], workspace=workspace)
+    npt.assert_allclose(actual, expected[:50], rtol=1e-12, atol=1e-12)
+    assert workspace.nbytes == nbytes
+
+    actual = func_batch(x.astype(np.float32), workspace=workspace)
+    assert actual.dtype == np.float32
+    npt.assert_allclose(actual, expected, rtol=1e-4, atol=1e-4)
+
+    with pytest.raises(TypeError, match=r"out must have shape=\(100,\)"):
+        func_batch(x, out=np.empty(99))
+
+    with pytest.raises(TypeError, match=r"cannot store float64 values"):
+        func_batch(x, out=np.empty(len(x), dtype=int))
+
+
+@pytest.mark.parametrize(
+    "func, x",
+    [
+        (fbench.ackley, [1.5, -2.5]),
+        (fbench.beale, [1.5, -2.5]),
+        (fbench.peaks, [1.5, -2.5]),
+        (fbench.rastrigin, [1.5, -2.5]),
+        (fbench.rosenbrock, [1.5, -2.5]),
+        (fbench.schwefel, [1.5, -2.5]),
+        (fbench.sinc, [1.5]),
+        (fbench.sinc, [0]),
+        (fbench.sphere, [1.5, -2.5]),
+    ],
+)
+def test_without_validation(func, x):
+    expected = func(x)
+    for trusted_x in (x, np.array(x)):
+        actual = func(trusted_x, validate=False)
+        assert isinstance(actual, float)
+        assert actual == pytest.approx(expected, rel=1e-12, abs=1e-12)
+
+
+@pytest.mark.parametrize(
+    "func",
+    [
+        fbench.ackley,
+        fbench.rastrigin,
+        fbench.rosenbrock,
+        fbench.schwefel,
+        fbench.sphere,
+    ],
+)
+@pytest.mark.parametrize(
+    "x",
+    [
+        [0.5] * 16,
+        np.linspace(-2, 2, 17).tolist(),
+        [1.0, np.inf],
+        [np.nan, 1.0],
+    ],
+)
+def test_plain_float_path_matches_batch(func, x):
+    func_batch = fbench.get_batch_func(func)
+    with np.errstate(invalid="ignore"):
+        expected = func_batch(np.atleast_2d(x))[0]
+        for trusted_x in (x, np.asarray(x)):
+            actual = func(trusted_x, validate=False)
+            assert isinstance(actual, float)
+            npt.assert_allclose(actual, expected, rtol=1e-12, atol=1e-12)
+        npt.assert_allclose(func(x), expected, rtol=1e-12, atol=1e-12)
+
+
+def test_scalar_edge_cases():
+    assert np.isnan(fbench.sinc([np.inf]))
+    assert fbench.beale([1e200, 1e200]) == np.inf
@@ -0,0 +1,44 @@
+import subprocess
+import sys
+from importlib import metadata
+
+import pytest
+
+import fbench
+
+
+def _run_python(code):
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+
+def test_import_does_not_load_heavy_dependencies():
+    code = "import sys, fbench; print(*sys.modules, sep='\\n')"
+    result = _run_python(code)
+    modules = result.stdout.splitlines()
+    imported = [line.split("|")[-1].strip() for line in result.stderr.splitlines()]
+    assert "fbench.function" in modules
+    assert "fbench.function" in imported
+    for name in (
+        "matplotlib",
+        "mpl_toolkits",
+        "toolz",
+        "fbench.viz",
+        "importlib.metadata",
+    ):
+        assert name not in modules
+        assert name not in imported
+
+
+def test_lazy_attributes():
+    assert fbench.viz.FunctionPlotter is not None
+    assert fbench.__version__ == metadata.version("fbench")
+    assert {"viz", "structure", "sphere", "__version__"} <= set(dir(fbench))
+    assert "importlib" not in dir(fbench)
+
+    with pytest.raises(AttributeError, match=r"has no attribute 'unknown'"):
+        fbench.unknown
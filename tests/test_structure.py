@@ -0,0 +1,68 @@
+import pickle
+
+import numpy as np
+import numpy.testing as npt
+
+import fbench
+
+
+class TestCoordinateMatrices:
+    def test_from_axes(self):
+        x_coord = np.linspace(-1, 1, 300)
+        y_coord = np.linspace(-2, 2, 200)
+        z = np.zeros((200, 300))
+        coord = fbench.structure.CoordinateMatrices.from_axes(x_coord, y_coord, z)
+
+        x, y = np.meshgrid(x_coord, y_coord)
+        npt.assert_array_equal(coord.x, x)
+        npt.assert_array_equal(coord.y, y)
+        assert coord.z is z
+        assert np.shares_memory(coord.x, x_coord)
+        assert np.shares_memory(coord.y, y_coord)
+        assert not coord.x.flags.writeable
+
+    def test_pickle(self):
+        x_coord = np.linspace(-1, 1, 300)
+        y_coord = np.linspace(-2, 2, 200)
+        z = np.zeros((200, 300))
+        compact = fbench.structure.CoordinateMatrices.from_axes(x_coord, y_coord, z)
+        dense = fbench.structure.CoordinateMatrices(*np.meshgrid(x_coord, y_coord), z)
+
+        data = pickle.dumps(compact)
+        assert len(data) < len(pickle.dumps(dense)) / 2
+        actual = pickle.loads(data)
+        npt.assert_array_equal(actual, compact)
+        assert actual.x.strides[0] == 0
+        assert actual.y.strides[1] == 0
+
+        actual = pickle.loads(pickle.dumps(dense))
+        assert isinstance(actual, fbench.structure.CoordinateMatrices)
+        npt.assert_array_equal(actual, dense)
+
+
+class TestWorkspace:
+    def test_get(self):
+        workspace = fbench.structure.Workspace()
+        a = workspace.get("a", (2, 3), np.float64)
+        assert a.shape == (2, 3)
+        assert a.dtype == np.float64
+        assert workspace.nbytes == 48
+
+        b = workspace.get("a", (4,), np.float64)
+        assert np.shares_memory(a, b)
+        assert workspace.nbytes == 48
+
+        c = workspace.get("a", (2, 3), np.float32)
+        assert not np.shares_memory(a, c)
+        assert workspace.nbytes == 72
+
+        d = workspace.get("a", (3, 3), np.float64)
+        assert not np.shares_memory(a, d)
+        assert workspace.nbytes == 96
+
+    def test_clear(self):
+        workspace = fbench.structure.Workspace()
+        workspace.get("a", (2, 3), np.float64)
+        workspace.clear()
+        assert workspace.nbytes == 0
+        assert repr(workspace) == "Workspace(nbytes=0)"
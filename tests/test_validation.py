@@ -9,6 +9,7 @@ def test_check_vector():
     x = [1, 2, 3]
     actual = fbench.check_vector(x)
     npt.assert_array_equal(actual, np.array(x))
+    npt.assert_array_equal(fbench.check_vector(5), np.array([5]))
 
     with pytest.raises(
         TypeError,
@@ -18,3 +19,18 @@ def test_check_vector():
 
     with pytest.raises(TypeError, match=r"n=2 is not between n_min=3 and n_max=inf"):
         fbench.check_vector([1, 2], n_min=3)
+
+
+def test_check_matrix():
+    x = [[1, 2, 3], [4, 5, 6]]
+    actual = fbench.check_matrix(x)
+    npt.assert_array_equal(actual, np.array(x))
+
+    with pytest.raises(
+        TypeError,
+        match=r"input must be a matrix-like object - it has shape=\(2,\)",
+    ):
+        fbench.check_matrix([1, 2])
+
+    with pytest.raises(TypeError, match=r"n=2 is not between n_min=3 and n_max=inf"):
+        fbench.check_matrix([[1, 2]], n_min=3)
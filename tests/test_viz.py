@@ -1,3 +1,6 @@
+import os
+import pickle
+import types
 from typing import Callable
 
 import matplotlib
@@ -7,6 +10,7 @@ import numpy as np
 import numpy.testing as npt
 import pytest
 import toolz
+from matplotlib.contour import ContourSet
 
 import fbench
 
@@ -76,6 +80,53 @@ class TestFunctionPlotter:
         assert isinstance(ax, matplotlib.axes.Axes)
         assert ax3d is None
 
+    @pytest.mark.parametrize("with_surface", [True, False])
+    def test_heatmap_plot(self, func, with_surface):
+        plotter = fbench.viz.FunctionPlotter(
+            func=func,
+            bounds=[(-5, 5)] * 2,
+            with_surface=with_surface,
+            with_heatmap=True,
+            kws_imshow=dict(alpha=1.0),
+        )
+        fig, ax, ax3d = plotter.plot()
+        plt.close()
+        assert isinstance(ax, matplotlib.axes.Axes)
+        assert ax.images[0].get_alpha() == 1.0
+        assert (ax3d is not None) is with_surface
+
+    def test_heatmap_plot__surface_subgrid(self, func):
+        plotter = fbench.viz.FunctionPlotter(
+            func=func,
+            bounds=[(-5, 5)] * 2,
+            n_grid_points=801,
+            with_heatmap=True,
+        )
+        fig, ax, ax3d = plotter.plot()
+        plt.close()
+        (image,) = ax.images
+        assert image.get_array().shape == (801, 801)
+        surface = ax3d.collections[0]
+        assert isinstance(surface, mpl_toolkits.mplot3d.art3d.Poly3DCollection)
+        assert len(surface.get_array()) == 100**2
+
+    def test_contour_geometry_is_shared(self, func, monkeypatch):
+        calls = []
+        create_contour_geometry = fbench.viz.create_contour_geometry
+
+        def counted(coord, /, **kwargs):
+            calls.append(kwargs)
+            return create_contour_geometry(coord, **kwargs)
+
+        monkeypatch.setattr(fbench.viz, "create_contour_geometry", counted)
+        plotter = fbench.viz.FunctionPlotter(
+            func=func, bounds=[(-5, 5)] * 2, kws_contourf=dict(levels=20)
+        )
+        plotter.plot()
+        plotter.plot()
+        plt.close("all")
+        assert calls == [dict(levels=20)]
+
     def test_default_plot__ackley(self):
         plotter = fbench.viz.FunctionPlotter(func=fbench.ackley, bounds=[(-5, 5)] * 2)
         fig, ax, ax3d = plotter.plot()
@@ -91,6 +142,9 @@ class TestFunctionPlotter:
         "get_kws_contourf__base",
         "get_kws_contourf__YlOrBr",
         "get_kws_contourf__YlOrBr_r",
+        "get_kws_imshow__base",
+        "get_kws_imshow__YlOrBr",
+        "get_kws_imshow__YlOrBr_r",
         "get_kws_plot__base",
         "get_kws_scatter__base",
         "get_kws_surface__base",
@@ -113,6 +167,102 @@ def test_create_contour_plot():
     assert isinstance(actual, matplotlib.axes.Axes)
 
 
+@pytest.mark.parametrize("with_contour, n_collections", [(True, 1), (False, 0)])
+def test_create_heatmap_plot(with_contour, n_collections):
+    ax = toolz.pipe(
+        np.linspace(-1, 1, 1201),
+        fbench.viz.create_coordinates3d(fbench.sphere),
+        fbench.viz.create_heatmap_plot(
+            kws_imshow=dict(cmap="viridis"), with_contour=with_contour
+        ),
+    )
+    plt.close()
+    assert isinstance(ax, matplotlib.axes.Axes)
+    (image,) = ax.images
+    assert image.get_array().shape == (1201, 1201)
+    assert image.get_cmap().name == "viridis"
+    npt.assert_allclose(image.get_extent(), [-1 - 1 / 1200, 1 + 1 / 1200] * 2)
+    assert len(ax.collections) >= n_collections
+
+
+@pytest.mark.parametrize(
+    "func, levels",
+    [
+        (fbench.sphere, 0),
+        (fbench.sphere, 1),
+        (fbench.sphere, 4),
+        (fbench.rosenbrock, 100),
+        (toolz.compose_left(fbench.beale, np.log1p), 12),
+        (fbench.peaks, [-6, 0, 6]),
+    ],
+)
+def test_create_contour_geometry(func, levels):
+    coord = fbench.viz.create_coordinates3d(func, np.linspace(-3, 3, 51))
+    actual = fbench.viz.create_contour_geometry(coord, levels=levels)
+
+    contour_set = plt.gca().contourf(coord.x, coord.y, coord.z, levels=levels)
+    plt.close()
+    npt.assert_array_equal(actual.levels, contour_set.levels)
+    assert len(actual.allsegs) == len(actual.allkinds) == len(actual.levels) - 1
+    for segs, kinds in zip(actual.allsegs, actual.allkinds):
+        assert [len(seg) for seg in segs] == [len(kind) for kind in kinds]
+
+
+@pytest.mark.parametrize("levels", [0, 1, 2, 3, 7, 10, 25, 100])
+@pytest.mark.parametrize(
+    "z",
+    [
+        np.linspace(0, 1, 12).reshape(3, 4),
+        np.linspace(-3.7, 1e3, 12).reshape(3, 4),
+        np.linspace(12.3, 12.4, 12).reshape(3, 4),
+        np.log1p(np.arange(12.0)).reshape(3, 4) - 5,
+    ],
+)
+def test_get_contour_levels(z, levels):
+    # mirrors the level selection of the installed matplotlib
+    contour_set = plt.gca().contourf(z, levels=levels)
+    plt.close()
+    npt.assert_array_equal(
+        fbench.viz._get_contour_levels(z, levels), contour_set.levels
+    )
+
+
+@pytest.mark.filterwarnings("ignore:Log scale")
+@pytest.mark.parametrize("func", [fbench.sphere, fbench.peaks, fbench.ackley])
+@pytest.mark.parametrize(
+    "kws_contourf",
+    [
+        dict(),
+        dict(levels=7),
+        dict(extend="both"),
+        dict(extend="min"),
+        dict(extend="max", levels=12),
+        dict(locator=matplotlib.ticker.MaxNLocator(5)),
+        dict(norm=matplotlib.colors.LogNorm()),
+    ],
+)
+def test_contour_levels_match_contourf(func, kws_contourf):
+    coord = fbench.viz.create_coordinates3d(func, np.linspace(-3, 3, 41))
+    settings_contourf = fbench.viz.VizConfig.get_kws_contourf__YlOrBr_r()
+    settings_contourf.update(kws_contourf)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        expected = plt.gca().contourf(coord.x, coord.y, coord.z, **settings_contourf)
+    plt.close()
+
+    plotter = fbench.viz.FunctionPlotter(
+        func, [(-3, 3)] * 2, n_grid_points=41, kws_contourf=kws_contourf
+    )
+    with np.errstate(invalid="ignore", divide="ignore"):
+        fig, ax, ax3d = plotter.plot()
+    actual = next(
+        c for c in ax.get_children() if isinstance(c, ContourSet) and c.filled
+    )
+    floor = next(c for c in ax3d.get_children() if isinstance(c, ContourSet))
+    plt.close()
+    npt.assert_array_equal(actual.levels, expected.levels)
+    npt.assert_array_equal(floor.levels, expected.levels)
+
+
 def test_create_coordinates2d():
     actual = fbench.viz.create_coordinates2d(fbench.sphere, [-2, -1, 0, 1, 2])
     expected = fbench.structure.CoordinatePairs(
@@ -160,6 +310,40 @@ def test_create_surface_plot():
     assert isinstance(actual, mpl_toolkits.mplot3d.Axes3D)
 
 
+def test_create_surface_plot__zdir():
+    ax = toolz.pipe(
+        [-1, 0, 1],
+        fbench.viz.create_coordinates3d(fbench.sphere),
+        fbench.viz.create_surface_plot(kws_contourf=dict(zdir="x", offset=-1)),
+    )
+    plt.close()
+    assert isinstance(ax, mpl_toolkits.mplot3d.Axes3D)
+
+
+def test_create_surface_plot__collection_per_level(monkeypatch):
+    # matplotlib<3.8 draws filled contours with one collection per level
+    collections = []
+
+    def draw_contour_geometry(geometry, settings_contourf, /, *, ax):
+        for segs in geometry.allsegs:
+            collections.append(
+                ax.add_collection(matplotlib.collections.PolyCollection(segs))
+            )
+        return types.SimpleNamespace(collections=collections)
+
+    monkeypatch.setattr(fbench.viz, "_draw_contour_geometry", draw_contour_geometry)
+    ax = toolz.pipe(
+        np.linspace(-1, 1, 11),
+        fbench.viz.create_coordinates3d(fbench.sphere),
+        fbench.viz.create_surface_plot(kws_contourf=dict(levels=4)),
+    )
+    plt.close()
+    assert isinstance(ax, mpl_toolkits.mplot3d.Axes3D)
+    assert len(collections) > 1
+    for collection in collections:
+        assert isinstance(collection, mpl_toolkits.mplot3d.art3d.Poly3DCollection)
+
+
 def test_create_discrete_cmap():
     n = 5
     color_list = fbench.viz.create_discrete_cmap(n)
@@ -178,6 +362,16 @@ def test_get_1d_plotter():
         assert isinstance(plotter.func, Callable)
 
 
+@pytest.mark.parametrize(
+    "get_plotter", [fbench.viz.get_1d_plotter, fbench.viz.get_2d_plotter]
+)
+def test_get_plotter_is_picklable(get_plotter):
+    function_plotters = pickle.loads(pickle.dumps(get_plotter()))
+    for name, plotter in function_plotters.items():
+        x = np.full(plotter._size, 0.5)
+        assert plotter.func(x) == get_plotter()[name].func(x)
+
+
 def test_get_2d_plotter():
     function_plotters = fbench.viz.get_2d_plotter()
     for name, plotter in function_plotters.items():
@@ -199,3 +393,627 @@ def test_plot_optima():
 
     plt.close()
     assert isinstance(ax, matplotlib.axes.Axes)
+
+
+@pytest.mark.parametrize(
+    "func",
+    [
+        fbench.ackley,
+        fbench.beale,
+        fbench.peaks,
+        fbench.rastrigin,
+        fbench.rosenbrock,
+        fbench.schwefel,
+        fbench.sphere,
+    ],
+)
+def test_create_coordinates3d__batch_equals_per_point(func):
+    x_coord = np.linspace(-3, 3, 7)
+    y_coord = np.linspace(-2, 2, 5)
+    actual = fbench.viz.create_coordinates3d(func, x_coord, y_coord)
+    expected = fbench.viz.create_coordinates3d(lambda x: func(x), x_coord, y_coord)
+    assert actual.z.shape == (5, 7)
+    npt.assert_allclose(actual.z, expected.z, rtol=1e-12, atol=1e-12)
+
+
+@pytest.mark.parametrize(
+    "func",
+    [
+        fbench.ackley,
+        fbench.rastrigin,
+        fbench.schwefel,
+        fbench.sinc,
+        fbench.sphere,
+    ],
+)
+def test_create_coordinates2d__batch_equals_per_point(func):
+    x_coord = np.linspace(-10, 10, 101)
+    actual = fbench.viz.create_coordinates2d(func, x_coord)
+    expected = fbench.viz.create_coordinates2d(lambda x: func(x), x_coord)
+    assert actual.y.shape == (101,)
+    npt.assert_allclose(actual.y, expected.y, rtol=1e-12, atol=1e-12)
+
+
+def test_create_coordinates2d__batchable():
+    calls = []
+
+    @fbench.batchable
+    def func(x):
+        calls.append(x.shape)
+        return (x**2).sum(axis=1)
+
+    actual = fbench.viz.create_coordinates2d(func, [-2, -1, 0, 1, 2])
+    npt.assert_array_equal(actual.y, np.array([4, 1, 0, 1, 4]))
+    assert calls == [(5, 1)]
+
+
+def _sum_of_squares(x):
+    return float((x**2).sum())
+
+
+@pytest.mark.parametrize("n_workers, chunk_size", [(2, None), (2, 7), (None, 50)])
+def test_create_coordinates__process_pool(n_workers, chunk_size):
+    x_coord = np.linspace(-2, 2, 11)
+    y_coord = np.linspace(-1, 1, 9)
+
+    actual = fbench.viz.create_coordinates3d(
+        _sum_of_squares, x_coord, y_coord, n_workers=n_workers, chunk_size=chunk_size
+    )
+    expected = fbench.viz.create_coordinates3d(_sum_of_squares, x_coord, y_coord)
+    npt.assert_array_equal(actual.z, expected.z)
+
+    actual = fbench.viz.create_coordinates2d(
+        fbench.sphere, x_coord, n_workers=n_workers, chunk_size=chunk_size
+    )
+    expected = fbench.viz.create_coordinates2d(fbench.sphere, x_coord)
+    npt.assert_array_equal(actual.y, expected.y)
+
+
+def test_function_plotter__process_pool():
+    plotter = fbench.viz.FunctionPlotter(
+        func=_sum_of_squares,
+        bounds=[(-5, 5)] * 2,
+        n_grid_points=11,
+        n_workers=2,
+    )
+    fig, ax, ax3d = plotter.plot()
+    plt.close()
+    assert isinstance(ax3d, mpl_toolkits.mplot3d.Axes3D)
+
+
+@pytest.mark.parametrize("max_memory, n_blocks", [(None, 1), (1, 9), (24 * 11 * 4, 3)])
+def test_create_coordinates3d__max_memory(max_memory, n_blocks):
+    shapes = []
+
+    @fbench.batchable
+    def func(x):
+        shapes.append(x.shape)
+        return fbench.sphere_batch(x)
+
+    x_coord = np.linspace(-2, 2, 11)
+    y_coord = np.linspace(-1, 1, 9)
+    actual = fbench.viz.create_coordinates3d(
+        func, x_coord, y_coord, max_memory=max_memory
+    )
+    expected = fbench.viz.create_coordinates3d(fbench.sphere, x_coord, y_coord)
+    npt.assert_array_equal(actual.z, expected.z)
+    assert len(shapes) == n_blocks
+    assert sum(m for m, _ in shapes) == 99
+
+
+def test_create_coordinates3d__out(tmp_path):
+    x_coord = np.linspace(-2, 2, 11)
+    out = np.lib.format.open_memmap(tmp_path / "z.npy", mode="w+", shape=(11, 11))
+    actual = fbench.viz.create_coordinates3d(
+        fbench.rastrigin, x_coord, out=out, max_memory=1_000
+    )
+    assert actual.z is out
+    expected = fbench.viz.create_coordinates3d(fbench.rastrigin, x_coord)
+    npt.assert_array_equal(np.load(tmp_path / "z.npy"), expected.z)
+
+    with pytest.raises(TypeError, match=r"out must have shape=\(11, 11\)"):
+        fbench.viz.create_coordinates3d(fbench.sphere, x_coord, out=np.empty((11, 5)))
+
+
+def test_function_plotter__max_memory():
+    plotter = fbench.viz.FunctionPlotter(
+        func=fbench.schwefel,
+        bounds=[(-500, 500)] * 2,
+        n_grid_points=51,
+        max_memory=2**12,
+    )
+    fig, ax, ax3d = plotter.plot()
+    plt.close()
+    npt.assert_allclose(
+        plotter._coord.z,
+        fbench.viz.create_coordinates3d(fbench.schwefel, np.linspace(-500, 500, 51)).z,
+    )
+
+
+@pytest.mark.parametrize(
+    "symmetry, y_coord, n_points",
+    [
+        ((), None, 121),
+        (("mirror",), None, 36),
+        (("permutation",), None, 66),
+        (("mirror", "permutation"), None, 21),
+        (("mirror",), np.linspace(0, 1, 5), 30),
+        (("mirror", "permutation"), np.linspace(-1, 1, 5), 18),
+    ],
+)
+def test_create_coordinates3d__symmetry(symmetry, y_coord, n_points):
+    shapes = []
+
+    @fbench.batchable
+    def func(x):
+        shapes.append(x.shape)
+        return fbench.ackley_batch(x)
+
+    x_coord = np.linspace(-5, 5, 11)
+    actual = fbench.viz.create_coordinates3d(func, x_coord, y_coord, symmetry=symmetry)
+    expected = fbench.viz.create_coordinates3d(
+        lambda x: fbench.ackley(x), x_coord, y_coord
+    )
+    npt.assert_allclose(actual.z, expected.z, rtol=1e-12, atol=1e-12)
+    assert sum(m for m, _ in shapes) == n_points
+
+
+def test_create_coordinates3d__symmetry_of_benchmark(tmp_path):
+    x_coord = np.linspace(-32, 32, 101)
+    expected = fbench.viz.create_coordinates3d(fbench.ackley, x_coord, symmetry=())
+    out = np.lib.format.open_memmap(tmp_path / "z.npy", mode="w+", shape=(101, 101))
+    actual = fbench.viz.create_coordinates3d(fbench.ackley, x_coord, out=out)
+    assert actual.z is out
+    npt.assert_allclose(actual.z, expected.z, rtol=1e-12, atol=1e-12)
+
+    with pytest.raises(ValueError, match=r"unknown symmetry - got \['rotation'\]"):
+        fbench.viz.create_coordinates3d(fbench.ackley, x_coord, symmetry=["rotation"])
+
+
+def test_create_coordinates3d__separable_with_invalid_dimension():
+    # sinc is separable, but only defined for 1-vectors
+    with pytest.raises(TypeError):
+        fbench.viz.create_coordinates3d(fbench.sinc, [-1, 0, 1])
+
+
+@pytest.mark.parametrize("symmetry", [None, ["mirror"], ["permutation"]])
+def test_create_coordinates3d__symmetry_with_max_memory(
+    tmp_path, monkeypatch, symmetry
+):
+    sizes = []
+    evaluate_points = fbench.viz._evaluate_points
+
+    def counted_evaluate_points(func, x, /, **kwargs):
+        sizes.append(len(x))
+        return evaluate_points(func, x, **kwargs)
+
+    monkeypatch.setattr(fbench.viz, "_evaluate_points", counted_evaluate_points)
+    x_coord = np.linspace(-5, 5, 401)
+    max_memory = 24 * 401 * 4
+    out = np.lib.format.open_memmap(tmp_path / "z.npy", mode="w+", shape=(401, 401))
+    actual = fbench.viz.create_coordinates3d(
+        fbench.ackley, x_coord, out=out, max_memory=max_memory, symmetry=symmetry
+    )
+    assert actual.z is out
+    assert len(sizes) > 1
+    assert max(sizes) <= max_memory // 24
+
+    expected = fbench.viz.create_coordinates3d(fbench.ackley, x_coord, symmetry=())
+    npt.assert_allclose(actual.z, expected.z, rtol=1e-12, atol=1e-12)
+
+
+def test_function_plotter__symmetry():
+    plotter = fbench.viz.FunctionPlotter(
+        func=_sum_of_squares,
+        bounds=[(-5, 5)] * 2,
+        n_grid_points=11,
+        symmetry=["mirror", "permutation"],
+    )
+    fig, ax, ax3d = plotter.plot()
+    plt.close()
+    npt.assert_allclose(
+        plotter._coord.z,
+        fbench.viz.create_coordinates3d(fbench.sphere, np.linspace(-5, 5, 11)).z,
+    )
+
+
+@pytest.mark.parametrize(
+    "func, bounds, max_fraction",
+    [
+        (fbench.sphere_batch, (-2, 2), 0.1),
+        (fbench.rosenbrock_batch, (-2, 2), 0.1),
+        (fbench.peaks_batch, (-4, 4), 0.25),
+    ],
+)
+def test_create_coordinates3d__adaptive_tol(func, bounds, max_fraction):
+    shapes = []
+
+    @fbench.batchable
+    def counted_func(x):
+        shapes.append(x.shape)
+        return func(x)
+
+    x_coord = np.linspace(*bounds, 301)
+    y_coord = np.linspace(*bounds, 201)
+    expected = fbench.viz.create_coordinates3d(counted_func, x_coord, y_coord)
+    shapes.clear()
+    actual = fbench.viz.create_coordinates3d(
+        counted_func, x_coord, y_coord, adaptive_tol=1e-3
+    )
+    error = np.max(np.abs(actual.z - expected.z)) / np.ptp(expected.z)
+    assert error < 2e-3
+    assert sum(m for m, _ in shapes) < max_fraction * expected.z.size
+
+
+def test_create_coordinates3d__adaptive_tol_out():
+    x_coord = np.linspace(-4, 4, 41)
+    out = np.empty((41, 41))
+    actual = fbench.viz.create_coordinates3d(
+        fbench.peaks, x_coord, out=out, adaptive_tol=0
+    )
+    assert actual.z is out
+    expected = fbench.viz.create_coordinates3d(fbench.peaks, x_coord)
+    npt.assert_allclose(actual.z, expected.z)
+
+    actual = fbench.viz.create_coordinates3d(
+        fbench.peaks, x_coord, [-1, 1], adaptive_tol=0
+    )
+    expected = fbench.viz.create_coordinates3d(fbench.peaks, x_coord, [-1, 1])
+    npt.assert_allclose(actual.z, expected.z)
+
+
+def test_create_coordinates2d__adaptive_tol():
+    x_coord = np.linspace(-2, 2, 401)
+    actual = fbench.viz.create_coordinates2d(fbench.sphere, x_coord, adaptive_tol=1e-4)
+    assert 17 < len(actual.x) < 401
+    assert np.isin(actual.x, x_coord).all()
+    assert np.all(np.diff(actual.x) > 0)
+    npt.assert_allclose(actual.y, actual.x**2)
+    npt.assert_allclose(
+        np.interp(x_coord, actual.x, actual.y), x_coord**2, rtol=0, atol=4e-4
+    )
+
+
+def test_function_plotter__adaptive_tol(tmp_path):
+    cache = fbench.viz.GridCache(tmp_path)
+    plotter = fbench.viz.FunctionPlotter(
+        func=fbench.peaks,
+        bounds=[(-4, 4)] * 2,
+        n_grid_points=51,
+        cache=cache,
+        adaptive_tol=1e-3,
+    )
+    fig, ax, ax3d = plotter.plot()
+    plt.close()
+    assert plotter._coord.z.shape == (51, 51)
+    assert cache.nbytes == 0
+
+
+class TestTileCache:
+    def test_load_and_save(self):
+        cache = fbench.viz.TileCache(max_tiles=2)
+        assert repr(cache) == "TileCache(max_tiles=2)"
+        assert cache.load("a") is None
+
+        cache.save("a", np.zeros((2, 2)))
+        cache.save("b", np.ones((2, 2)))
+        npt.assert_array_equal(cache.load("a"), np.zeros((2, 2)))
+        cache.save("c", np.ones((2, 2)))
+        assert len(cache) == 2
+        assert cache.load("b") is None
+        assert cache.load("a") is not None
+
+        cache.clear()
+        assert len(cache) == 0
+
+
+class TestZoomRenderer:
+    @pytest.fixture
+    def fig_ax(self):
+        fig, ax = plt.subplots(figsize=(4, 4), dpi=100)
+        yield fig, ax
+        plt.close(fig)
+
+    def test_init(self, fig_ax):
+        fig, ax = fig_ax
+        renderer = fbench.viz.ZoomRenderer(
+            fbench.sphere, ax, bounds=[(-5, 5), (-2, 2)], tile_points=16
+        )
+        assert repr(renderer) == "ZoomRenderer(func=sphere, tile_points=16)"
+        assert renderer.func is fbench.sphere
+        assert ax.get_xlim() == (-5, 5)
+        assert ax.get_ylim() == (-2, 2)
+        assert not ax.get_autoscale_on()
+
+        z = renderer.image.get_array()
+        assert min(z.shape) >= ax.bbox.height
+        assert renderer.n_evaluated == z.size
+        assert len(renderer.cache) * 16**2 == z.size
+        npt.assert_array_equal(renderer.image.get_extent(), [-5, 5, -2, 2])
+
+        x_edges = np.linspace(-5, 5, z.shape[1] + 1)
+        y_edges = np.linspace(-2, 2, z.shape[0] + 1)
+        x, y = np.meshgrid(
+            (x_edges[1:] + x_edges[:-1]) / 2, (y_edges[1:] + y_edges[:-1]) / 2
+        )
+        npt.assert_allclose(z, x**2 + y**2)
+
+    def test_init_with_axis_limits(self, fig_ax):
+        fig, ax = fig_ax
+        ax.set_xlim(1, 3)
+        ax.set_ylim(-1, 0)
+        renderer = fbench.viz.ZoomRenderer(fbench.sphere, ax)
+        npt.assert_array_equal(renderer.image.get_extent(), [1, 3, -1, 0])
+
+    def test_zoom_and_pan(self, fig_ax):
+        shapes = []
+
+        @fbench.batchable
+        def func(x):
+            shapes.append(x.shape)
+            return fbench.schwefel_batch(x)
+
+        fig, ax = fig_ax
+        renderer = fbench.viz.ZoomRenderer(func, ax, bounds=[(-500, 500)] * 2)
+        fig.canvas.draw()
+        n_evaluated = renderer.n_evaluated
+        assert len(shapes) == 1
+
+        # zoom in: both limits change before the tiles are evaluated once
+        ax.set_xlim(0, 10)
+        ax.set_ylim(0, 10)
+        fig.canvas.draw()
+        assert len(shapes) == 2
+        assert renderer.n_evaluated > n_evaluated
+        x_min, x_max, y_min, y_max = renderer.image.get_extent()
+        assert x_min <= 0 and 10 <= x_max < 20
+        assert y_min <= 0 and 10 <= y_max < 20
+        assert renderer.image.get_array().shape[0] >= ax.bbox.height
+
+        # zoom out and pan back: all tiles are cached
+        n_evaluated = renderer.n_evaluated
+        ax.set_xlim(-500, 500)
+        ax.set_ylim(-500, 500)
+        fig.canvas.draw()
+        ax.set_xlim(0, 10)
+        ax.set_ylim(0, 10)
+        fig.canvas.draw()
+        assert renderer.n_evaluated == n_evaluated
+        assert not renderer.update()
+
+        # pan: only the newly visible tiles are evaluated
+        ax.set_xlim(5, 15)
+        fig.canvas.draw()
+        assert 0 < renderer.n_evaluated - n_evaluated < n_evaluated / 4
+
+    def test_kws_imshow(self, fig_ax):
+        fig, ax = fig_ax
+        renderer = fbench.viz.ZoomRenderer(
+            fbench.sphere, ax, bounds=[(-1, 1)] * 2, kws_imshow=dict(vmin=0, vmax=10)
+        )
+        ax.set_xlim(0, 1)
+        fig.canvas.draw()
+        assert renderer.image.get_clim() == (0, 10)
+
+    def test_disconnect(self, fig_ax):
+        fig, ax = fig_ax
+        renderer = fbench.viz.ZoomRenderer(fbench.sphere, ax, bounds=[(-1, 1)] * 2)
+        extent = renderer.image.get_extent()
+        renderer.disconnect()
+        ax.set_xlim(0, 0.1)
+        fig.canvas.draw()
+        assert renderer.image.get_extent() == extent
+
+
+@pytest.mark.parametrize("with_surface", [True, False])
+def test_function_plotter__interactive(with_surface):
+    plotter = fbench.viz.FunctionPlotter(
+        func=fbench.rastrigin,
+        bounds=[(-5.12, 5.12)] * 2,
+        with_surface=with_surface,
+        interactive=True,
+    )
+    assert plotter.zoom_renderer is None
+    fig, ax, ax3d = plotter.plot()
+    fig.canvas.draw()
+    assert isinstance(plotter.zoom_renderer, fbench.viz.ZoomRenderer)
+    assert plotter.zoom_renderer.image in ax.get_images()
+    assert (plotter._coord is not None) == with_surface
+
+    ax.set_xlim(0, 1)
+    ax.set_ylim(0, 1)
+    fig.canvas.draw()
+    x_min, x_max, y_min, y_max = plotter.zoom_renderer.image.get_extent()
+    assert x_min <= 0 and 1 <= x_max < 2
+    assert y_min <= 0 and 1 <= y_max < 2
+    plt.close()
+
+
+_CALLS = []
+
+
+def _counted_sphere(x):
+    _CALLS.append(x)
+    return fbench.sphere(x)
+
+
+class TestGridCache:
+    @pytest.mark.parametrize("bounds", [[(-5, 5)], [(-5, 5), (-2, 2)]])
+    def test_function_plotter(self, tmp_path, bounds):
+        cache = fbench.viz.GridCache(tmp_path / "cache")
+        _CALLS.clear()
+        plotter = fbench.viz.FunctionPlotter(
+            _counted_sphere, bounds, n_grid_points=11, cache=cache
+        )
+        plotter.plot()
+        plt.close()
+        assert len(_CALLS) == 11 ** len(bounds)
+        assert len(list(cache.directory.iterdir())) == 1
+
+        _CALLS.clear()
+        cached = fbench.viz.FunctionPlotter(
+            _counted_sphere, bounds, n_grid_points=11, cache=cache
+        )
+        cached.plot()
+        plt.close()
+        assert _CALLS == []
+        npt.assert_array_equal(cached._coord, plotter._coord)
+        assert type(cached._coord) is type(plotter._coord)
+
+        _CALLS.clear()
+        fbench.viz.FunctionPlotter(
+            _counted_sphere, bounds, n_grid_points=12, cache=cache
+        )._set_coord_attr()
+        assert len(_CALLS) == 12 ** len(bounds)
+        assert len(list(cache.directory.iterdir())) == 2
+
+    def test_function_without_stable_identity(self, tmp_path):
+        cache = fbench.viz.GridCache(tmp_path)
+        func = lambda x: fbench.sphere(x)  # noqa: E731
+        coord = fbench.viz.create_coordinates2d(func, [-1, 0, 1])
+        assert cache.save(func, coord) is False
+        assert cache.load(func, [-1, 0, 1]) is None
+        assert cache.nbytes == 0
+
+    @pytest.mark.parametrize(
+        "source",
+        [
+            "def objective(x):\n    return fbench.sphere(x) + 1",
+            "def objective(x):\n    return fbench.rastrigin(x)",
+            "def objective(x, c=1):\n    return fbench.sphere(x) + c",
+            "def objective(x):\n    return (lambda y: fbench.sphere(y) + 1)(x)",
+        ],
+    )
+    def test_edited_function(self, tmp_path, source):
+        cache = fbench.viz.GridCache(tmp_path)
+        sources = [
+            "def objective(x, c=0):\n    return fbench.sphere(x) + c",
+            "def objective(x):\n    return (lambda y: fbench.sphere(y))(x)",
+        ]
+        funcs = []
+        for code in [*sources, source]:
+            namespace = dict(__name__="__main__", fbench=fbench)
+            exec(code, namespace)
+            funcs.append(namespace["objective"])
+
+        *funcs, edited_func = funcs
+        for func in funcs:
+            assert cache.save(func, fbench.viz.create_coordinates2d(func, [-1, 0, 1]))
+            assert cache.load(func, [-1, 0, 1]) is not None
+
+        # same module and qualified name, but a different body
+        assert cache.load(edited_func, [-1, 0, 1]) is None
+
+    @pytest.mark.parametrize(
+        "func, expected",
+        [
+            (fbench.sphere, "fbench.sphere"),
+            (np.log1p, "numpy.log1p"),
+            (
+                _counted_sphere,
+                f"{__name__}._counted_sphere|"
+                + fbench.viz._get_func_id(_counted_sphere).split("|")[1],
+            ),
+            (
+                toolz.compose_left(fbench.beale, np.log1p),
+                "compose(fbench.beale, numpy.log1p)",
+            ),
+            (toolz.compose_left(fbench.beale, lambda x: x), None),
+            (lambda x: x, None),
+            (fbench.InstrumentedFunction(fbench.sphere), None),
+        ],
+    )
+    def test_get_func_id(self, func, expected):
+        assert fbench.viz._get_func_id(func) == expected
+
+    def test_eviction(self, tmp_path):
+        cache = fbench.viz.GridCache(tmp_path)
+        coords = [np.linspace(-i, i, 101) for i in range(1, 4)]
+        cache.save(
+            fbench.sphere, fbench.viz.create_coordinates3d(fbench.sphere, coords[0])
+        )
+        cache.save(
+            fbench.sphere, fbench.viz.create_coordinates3d(fbench.sphere, coords[1])
+        )
+        paths = sorted(tmp_path.iterdir(), key=lambda path: path.stat().st_mtime_ns)
+        for i, path in enumerate(paths):
+            os.utime(path, ns=(i, i))
+
+        # the least recently used grid is evicted
+        assert cache.load(fbench.sphere, coords[0], coords[0]) is not None
+        cache = fbench.viz.GridCache(tmp_path, max_bytes=cache.nbytes * 3 // 2)
+        cache.save(
+            fbench.sphere, fbench.viz.create_coordinates3d(fbench.sphere, coords[2])
+        )
+        assert cache.nbytes <= cache.max_bytes
+        assert cache.load(fbench.sphere, coords[0], coords[0]) is not None
+        assert cache.load(fbench.sphere, coords[1], coords[1]) is None
+        assert cache.load(fbench.sphere, coords[2], coords[2]) is not None
+
+        cache.clear()
+        assert cache.nbytes == 0
+        assert (
+            repr(cache)
+            == f"GridCache(directory={str(tmp_path)!r}, max_bytes={cache.max_bytes})"
+        )
+
+
+def test_render_plotters(tmp_path):
+    plotters = {
+        "sphere": fbench.viz.FunctionPlotter(
+            lambda x: fbench.sphere(x), [(-5, 5)] * 2, n_grid_points=11
+        ),
+        "sinc": fbench.viz.FunctionPlotter(fbench.sinc, [(-10, 10)]),
+    }
+    actual = fbench.viz.render_plotters(
+        plotters, tmp_path / "images", n_workers=2, kws_savefig=dict(dpi=20)
+    )
+    assert list(actual) == ["sphere", "sinc"]
+    for name, result in actual.items():
+        assert isinstance(result, fbench.structure.RenderResult)
+        assert result.path == tmp_path / "images" / f"{name}.png"
+        assert result.path.read_bytes().startswith(b"\x89PNG")
+        assert result.evaluation_time >= 0
+        assert result.plotting_time > 0
+
+
+def test_render_plotters__spawn(tmp_path):
+    # spawned workers unpickle the plotters instead of inheriting them
+    plotters = fbench.viz.get_1d_plotter()
+    plotters = {name: plotters[name] for name in ["Peaks_x2=0", "Sinc"]}
+    actual = fbench.viz.render_plotters(
+        plotters, tmp_path, n_workers=2, kws_savefig=dict(dpi=20), start_method="spawn"
+    )
+    assert list(actual) == ["Peaks_x2=0", "Sinc"]
+    for name, result in actual.items():
+        assert result.path.read_bytes().startswith(b"\x89PNG")
+
+
+def test_render_plotters__start_method(tmp_path, monkeypatch):
+    contexts = []
+    get_context = fbench.viz.multiprocessing.get_context
+
+    def recorded_get_context(method=None):
+        contexts.append(method)
+        return get_context(method)
+
+    monkeypatch.setattr(fbench.viz.multiprocessing, "get_context", recorded_get_context)
+    plotters = {"sinc": fbench.viz.FunctionPlotter(fbench.sinc, [(-10, 10)])}
+    for platform in ["linux", "darwin"]:
+        monkeypatch.setattr(fbench.viz.sys, "platform", platform)
+        fbench.viz.render_plotters(plotters, tmp_path, n_workers=1)
+
+    assert contexts == ["fork", None]
+
+
+def test_render_plotters__worker(tmp_path, monkeypatch):
+    backends = []
+    monkeypatch.setattr(plt, "switch_backend", backends.append)
+    monkeypatch.setattr(fbench.viz, "_RENDER_PLOTTERS", dict())
+    plotter = fbench.viz.FunctionPlotter(fbench.sphere, [(-5, 5)], n_grid_points=11)
+    fbench.viz._init_render_worker({"sphere": plotter})
+    assert backends == ["agg"]
+
+    actual = fbench.viz._render_plotter("sphere", tmp_path / "sphere.svg", dict())
+    assert actual.path.read_text().startswith("<?xml")
+    assert plotter._coord is not None